@@ -12,6 +12,16 @@ from .config import MetabaseConfig
 
 logger = logging.getLogger(__name__)
 
+# Connection pool settings for the shared HTTP client. A single client is
+# created per server lifespan, so keep-alive connections are reused across
+# tool calls instead of paying TCP/TLS setup on every request.
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=60.0,
+)
+HTTP_TIMEOUT = 30.0
+
 
 class MetabaseAuth:
     """Handles authentication with the Metabase API."""
@@ -20,7 +30,9 @@ class MetabaseAuth:
         """Initialize with Metabase configuration."""
         self.config = config
         self.session_token = config.session_token
-        self.client = httpx.AsyncClient(base_url=config.url, timeout=30.0)
+        self.client = httpx.AsyncClient(
+            base_url=config.url, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS
+        )
 
     async def ensure_authenticated(self) -> bool:
         """Ensure we have a valid session token, authenticating if needed."""
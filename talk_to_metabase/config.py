@@ -20,6 +20,7 @@ class MetabaseConfig(BaseModel):
     password: str = Field(..., description="Password for authentication")
     session_token: Optional[str] = Field(None, description="Session token after authentication")
     response_size_limit: int = Field(100000, description="Maximum size in characters for responses sent to Claude")
+    row_preview_limit: int = Field(1000, description="Maximum number of result rows returned by card query tools")
     context_auto_inject: bool = Field(True, description="Whether to automatically load context guidelines")
 
     @validator("url")
@@ -29,6 +30,13 @@ class MetabaseConfig(BaseModel):
             v = f"{v}/"
         return v
 
+    @validator("row_preview_limit")
+    def validate_row_preview_limit(cls, v: int) -> int:
+        """Ensure at least one result row is returned."""
+        if v < 1:
+            raise ValueError("row_preview_limit must be at least 1")
+        return v
+
     @classmethod
     def from_env(cls) -> "MetabaseConfig":
         """Create a configuration instance from environment variables."""
@@ -38,6 +46,12 @@ class MetabaseConfig(BaseModel):
         except ValueError:
             response_size_limit = 100000
         
+        # Get the row preview limit with a default value if not set
+        try:
+            row_preview_limit = int(os.environ.get("ROW_PREVIEW_LIMIT", "1000"))
+        except ValueError:
+            row_preview_limit = 1000
+        
         # Get context loading setting
         context_auto_inject = os.environ.get("METABASE_CONTEXT_AUTO_INJECT", "true").lower() == "true"
             
@@ -46,5 +60,6 @@ class MetabaseConfig(BaseModel):
             username=os.environ.get("METABASE_USERNAME", ""),
             password=os.environ.get("METABASE_PASSWORD", ""),
             response_size_limit=response_size_limit,
+            row_preview_limit=row_preview_limit,
             context_auto_inject=context_auto_inject,
         )
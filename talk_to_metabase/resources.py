@@ -3,17 +3,23 @@ Resource management utility for Talk to Metabase MCP server.
 
 This module provides functions to load JSON schemas and documentation files
 that work correctly in both development and PyInstaller bundled environments.
+
+The schema and documentation loaders cache successful loads and return the
+same object on every call, so callers must treat the result as read-only.
 """
 
+import functools
 import json
 import logging
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 def get_resource_path(relative_path: str) -> Path:
     """
@@ -121,9 +127,51 @@ def list_resource_directory(relative_path: str) -> list:
         return []
 
 
+class _ResourceUnavailable(Exception):
+    """Raised inside a cached loader so that failed loads are not cached."""
+
+
+def cached_resource(maxsize: int) -> Callable[[Callable[..., Optional[T]]], Callable[..., Optional[T]]]:
+    """
+    Cache the results of a resource loader that returns None on failure.
+    
+    Successful loads are cached per argument tuple and shared between callers,
+    who must not mutate them. Failed loads are not cached, so a later call
+    retries the load.
+    
+    Args:
+        maxsize: Maximum number of cached results
+        
+    Returns:
+        Decorator producing the cached loader, which exposes cache_clear()
+        and cache_info() like functools.lru_cache
+    """
+    def decorator(load: Callable[..., Optional[T]]) -> Callable[..., Optional[T]]:
+        @functools.lru_cache(maxsize=maxsize)
+        def load_or_raise(*args: Any) -> T:
+            resource = load(*args)
+            if resource is None:
+                raise _ResourceUnavailable
+            return resource
+        
+        @functools.wraps(load)
+        def cached_load(*args: Any) -> Optional[T]:
+            try:
+                return load_or_raise(*args)
+            except _ResourceUnavailable:
+                return None
+        
+        cached_load.cache_clear = load_or_raise.cache_clear
+        cached_load.cache_info = load_or_raise.cache_info
+        return cached_load
+    
+    return decorator
+
+
 # Schema-specific convenience functions
+@cached_resource(maxsize=32)
 def load_visualization_schema(chart_type: str) -> Optional[Dict[str, Any]]:
-    """Load JSON schema for a specific chart type."""
+    """Load JSON schema for a specific chart type (parsed once per chart type and cached; do not mutate)."""
     schema_path = f"schemas/{chart_type}_visualization.json"
     schema = load_json_resource(schema_path)
     if schema is None:
@@ -137,14 +185,16 @@ def load_visualization_schema(chart_type: str) -> Optional[Dict[str, Any]]:
     return schema
 
 
+@cached_resource(maxsize=32)
 def load_visualization_docs(chart_type: str) -> Optional[str]:
-    """Load documentation for a specific chart type."""
+    """Load documentation for a specific chart type (read once per chart type and cached)."""
     docs_path = f"schemas/{chart_type}_visualization_docs.md"
     return load_text_resource(docs_path)
 
 
+@cached_resource(maxsize=1)
 def load_parameters_schema() -> Optional[Dict[str, Any]]:
-    """Load the parameters JSON schema."""
+    """Load the parameters JSON schema (parsed once and cached; do not mutate)."""
     schema = load_json_resource("schemas/parameters.json")
     if schema is None:
         logger.error("Failed to load parameters.json schema file")
@@ -157,26 +207,31 @@ def load_parameters_schema() -> Optional[Dict[str, Any]]:
     return schema
 
 
+@cached_resource(maxsize=1)
 def load_dashcards_schema() -> Optional[Dict[str, Any]]:
-    """Load the dashcards JSON schema."""
+    """Load the dashcards JSON schema (parsed once and cached; do not mutate)."""
     return load_json_resource("schemas/dashcards.json")
 
 
+@cached_resource(maxsize=1)
 def load_card_parameters_schema() -> Optional[Dict[str, Any]]:
-    """Load the card parameters JSON schema."""
+    """Load the card parameters JSON schema (parsed once and cached; do not mutate)."""
     return load_json_resource("schemas/card_parameters.json")
 
 
+@cached_resource(maxsize=1)
 def load_card_parameters_docs() -> Optional[str]:
-    """Load the card parameters documentation."""
+    """Load the card parameters documentation (read once and cached)."""
     return load_text_resource("schemas/card_parameters_docs.md")
 
 
+@cached_resource(maxsize=1)
 def load_dashboard_parameters_schema() -> Optional[Dict[str, Any]]:
-    """Load the dashboard parameters JSON schema."""
+    """Load the dashboard parameters JSON schema (parsed once and cached; do not mutate)."""
     return load_json_resource("schemas/dashboard_parameters.json")
 
 
+@cached_resource(maxsize=1)
 def load_dashboard_parameters_docs() -> Optional[str]:
-    """Load the dashboard parameters documentation."""
+    """Load the dashboard parameters documentation (read once and cached)."""
     return load_text_resource("schemas/dashboard_parameters_docs.md")
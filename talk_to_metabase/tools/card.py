@@ -9,7 +9,8 @@ from typing import Dict, Optional, Any, List, Union
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..server import get_server_instance
-from .common import format_error_response, get_metabase_client, check_response_size
+from .common import format_error_response, get_metabase_client, check_response_size, json_dumps
+from .dashcards import invalidate_card_parameters_cache
 from .visualization import validate_visualization_settings_helper
 
 # Set up logging for this module
@@ -386,7 +387,7 @@ async def get_card_definition(id: int, ctx: Context, ignore_view: Optional[bool]
                 essential_info["sql_translation"] = sql_translation
         
         # Convert to JSON string
-        response = json.dumps(essential_info, indent=2)
+        response = json_dumps(essential_info)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -570,18 +571,18 @@ async def create_card(
         if MBQL_AVAILABLE:
             validation_result = validate_mbql_query_helper(query)
             if not validation_result["valid"]:
-                return json.dumps({
+                return json_dumps({
                     "success": False,
                     "error": "Invalid MBQL query",
                     "validation_errors": validation_result["errors"],
                     "help": "Call GET_MBQL_SCHEMA first to understand the correct MBQL format"
-                }, indent=2)
+                })
         else:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "MBQL functionality not available",
                 "message": "MBQL validation module could not be imported"
-            }, indent=2)
+            })
     
     # Validate card type
     valid_card_types = ["question", "model", "metric"]
@@ -597,13 +598,13 @@ async def create_card(
     if visualization_settings is not None:
         validation_result = validate_visualization_settings_helper(display, visualization_settings)
         if not validation_result["valid"]:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Invalid visualization settings",
                 "validation_errors": validation_result["errors"],
                 "chart_type": display,
                 "help": "Call GET_VISUALIZATION_DOCUMENT first to understand the correct format"
-            }, indent=2)
+            })
     
     # Parse and validate parameters if provided
     processed_parameters = None
@@ -617,27 +618,27 @@ async def create_card(
                 # Process card parameters with validation
                 processed_parameters, template_tags, errors = await process_card_parameters(client, parsed_parameters)
                 if errors:
-                    return json.dumps({
+                    return json_dumps({
                         "success": False,
                         "error": "Invalid card parameters",
                         "validation_errors": errors,
                         "parameters_count": len(parsed_parameters),
                         "help": "Call GET_CARD_PARAMETERS_DOCUMENTATION for format details"
-                    }, indent=2)
+                    })
             elif parsed_parameters:
                 # Parameters provided but card parameters module not available
-                return json.dumps({
+                return json_dumps({
                     "success": False,
                     "error": "Card parameters functionality not available",
                     "message": "Card parameters module could not be imported"
-                }, indent=2)
+                })
                 
         except ValueError as e:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Parameter parsing error",
                 "message": str(e)
-            }, indent=2)
+            })
     
     # Check for common SQL parameter mistakes and parameter consistency if parameters are provided
     sql_warnings = []
@@ -666,7 +667,7 @@ async def create_card(
                 response["sql_warnings"] = sql_warnings
                 response["help"] = "Check your SQL parameter usage. Parameters substitute with proper formatting automatically."
             
-            return json.dumps(response, indent=2)
+            return json_dumps(response)
     else:
         # For MBQL queries, create a placeholder execution result
         execution_result = {"success": True, "result_metadata": []}
@@ -742,7 +743,7 @@ async def create_card(
             response["sql_warnings"] = sql_warnings
             response["help"] = "Card created successfully, but check SQL parameter usage warnings above."
         
-        return json.dumps(response, indent=2)
+        return json_dumps(response)
         
     except Exception as e:
         logger.error(f"Error creating card: {e}")
@@ -931,18 +932,18 @@ async def update_card(
         if MBQL_AVAILABLE:
             validation_result = validate_mbql_query_helper(query)
             if not validation_result["valid"]:
-                return json.dumps({
+                return json_dumps({
                     "success": False,
                     "error": "Invalid MBQL query",
                     "validation_errors": validation_result["errors"],
                     "help": "Call GET_MBQL_SCHEMA first to understand the correct MBQL format"
-                }, indent=2)
+                })
         else:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "MBQL functionality not available",
                 "message": "MBQL validation module could not be imported"
-            }, indent=2)
+            })
     
     # Initialize current_data as None
     current_data = None
@@ -983,13 +984,13 @@ async def update_card(
         
         validation_result = validate_visualization_settings_helper(chart_type, visualization_settings)
         if not validation_result["valid"]:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Invalid visualization settings",
                 "validation_errors": validation_result["errors"],
                 "chart_type": chart_type,
                 "help": "Call GET_VISUALIZATION_DOCUMENT first to understand the correct format"
-            }, indent=2)
+            })
     
     # Parse and validate parameters if provided
     processed_parameters = None
@@ -1003,27 +1004,27 @@ async def update_card(
                 # Process card parameters with validation
                 processed_parameters, template_tags, errors = await process_card_parameters(client, parsed_parameters)
                 if errors:
-                    return json.dumps({
+                    return json_dumps({
                         "success": False,
                         "error": "Invalid card parameters",
                         "validation_errors": errors,
                         "parameters_count": len(parsed_parameters),
                         "help": "Call GET_CARD_PARAMETERS_DOCUMENTATION for format details"
-                    }, indent=2)
+                    })
             elif parsed_parameters:
                 # Parameters provided but card parameters module not available
-                return json.dumps({
+                return json_dumps({
                     "success": False,
                     "error": "Card parameters functionality not available",
                     "message": "Card parameters module could not be imported"
-                }, indent=2)
+                })
                 
         except ValueError as e:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Parameter parsing error",
                 "message": str(e)
-            }, indent=2)
+            })
     
     try:
         # Initialize sql_warnings at function scope
@@ -1127,7 +1128,7 @@ async def update_card(
                         response["sql_warnings"] = sql_warnings
                         response["help"] = "Check your SQL parameter usage. Parameters substitute with proper formatting automatically."
                     
-                    return json.dumps(response, indent=2)
+                    return json_dumps(response)
                 
                 # Add the validated SQL query to the update data
                 update_data["dataset_query"] = {
@@ -1154,10 +1155,10 @@ async def update_card(
         
         # If no fields were provided to update, return early
         if not update_data:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "No fields provided for update"
-            }, indent=2)
+            })
         
         # Perform the update
         data, status, error = await client.auth.make_request(
@@ -1175,6 +1176,9 @@ async def update_card(
                 }
             )
         
+        # Parameters may have changed, so dashboard mapping lookups must refetch the card
+        invalidate_card_parameters_cache(id)
+        
         # Return a concise success response with essential info
         final_parameters_count = 0
         if processed_parameters is not None:
@@ -1194,7 +1198,7 @@ async def update_card(
             response["sql_warnings"] = sql_warnings
             response["help"] = "Card updated successfully, but check SQL parameter usage warnings above."
         
-        return json.dumps(response, indent=2)
+        return json_dumps(response)
         
     except Exception as e:
         logger.error(f"Error updating card {id}: {e}")
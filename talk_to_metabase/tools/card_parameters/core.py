@@ -9,17 +9,26 @@ This module provides comprehensive card parameter support including:
 - Value source management
 """
 
-import json
+import asyncio
+import functools
+import itertools
 import logging
+import os
+import re
+import string
+import time
 import uuid
 from typing import Dict, List, Tuple, Any, Optional, Union
 
+import fastjsonschema
 import jsonschema
 from mcp.server.fastmcp import Context
 
 from ...server import get_server_instance
-from ...resources import load_card_parameters_schema, load_card_parameters_docs
-from ..common import format_error_response, get_metabase_client, check_response_size
+from ...resources import cached_resource, load_card_parameters_schema, load_card_parameters_docs
+from ..common import (
+    format_error_response, get_metabase_client, check_response_size, compile_schema_validator, json_dumps
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,12 +42,20 @@ SIMPLE_PARAMETER_TYPES = {
     "date/single": "date"    # Maps to date template tag
 }
 
-FIELD_FILTER_TYPES = {
+FIELD_FILTER_TYPES = frozenset({
     "string/=", "string/!=", "string/contains", "string/does-not-contain",
     "string/starts-with", "string/ends-with",
     "number/!=", "number/between", "number/>=", "number/<=", 
     "date/range", "date/relative", "date/all-options", "date/month-year", "date/quarter-year"
-}
+})
+
+# Parameter types that support the search widget (category and all string field filters)
+_SEARCH_COMPATIBLE_TYPES = frozenset(
+    {"category"} | {t for t in FIELD_FILTER_TYPES if t.startswith("string/")}
+)
+
+# Parameter types that do not support the dropdown widget (date field filters)
+_DROPDOWN_INCOMPATIBLE_TYPES = frozenset(t for t in FIELD_FILTER_TYPES if t.startswith("date/"))
 
 # UI widget mappings
 UI_WIDGET_MAPPINGS = {
@@ -47,71 +64,130 @@ UI_WIDGET_MAPPINGS = {
     "search": "search"
 }
 
+# Runs of characters replaced by a single underscore in parameter slugs
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+# Byte translation table mapping every byte except lowercase ASCII letters and
+# digits to an underscore, used to slugify (already lowercased) ASCII names
+_SLUG_ASCII_TABLE = bytes(
+    c if chr(c) in string.ascii_lowercase or chr(c) in string.digits else ord('_')
+    for c in range(256)
+)
+
+# How long (in seconds) fetched table field IDs are reused by
+# validate_field_references before the table metadata is requested again
+TABLE_FIELDS_CACHE_TTL = 60.0
+
+# Recently fetched field IDs, keyed by table ID and holding the monotonic time
+# at which they were fetched (only successful fetches are kept)
+_TABLE_FIELDS_CACHE: Dict[int, Tuple[float, frozenset]] = {}
+
+# {{parameter}} references, and [[...{{parameter}}...]] optional references, in SQL
+_SQL_PARAMETER_RE = re.compile(r'\{\{([^}]+)\}\}')
+_SQL_OPTIONAL_PARAMETER_RE = re.compile(r'\[\[[^\]]*\{\{([^}]+)\}\}[^\]]*\]\]')
+
 
 # Use the imported functions directly instead of creating wrapper functions
 # load_enhanced_parameters_schema = load_enhanced_card_parameters_schema
 # load_enhanced_parameters_docs = load_enhanced_card_parameters_docs
 
 
-def generate_parameter_id() -> str:
-    """Generate a unique UUID for parameter linking."""
-    return str(uuid.uuid4())
+@cached_resource(maxsize=1)
+def _get_validator() -> Optional[Any]:
+    """Build the jsonschema validator for the card parameters schema once it loads and reuse it."""
+    schema = load_card_parameters_schema()
+    if schema is None:
+        return None
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
 
 
-def generate_slug(name: str) -> str:
+# Maximum number of schema violations reported for a single validation call
+MAX_SCHEMA_ERRORS = 20
+
+# Compile the card parameters schema once into a generated validator function;
+# validate_card_parameters falls back to jsonschema if compilation is not possible
+try:
+    _card_parameters_schema = load_card_parameters_schema()
+    _COMPILED_VALIDATOR = (
+        compile_schema_validator(_card_parameters_schema)
+        if _card_parameters_schema is not None else None
+    )
+except Exception as e:
+    logger.error(f"Could not compile card parameters schema: {e}")
+    _COMPILED_VALIDATOR = None
+
+
+def _collect_schema_errors(parameters: List[Dict[str, Any]]) -> List[str]:
     """
-    Generate a URL-friendly slug from parameter name.
+    Collect the schema violations in the parameters in a single traversal.
+    
+    Traversal stops once MAX_SCHEMA_ERRORS violations have been found.
     
     Args:
-        name: Parameter name
+        parameters: List of card parameter configurations
         
     Returns:
-        URL-friendly slug
+        List of validation error messages (empty if the parameters are valid)
     """
-    import re
-    # Convert to lowercase, replace non-alphanumeric with underscores
-    slug = re.sub(r'[^a-zA-Z0-9]+', '_', name.lower().strip())
-    # Remove leading/trailing underscores
-    slug = slug.strip('_')
-    # Ensure it's not empty
-    if not slug:
-        slug = "parameter"
-    return slug
-
-
-def is_field_filter_parameter(param_type: str) -> bool:
-    """Check if parameter type is a field filter."""
-    return param_type in FIELD_FILTER_TYPES
+    errors = []
+    for error in itertools.islice(_get_validator().iter_errors(parameters), MAX_SCHEMA_ERRORS):
+        error_path = " -> ".join(map(str, error.absolute_path)) if error.absolute_path else "root"
+        errors.append(f"Validation error at {error_path}: {error.message}")
+    return errors
 
 
-def resolve_field_reference(field_config: Dict[str, Any]) -> List[Any]:
+def generate_parameter_ids(count: int) -> List[str]:
     """
-    Convert field configuration to Metabase field reference format.
+    Generate unique UUIDs for parameter linking in one batch.
+    
+    Random bytes for every UUID are read with a single os.urandom call;
+    each UUID is built exactly as uuid.uuid4() builds it.
     
     Args:
-        field_config: Field configuration with database_id, table_id, field_id
+        count: Number of UUIDs to generate
         
     Returns:
-        Metabase field reference array: ["field", field_id, None]
+        List of UUID strings
     """
-    return ["field", field_config["field_id"], None]
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=random_bytes[offset:offset + 16], version=4))
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
+def generate_parameter_id() -> str:
+    """Generate a unique UUID for parameter linking."""
+    return generate_parameter_ids(1)[0]
 
 
-def get_parameter_target(param_name: str, is_field_filter: bool) -> List[Any]:
+@functools.lru_cache(maxsize=1024)
+def generate_slug(name: str) -> str:
     """
-    Generate parameter target based on parameter type.
+    Generate a URL-friendly slug from parameter name.
+    
+    Results are memoized, since the same parameter names recur across card edits.
     
     Args:
-        param_name: Parameter name (used as template tag name)
-        is_field_filter: Whether this is a field filter parameter
+        name: Parameter name
         
     Returns:
-        Parameter target array
+        URL-friendly slug
     """
-    if is_field_filter:
-        return ["dimension", ["template-tag", param_name]]
+    slug = name.lower().strip()
+    if slug.isascii():
+        # Replace non-alphanumeric characters with underscores using a byte
+        # translation table, then collapse runs of underscores
+        slug = slug.encode('ascii').translate(_SLUG_ASCII_TABLE).decode('ascii')
+        while '__' in slug:
+            slug = slug.replace('__', '_')
     else:
-        return ["variable", ["template-tag", param_name]]
+        # Non-ASCII letters are not alphanumeric for slug purposes either
+        slug = _SLUG_SEPARATOR_RE.sub('_', slug)
+    # Remove leading/trailing underscores and ensure it's not empty
+    return slug.strip('_') or "parameter"
 
 
 def convert_ui_widget_to_values_query_type(ui_widget: Optional[str]) -> str:
@@ -129,19 +205,23 @@ def convert_ui_widget_to_values_query_type(ui_widget: Optional[str]) -> str:
     return UI_WIDGET_MAPPINGS.get(ui_widget, "none")
 
 
-def build_values_source_config(values_source: Optional[Dict[str, Any]], field_config: Optional[Dict[str, Any]] = None) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+def apply_values_source_config(
+    processed_param: Dict[str, Any],
+    values_source: Optional[Dict[str, Any]],
+    field_config: Optional[Dict[str, Any]] = None
+) -> None:
     """
-    Build Metabase values_source_type and values_source_config from card parameter configuration.
+    Set Metabase values_source_type and values_source_config on a processed parameter.
+    
+    Keys are only set when the card parameter configuration calls for them.
     
     Args:
+        processed_param: Processed parameter to update in place
         values_source: Card parameter values source configuration
         field_config: Field configuration for connected field filters
-        
-    Returns:
-        Tuple of (values_source_type, values_source_config)
     """
     if not values_source:
-        return None, None
+        return
     
     source_type = values_source["type"]
     
@@ -158,10 +238,9 @@ def build_values_source_config(values_source: Optional[Dict[str, Any]], field_co
                 formatted_values = values
         else:
             formatted_values = values
-            
-        return "static-list", {
-            "values": formatted_values
-        }
+        
+        processed_param["values_source_type"] = "static-list"
+        processed_param["values_source_config"] = {"values": formatted_values}
     elif source_type == "card":
         config = {
             "card_id": values_source["card_id"],
@@ -169,13 +248,42 @@ def build_values_source_config(values_source: Optional[Dict[str, Any]], field_co
         }
         if "label_field" in values_source:
             config["label_field"] = ["field", values_source["label_field"], {"base-type": "type/Text"}]
-        return "card", config
+        processed_param["values_source_type"] = "card"
+        processed_param["values_source_config"] = config
     elif source_type == "connected" and field_config:
-        # For connected field filters, use null values_source_type and empty config
+        # For connected field filters, leave values_source_type unset and use an empty config
         # This tells Metabase to use the field's values directly
-        return None, {}
+        processed_param["values_source_config"] = {}
+
+
+def format_default_value(param_config: Dict[str, Any], param_type: str, default_value: Any) -> Any:
+    """
+    Format a parameter default value for Metabase.
+    
+    Number parameters with a static dropdown expect defaults as arrays of
+    strings, so a single number is wrapped; other defaults are unchanged.
+    
+    Args:
+        param_config: Full parameter configuration
+        param_type: Parameter type
+        default_value: Default value from the configuration
+        
+    Returns:
+        Default value in Metabase format
+    """
+    # Check the parameter type first; it rules out most parameters
+    if param_type != "number/=" or isinstance(default_value, list):
+        return default_value
     
-    return None, None
+    # Check if this is a number parameter with a static dropdown
+    if param_config.get("ui_widget") != "dropdown":
+        return default_value
+    values_source = param_config.get("values_source")
+    if not values_source or values_source.get("type") != "static":
+        return default_value
+    
+    # Convert single number to array format for dropdowns
+    return [str(default_value)]
 
 
 def create_template_tag(param_name: str, param_type: str, param_config: Dict[str, Any], param_id: str) -> Dict[str, Any]:
@@ -192,8 +300,8 @@ def create_template_tag(param_name: str, param_type: str, param_config: Dict[str
         Template tag dictionary
     """
     # Determine template tag type
-    if param_type in SIMPLE_PARAMETER_TYPES:
-        tag_type = SIMPLE_PARAMETER_TYPES[param_type]
+    tag_type = SIMPLE_PARAMETER_TYPES.get(param_type)
+    if tag_type is not None:
         template_tag = {
             "type": tag_type,
             "name": param_name,
@@ -207,26 +315,14 @@ def create_template_tag(param_name: str, param_type: str, param_config: Dict[str
             "name": param_name,
             "id": param_id,
             "display-name": param_config.get("display_name", param_name),
-            "dimension": resolve_field_reference(param_config["field"]),
+            "dimension": ["field", param_config["field"]["field_id"], None],
             "widget-type": param_type
         }
     
     # Add default value if provided with special handling for number dropdowns
-    if "default" in param_config and param_config["default"] is not None:
-        default_value = param_config["default"]
-        
-        # Check if this is a number parameter with dropdown
-        is_number_dropdown = (
-            param_type == "number/=" and 
-            param_config.get("ui_widget") == "dropdown" and
-            param_config.get("values_source", {}).get("type") == "static"
-        )
-        
-        if is_number_dropdown and not isinstance(default_value, list):
-            # Convert single number to array format for dropdowns
-            template_tag["default"] = [str(default_value)]
-        else:
-            template_tag["default"] = default_value
+    default_value = param_config.get("default")
+    if default_value is not None:
+        template_tag["default"] = format_default_value(param_config, param_type, default_value)
     
     # Add required flag if provided
     if "required" in param_config:
@@ -248,33 +344,19 @@ def process_single_parameter(param_config: Dict[str, Any], param_id: str) -> Tup
     """
     param_name = param_config["name"]
     param_type = param_config["type"]
-    is_field_filter = is_field_filter_parameter(param_type)
     
     # Build the processed parameter
     processed_param = {
         "id": param_id,
         "type": param_type,
-        "target": get_parameter_target(param_name, is_field_filter),
+        "target": ["dimension" if param_type in FIELD_FILTER_TYPES else "variable", ["template-tag", param_name]],
         "name": param_config.get("display_name", param_name),
         "slug": generate_slug(param_name)
     }
     
     # Handle default value with special formatting for number dropdowns
     if "default" in param_config:
-        default_value = param_config["default"]
-        
-        # Check if this is a number parameter with dropdown
-        is_number_dropdown = (
-            param_type == "number/=" and 
-            param_config.get("ui_widget") == "dropdown" and
-            param_config.get("values_source", {}).get("type") == "static"
-        )
-        
-        if is_number_dropdown and not isinstance(default_value, list):
-            # Convert single number to array format for dropdowns
-            processed_param["default"] = [str(default_value)]
-        else:
-            processed_param["default"] = default_value
+        processed_param["default"] = format_default_value(param_config, param_type, param_config["default"])
     
     # Add required flag if provided
     if "required" in param_config:
@@ -290,12 +372,8 @@ def process_single_parameter(param_config: Dict[str, Any], param_id: str) -> Tup
     processed_param["values_query_type"] = values_query_type
     
     # Build values source config if needed
-    if values_query_type in ["list", "search"]:
-        values_source_type, values_source_config = build_values_source_config(values_source, field_config)
-        if values_source_type is not None:
-            processed_param["values_source_type"] = values_source_type
-        if values_source_config is not None:
-            processed_param["values_source_config"] = values_source_config
+    if values_query_type in ("list", "search"):
+        apply_values_source_config(processed_param, values_source, field_config)
     
     # Create corresponding template tag
     template_tag = create_template_tag(param_name, param_type, param_config, param_id)
@@ -303,6 +381,42 @@ def process_single_parameter(param_config: Dict[str, Any], param_id: str) -> Tup
     return processed_param, template_tag
 
 
+async def get_table_field_ids(client, table_id: int) -> Optional[frozenset]:
+    """
+    Get the IDs of a table's fields, reusing a recent fetch if available.
+    
+    Args:
+        client: Metabase client
+        table_id: Table ID
+        
+    Returns:
+        Set of field IDs, or None if the table cannot be accessed
+    """
+    now = time.monotonic()
+    cached = _TABLE_FIELDS_CACHE.get(table_id)
+    if cached is not None and now - cached[0] < TABLE_FIELDS_CACHE_TTL:
+        return cached[1]
+    
+    data, status, error = await client.auth.make_request(
+        "GET", f"table/{table_id}/query_metadata"
+    )
+    
+    if error:
+        return None
+    
+    field_ids = frozenset(field.get("id") for field in data.get("fields", []))
+    
+    # Drop expired entries so the cache does not grow without bound
+    for expired_id in [
+        key for key, (fetched_at, _) in _TABLE_FIELDS_CACHE.items()
+        if now - fetched_at >= TABLE_FIELDS_CACHE_TTL
+    ]:
+        del _TABLE_FIELDS_CACHE[expired_id]
+    
+    _TABLE_FIELDS_CACHE[table_id] = (time.monotonic(), field_ids)
+    return field_ids
+
+
 async def validate_field_references(client, parameters: List[Dict[str, Any]]) -> List[str]:
     """
     Validate that field references in parameters exist in the database.
@@ -316,63 +430,63 @@ async def validate_field_references(client, parameters: List[Dict[str, Any]]) ->
     """
     errors = []
     
+    field_params = []
     for i, param in enumerate(parameters):
-        if "field" not in param:
+        field_config = param.get("field")
+        if field_config is None:
             continue
-            
-        field_config = param["field"]
-        database_id = field_config["database_id"]
+        missing = [key for key in ("table_id", "field_id") if field_config.get(key) is None]
+        if missing:
+            errors.append(
+                f"Parameter {i} ({param.get('name')}): Field reference is missing {', '.join(missing)}"
+            )
+            continue
+        field_params.append((i, param, field_config))
+    
+    # Fetch the fields of every distinct referenced table concurrently
+    table_ids = list(dict.fromkeys(field_config["table_id"] for _, _, field_config in field_params))
+    results = await asyncio.gather(
+        *(get_table_field_ids(client, table_id) for table_id in table_ids),
+        return_exceptions=True
+    )
+    table_field_ids = dict(zip(table_ids, results))
+    
+    for i, param, field_config in field_params:
+        database_id = field_config.get("database_id")
         table_id = field_config["table_id"] 
         field_id = field_config["field_id"]
         
-        try:
-            # Check if the field exists by trying to get table metadata
-            data, status, error = await client.auth.make_request(
-                "GET", f"table/{table_id}/query_metadata"
-            )
-            
-            if error:
-                errors.append(f"Parameter {i} ({param['name']}): Cannot access table {table_id} in database {database_id}")
-                continue
-            
+        field_ids = table_field_ids[table_id]
+        if isinstance(field_ids, Exception):
+            errors.append(f"Parameter {i} ({param['name']}): Error validating field reference - {str(field_ids)}")
+        elif field_ids is None:
+            errors.append(f"Parameter {i} ({param['name']}): Cannot access table {table_id} in database {database_id}")
+        elif field_id not in field_ids:
             # Check if the field exists in the table
-            fields = data.get("fields", [])
-            field_exists = any(field.get("id") == field_id for field in fields)
-            
-            if not field_exists:
-                errors.append(f"Parameter {i} ({param['name']}): Field {field_id} not found in table {table_id}")
-                
-        except Exception as e:
-            errors.append(f"Parameter {i} ({param['name']}): Error validating field reference - {str(e)}")
+            errors.append(f"Parameter {i} ({param['name']}): Field {field_id} not found in table {table_id}")
     
     return errors
 
 
-def validate_parameter_widget_compatibility(parameters: List[Dict[str, Any]]) -> List[str]:
+def widget_compatibility_error(param_type: str, ui_widget: Optional[str]) -> Optional[str]:
     """
-    Validate that UI widgets are compatible with parameter types.
+    Check that a UI widget is compatible with a parameter type.
     
     Args:
-        parameters: List of parameter configurations
+        param_type: Parameter type
+        ui_widget: UI widget type, if any
         
     Returns:
-        List of validation error messages
+        Error message, or None if the widget is compatible
     """
-    errors = []
+    # Search widget is compatible with category and all string field filters
+    if ui_widget == "search" and param_type not in _SEARCH_COMPATIBLE_TYPES:
+        return f"Search widget only compatible with category and string field filter types, not '{param_type}'"
     
-    for i, param in enumerate(parameters):
-        param_type = param["type"]
-        ui_widget = param.get("ui_widget")
-        
-        # Check widget compatibility
-        # Search widget is compatible with category and all string field filters
-        if ui_widget == "search" and param_type not in ["category"] and not param_type.startswith("string/"):
-            errors.append(f"Parameter {i} ({param['name']}): Search widget only compatible with category and string field filter types, not '{param_type}'")
-        
-        if ui_widget == "dropdown" and param_type.startswith("date/") and param_type != "date/single":
-            errors.append(f"Parameter {i} ({param['name']}): Dropdown widget not compatible with date field filter type '{param_type}'")
+    if ui_widget == "dropdown" and param_type in _DROPDOWN_INCOMPATIBLE_TYPES:
+        return f"Dropdown widget not compatible with date field filter type '{param_type}'"
     
-    return errors
+    return None
 
 
 def validate_card_parameters(parameters: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
@@ -390,36 +504,48 @@ def validate_card_parameters(parameters: List[Dict[str, Any]]) -> Tuple[bool, Li
         return False, ["Could not load card parameters schema"]
     
     try:
-        # JSON Schema validation handles most validation automatically
-        jsonschema.validate(parameters, schema)
+        # JSON Schema validation handles most validation automatically; the
+        # compiled validator is the fast path, and every schema violation is
+        # collected only once it rejects the input
+        if _COMPILED_VALIDATOR is not None:
+            _COMPILED_VALIDATOR(parameters)
+        else:
+            schema_errors = _collect_schema_errors(parameters)
+            if schema_errors:
+                return False, schema_errors
         
         # Additional business logic validation
         errors = []
         
-        # Check for duplicate names
+        # Check names, widgets and defaults of each parameter in a single pass
         seen_names = set()
         for i, param in enumerate(parameters):
-            name = param.get("name")
+            get = param.get
+            name = get("name")
+            
+            # Check for duplicate names
             if name and name in seen_names:
                 errors.append(f"Parameter {i}: duplicate name '{name}'")
             elif name:
                 seen_names.add(name)
-        
-        # Check widget compatibility
-        widget_errors = validate_parameter_widget_compatibility(parameters)
-        errors.extend(widget_errors)
-        
-        # Check required parameters have default values
-        for i, param in enumerate(parameters):
-            if param.get("required", False) and ("default" not in param or param["default"] is None):
-                errors.append(f"Parameter {i} ({param.get('name', 'unnamed')}): required parameters must have a default value")
+            
+            # Check widget compatibility
+            widget_error = widget_compatibility_error(param["type"], get("ui_widget"))
+            if widget_error:
+                errors.append(f"Parameter {i} ({name}): {widget_error}")
+            
+            # Check required parameters have default values
+            if get("required", False) and get("default") is None:
+                errors.append(f"Parameter {i} ({get('name', 'unnamed')}): required parameters must have a default value")
         
         return len(errors) == 0, errors
         
-    except jsonschema.ValidationError as e:
-        # Provide more helpful error messages
-        error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
-        return False, [f"Validation error at {error_path}: {e.message}"]
+    except fastjsonschema.JsonSchemaValueException as e:
+        try:
+            schema_errors = _collect_schema_errors(parameters)
+        except Exception:
+            schema_errors = []
+        return False, schema_errors or [f"Validation error: {e.message}"]
     except jsonschema.SchemaError as e:
         return False, [f"Schema error: {e.message}"]
     except Exception as e:
@@ -437,22 +563,29 @@ async def process_card_parameters(client, parameters: List[Dict[str, Any]]) -> T
     Returns:
         Tuple of (processed_parameters, template_tags, errors)
     """
+    # Cards without parameters need no validation or processing.
+    # Non-list input still goes through validation so it is rejected.
+    if isinstance(parameters, list) and not parameters:
+        return [], {}, []
+    
     # Basic validation first
     is_valid, validation_errors = validate_card_parameters(parameters)
     if not is_valid:
         return [], {}, validation_errors
     
-    # Validate field references
-    field_errors = await validate_field_references(client, parameters)
-    if field_errors:
-        return [], {}, field_errors
+    # Validate field references (only field filters reference database fields)
+    if any("field" in param for param in parameters):
+        field_errors = await validate_field_references(client, parameters)
+        if field_errors:
+            return [], {}, field_errors
     
     # Process parameters
     processed_parameters = []
     template_tags = {}
     
-    for param_config in parameters:
-        param_id = generate_parameter_id()
+    param_ids = generate_parameter_ids(len(parameters))
+    
+    for param_config, param_id in zip(parameters, param_ids):
         processed_param, template_tag = process_single_parameter(param_config, param_id)
         
         processed_parameters.append(processed_param)
@@ -461,6 +594,86 @@ async def process_card_parameters(client, parameters: List[Dict[str, Any]]) -> T
     return processed_parameters, template_tags, []
 
 
+@functools.lru_cache(maxsize=1)
+def _build_documentation_response() -> str:
+    """
+    Build the GET_CARD_PARAMETERS_DOCUMENTATION response JSON once.
+    
+    Only called once the schema and docs are known to load.
+    
+    Returns:
+        Serialized documentation response
+    """
+    schema = load_card_parameters_schema()
+    docs = load_card_parameters_docs()
+    
+    response_data = {
+        "success": True,
+        "documentation": docs,
+        "schema": schema,
+        "parameter_types": {
+            "simple_filters": {
+                "category": "Text input with autocomplete and dropdown options",
+                "number/=": "Number input with dropdown options",
+                "date/single": "Single date picker"
+            },
+            "field_filters": {
+                "string_filters": [
+                    "string/=", "string/!=", "string/contains", 
+                    "string/does-not-contain", "string/starts-with", "string/ends-with"
+                ],
+                "numeric_filters": [
+                    "number/=", "number/!=", "number/between", 
+                    "number/>=", "number/<="
+                ],
+                "date_filters": [
+                    "date/single", "date/range", "date/relative", 
+                    "date/all-options", "date/month-year", "date/quarter-year"
+                ]
+            }
+        },
+        "ui_widgets": {
+            "input": "Free input (maps to values_query_type: 'none')",
+            "dropdown": "Select from list (maps to values_query_type: 'list')", 
+            "search": "Search with suggestions (maps to values_query_type: 'search')"
+        },
+        "value_sources": {
+            "static": "Predefined list of values",
+            "card": "Values from another card/model",
+            "connected": "Values from connected database field (field filters only)"
+        },
+        "usage_notes": [
+            "CRITICAL: NEVER add quotes around parameters - they substitute with proper formatting automatically",
+            "Simple variables like {{text_param}} become 'value' (quotes included automatically)", 
+            "Field filters like {{field_filter}} become true/false (boolean conditions)",
+            "All UUIDs, template tags, targets, and slugs are generated automatically",
+            "Parameter names must start with a letter and contain only letters, numbers, and underscores",
+            "Field references are validated against the database",
+            "UI widgets are validated for compatibility with parameter types",
+            "Use parameter names in SQL queries as {{parameter_name}} or [[AND condition = {{parameter_name}}]]"
+        ],
+        "common_mistakes": {
+            "quoted_parameters": {
+                "wrong": "WHERE status = '{{order_status}}'",
+                "correct": "WHERE status = {{order_status}}",
+                "explanation": "Parameters include quotes automatically for text values"
+            },
+            "case_when_quotes": {
+                "wrong": "CASE WHEN '{{metric_type}}' = 'spend' THEN spend",
+                "correct": "CASE WHEN {{metric_type}} = 'spend' THEN spend", 
+                "explanation": "Remove quotes around parameters in CASE WHEN statements"
+            },
+            "field_filter_as_value": {
+                "wrong": "WHERE customer_name = {{customer_filter}}",
+                "correct": "WHERE {{customer_filter}}",
+                "explanation": "Field filters are boolean conditions, not values"
+            }
+        }
+    }
+    
+    return json_dumps(response_data, pretty=True)
+
+
 @mcp.tool(name="GET_CARD_PARAMETERS_DOCUMENTATION", description="Get comprehensive documentation for card parameters")
 async def get_card_parameters_documentation(ctx: Context) -> str:
     """
@@ -499,72 +712,8 @@ async def get_card_parameters_documentation(ctx: Context) -> str:
                 request_info={"docs_file": "card_parameters_docs.md"}
             )
         
-        response_data = {
-            "success": True,
-            "documentation": docs,
-            "schema": schema,
-            "parameter_types": {
-                "simple_filters": {
-                    "category": "Text input with autocomplete and dropdown options",
-                    "number/=": "Number input with dropdown options",
-                    "date/single": "Single date picker"
-                },
-                "field_filters": {
-                    "string_filters": [
-                        "string/=", "string/!=", "string/contains", 
-                        "string/does-not-contain", "string/starts-with", "string/ends-with"
-                    ],
-                    "numeric_filters": [
-                        "number/=", "number/!=", "number/between", 
-                        "number/>=", "number/<="
-                    ],
-                    "date_filters": [
-                        "date/single", "date/range", "date/relative", 
-                        "date/all-options", "date/month-year", "date/quarter-year"
-                    ]
-                }
-            },
-            "ui_widgets": {
-                "input": "Free input (maps to values_query_type: 'none')",
-                "dropdown": "Select from list (maps to values_query_type: 'list')", 
-                "search": "Search with suggestions (maps to values_query_type: 'search')"
-            },
-            "value_sources": {
-                "static": "Predefined list of values",
-                "card": "Values from another card/model",
-                "connected": "Values from connected database field (field filters only)"
-            },
-            "usage_notes": [
-                "CRITICAL: NEVER add quotes around parameters - they substitute with proper formatting automatically",
-                "Simple variables like {{text_param}} become 'value' (quotes included automatically)", 
-                "Field filters like {{field_filter}} become true/false (boolean conditions)",
-                "All UUIDs, template tags, targets, and slugs are generated automatically",
-                "Parameter names must start with a letter and contain only letters, numbers, and underscores",
-                "Field references are validated against the database",
-                "UI widgets are validated for compatibility with parameter types",
-                "Use parameter names in SQL queries as {{parameter_name}} or [[AND condition = {{parameter_name}}]]"
-            ],
-            "common_mistakes": {
-                "quoted_parameters": {
-                    "wrong": "WHERE status = '{{order_status}}'",
-                    "correct": "WHERE status = {{order_status}}",
-                    "explanation": "Parameters include quotes automatically for text values"
-                },
-                "case_when_quotes": {
-                    "wrong": "CASE WHEN '{{metric_type}}' = 'spend' THEN spend",
-                    "correct": "CASE WHEN {{metric_type}} = 'spend' THEN spend", 
-                    "explanation": "Remove quotes around parameters in CASE WHEN statements"
-                },
-                "field_filter_as_value": {
-                    "wrong": "WHERE customer_name = {{customer_filter}}",
-                    "correct": "WHERE {{customer_filter}}",
-                    "explanation": "Field filters are boolean conditions, not values"
-                }
-            }
-        }
-        
-        # Convert to JSON string
-        response = json.dumps(response_data, indent=2)
+        # The response only depends on the schema and docs, so it is built once
+        response = _build_documentation_response()
         
         # Check response size
         metabase_ctx = ctx.request_context.lifespan_context
@@ -610,18 +759,15 @@ def extract_sql_parameters(query: str) -> Dict[str, List[str]]:
     Returns:
         Dictionary with 'required' and 'optional' parameter lists
     """
-    import re
-    
     # Find all {{parameter}} references
-    required_pattern = r'\{\{([^}]+)\}\}'
-    required_matches = re.findall(required_pattern, query)
+    required_matches = _SQL_PARAMETER_RE.findall(query)
     
     # Find all [[...{{parameter}}...]] optional references
-    optional_pattern = r'\[\[[^\]]*\{\{([^}]+)\}\}[^\]]*\]\]'
-    optional_matches = re.findall(optional_pattern, query)
+    optional_matches = _SQL_OPTIONAL_PARAMETER_RE.findall(query)
     
     # Remove optional parameters from required list (they appear in both)
-    required_only = [param for param in required_matches if param not in optional_matches]
+    optional_names = set(optional_matches)
+    required_only = [param for param in required_matches if param not in optional_names]
     
     return {
         "required": list(set(required_only)),  # Remove duplicates
@@ -644,19 +790,18 @@ def validate_sql_parameter_consistency(query: str, parameters: List[Dict[str, An
     # Extract parameters from SQL
     sql_params = extract_sql_parameters(query)
     all_sql_params = sql_params["required"] + sql_params["optional"]
+    all_sql_param_names = set(all_sql_params)
     
-    # Get parameter names/slugs from configuration
-    config_param_names = set()
-    config_param_slugs = set()
-    
+    # Map parameter names and slugs from configuration to the first parameter
+    # using them (parameters can be referenced by either)
+    params_by_reference = {}
     for param in parameters:
         if "name" in param:
-            config_param_names.add(param["name"])
+            params_by_reference.setdefault(param["name"], param)
         if "slug" in param:
-            config_param_slugs.add(param["slug"])
+            params_by_reference.setdefault(param["slug"], param)
     
-    # Combine both name and slug for checking (parameters can be referenced by either)
-    config_params = config_param_names.union(config_param_slugs)
+    config_params = params_by_reference.keys()
     
     # Check for SQL parameters not in configuration
     for sql_param in all_sql_params:
@@ -665,19 +810,15 @@ def validate_sql_parameter_consistency(query: str, parameters: List[Dict[str, An
     
     # Check for configured parameters not used in SQL
     for config_param in config_params:
-        if config_param not in all_sql_params:
+        if config_param not in all_sql_param_names:
             issues.append(f"Parameter '{config_param}' is configured but not used in SQL query")
     
     # Check required vs optional parameter usage
     for required_param in sql_params["required"]:
-        if required_param in config_params:
-            # Find the parameter config
-            param_config = next(
-                (p for p in parameters if p.get("name") == required_param or p.get("slug") == required_param), 
-                None
-            )
-            if param_config and not param_config.get("required", False) and "default" not in param_config:
-                issues.append(f"Parameter '{required_param}' is used as required in SQL but has no default value and is not marked as required")
+        # Find the parameter config
+        param_config = params_by_reference.get(required_param)
+        if param_config and not param_config.get("required", False) and "default" not in param_config:
+            issues.append(f"Parameter '{required_param}' is used as required in SQL but has no default value and is not marked as required")
     
     return issues
 
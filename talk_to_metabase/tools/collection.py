@@ -9,7 +9,7 @@ from typing import Dict, List, Optional, Any, Union
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..server import get_server_instance
-from .common import format_error_response, get_metabase_client, check_response_size
+from .common import format_error_response, get_metabase_client, check_response_size, json_dumps
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -121,7 +121,7 @@ async def explore_collection_tree(
         }
         
         # Convert data to JSON string
-        response = json.dumps(response_data, indent=2)
+        response = json_dumps(response_data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -258,7 +258,7 @@ async def view_collection_contents(
         }
         
         # Convert data to JSON string
-        response = json.dumps(response_data, indent=2)
+        response = json_dumps(response_data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -317,7 +317,7 @@ async def create_collection(
             "name": data.get("name")
         }
         
-        response_json = json.dumps(response, indent=2)
+        response_json = json_dumps(response)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
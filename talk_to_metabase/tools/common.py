@@ -4,8 +4,10 @@ Common utilities and helpers for Metabase MCP tools.
 
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
+import fastjsonschema
+import orjson
 from mcp.server.fastmcp import Context
 
 from ..client import MetabaseClient
@@ -15,11 +17,44 @@ logger = logging.getLogger(__name__)
 
 
 def get_metabase_client(ctx: Context) -> MetabaseClient:
-    """Get the Metabase client from the context."""
+    """Get the Metabase client from the context.
+    
+    The returned wrapper is lightweight; all clients share the lifespan's
+    pooled HTTP connection via the same MetabaseAuth instance.
+    """
     metabase_ctx: MetabaseContext = ctx.request_context.lifespan_context
     return MetabaseClient(metabase_ctx.auth)
 
 
+def json_dumps(data: Any, pretty: bool = False) -> str:
+    """Serialize a tool response to a JSON string using orjson.
+    
+    Output is compact by default, which keeps large payloads well under the
+    response size limit; pass pretty=True for two-space indentation. Falls
+    back to the standard library for values orjson cannot encode (for
+    example integers wider than 64 bits).
+    """
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, option=option).decode()
+    except TypeError:
+        if pretty:
+            return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def compile_schema_validator(schema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Compile a JSON schema into a fastjsonschema validator function.
+    
+    Defaults declared in the schema are not filled in, so validation never
+    mutates the tool input (matching jsonschema's behaviour). The returned
+    function raises fastjsonschema.JsonSchemaValueException on invalid data.
+    """
+    return fastjsonschema.compile(schema, use_default=False)
+
+
 def format_error_response(
     status_code: int,
     error_type: str,
@@ -47,33 +82,38 @@ def format_error_response(
     if raw_response:
         error_data["error"]["raw_response"] = raw_response
     
-    return json.dumps(error_data, indent=2)
+    return json_dumps(error_data)
 
 
-def check_response_size(response: str, config) -> str:
-    """Check if response exceeds size limit and format appropriately.
+def min_json_object_size(keys: Iterable[str]) -> int:
+    """Get the smallest possible compact JSON size of an object with the given keys.
+    
+    Every value is assumed to take at least one character, so the result is a
+    lower bound on the serialized size of any object with exactly these keys.
+    """
+    keys = list(keys)
+    # '"key":v' per entry, commas between entries and the surrounding braces
+    return sum(len(key) + 4 for key in keys) + max(len(keys) - 1, 0) + 2
+
+
+def format_size_exceeded_response(response_length: int, limit: int, estimated: bool = False) -> str:
+    """Format the error returned when a response is larger than the size limit.
     
     Args:
-        response: The response string
-        config: Configuration object containing size limit
+        response_length: Size of the response in characters
+        limit: Configured size limit in characters
+        estimated: Whether response_length is a lower-bound estimate made
+            without serializing the response
         
     Returns:
-        Original response if within limits, or error message if too large
+        Error response as JSON string
     """
-    response_length = len(response)
-    limit = config.response_size_limit
-    
-    if response_length <= limit:
-        return response
-    
-    logger.warning(f"Response size ({response_length}) exceeds limit ({limit})")
-    
-    # Create a summary with size information and truncate the response
+    size_text = f"at least {response_length}" if estimated else f"{response_length}"
     error_response = {
         "success": False,
         "error": {
             "error_type": "response_size_exceeded",
-            "message": f"Response size ({response_length} characters) exceeds the configured limit ({limit} characters).",
+            "message": f"Response size ({size_text} characters) exceeds the configured limit ({limit} characters).",
             "size_info": {
                 "actual_size": response_length,
                 "size_limit": limit,
@@ -81,5 +121,27 @@ def check_response_size(response: str, config) -> str:
             }
         }
     }
+    if estimated:
+        error_response["error"]["size_info"]["estimated"] = True
+    
+    return json_dumps(error_response)
+
+
+def check_response_size(response: str, config) -> str:
+    """Check if response exceeds size limit and format appropriately.
     
-    return json.dumps(error_response, indent=2)
+    Args:
+        response: The response string
+        config: Configuration object containing size limit
+        
+    Returns:
+        Original response if within limits, or error message if too large
+    """
+    response_length = len(response)
+    limit = config.response_size_limit
+    
+    if response_length <= limit:
+        return response
+    
+    logger.warning(f"Response size ({response_length}) exceeds limit ({limit})")
+    return format_size_exceeded_response(response_length, limit)
@@ -2,15 +2,16 @@
 Dashboard operations MCP tools.
 """
 
-import json
+import asyncio
 import logging
+import operator
 import time
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..server import get_server_instance
-from .common import format_error_response, get_metabase_client, check_response_size
+from .common import format_error_response, get_metabase_client, check_response_size, json_dumps
 from .dashcards import (
     validate_dashcards_helper, 
     validate_tabs_helper,
@@ -25,6 +26,253 @@ from .dashboard_parameters import (
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Dashcard fields carried over into get_dashboard_tab summaries
+DASHCARD_SUMMARY_FIELDS = (
+    "id",
+    "card_id",
+    "dashboard_id",
+    "dashboard_tab_id",
+    "size_x",
+    "size_y",
+    "parameter_mappings",
+    "visualization_settings",
+)
+
+# How long (in seconds) a fetched dashboard is reused by get_dashboard and
+# get_dashboard_tab before it is requested from Metabase again
+DASHBOARD_CACHE_TTL = 30.0
+
+# Recently fetched dashboards, keyed by dashboard ID and holding the
+# monotonic time at which they were fetched
+_DASHBOARD_CACHE: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+# Dashboard fetches currently in progress, so concurrent callers for the
+# same dashboard share a single upstream request
+_INFLIGHT_DASHBOARD_FETCHES: Dict[int, "asyncio.Task[Dict[str, Any]]"] = {}
+
+# Sort key for dashcard summaries (top to bottom, left to right)
+_POSITION_KEY = operator.itemgetter("row", "col")
+
+# Per-tab sorted dashcard summaries, keyed by dashboard ID and holding the
+# monotonic time they were built plus the dashboard's updated_at, so edits
+# invalidate the entry automatically and idle entries expire like dashboards
+_TAB_INDEX_CACHE: Dict[
+    int, Tuple[float, str, Dict[Optional[int], List[Dict[str, Any]]]]
+] = {}
+
+
+def _summarize_dashcard(dashcard: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a lightweight summary of a dashcard without copying the source.
+    
+    Args:
+        dashcard: Dashcard as returned by the Metabase API
+        
+    Returns:
+        Summary dict with layout fields, card summary and series summary
+    """
+    # Project only the layout fields instead of copying the whole dashcard
+    processed_dashcard = {
+        key: dashcard[key] for key in DASHCARD_SUMMARY_FIELDS if key in dashcard
+    }
+    # Position is always present so summaries can be sorted by it
+    processed_dashcard["row"] = dashcard.get("row", 0)
+    processed_dashcard["col"] = dashcard.get("col", 0)
+    
+    # Summarize the regular card without carrying over the full card object
+    card = dashcard.get("card")
+    if card is not None:
+        processed_dashcard["card_summary"] = {
+            "id": card.get("id"),
+            "name": card.get("name"),
+            "description": card.get("description"),
+            "display": card.get("display"),
+            "collection_id": card.get("collection_id"),
+            "database_id": card.get("database_id"),
+            "table_id": card.get("table_id"),
+            "query_type": card.get("query_type"),
+        }
+        # Keep the card visualization settings alongside the summary
+        if "visualization_settings" in card:
+            processed_dashcard["card_visualization_settings"] = card["visualization_settings"]
+    
+    # Summarize series cards if present
+    series = dashcard.get("series")
+    if isinstance(series, list):
+        processed_dashcard["series_summary"] = [
+            {
+                "id": series_card.get("id"),
+                "name": series_card.get("name"),
+                "description": series_card.get("description")
+            }
+            for series_card in series
+            if series_card is not None
+        ]
+    
+    return processed_dashcard
+
+
+def _build_tab_index(
+    data: Dict[str, Any], has_tabs: bool
+) -> Dict[Optional[int], List[Dict[str, Any]]]:
+    """
+    Group dashcard summaries by tab and sort each group by position.
+    
+    Args:
+        data: Full dashboard data
+        has_tabs: Whether the dashboard has explicit tabs
+        
+    Returns:
+        Dict mapping tab ID (None for single-tab dashboards) to sorted summaries
+    """
+    summaries = [_summarize_dashcard(dashcard) for dashcard in data.get("dashcards") or []]
+    
+    # Sort dashcards by position (top to bottom, left to right) once; grouping
+    # below preserves this order within each tab
+    summaries.sort(key=_POSITION_KEY)
+    
+    # Single-tab dashboards serve the sorted list as-is
+    if not has_tabs:
+        return {None: summaries}
+    
+    tab_index: Dict[Optional[int], List[Dict[str, Any]]] = {}
+    for summary in summaries:
+        tab_index.setdefault(summary.get("dashboard_tab_id"), []).append(summary)
+    
+    return tab_index
+
+
+def _get_tab_index(
+    dashboard_id: int, data: Dict[str, Any], has_tabs: bool
+) -> Dict[Optional[int], List[Dict[str, Any]]]:
+    """
+    Get the per-tab dashcard index for a dashboard, building it on a cache miss.
+    
+    Args:
+        dashboard_id: Dashboard ID
+        data: Full dashboard data
+        has_tabs: Whether the dashboard has explicit tabs
+        
+    Returns:
+        Dict mapping tab ID (None for single-tab dashboards) to sorted summaries
+    """
+    now = time.monotonic()
+    updated_at = data.get("updated_at")
+    cached = _TAB_INDEX_CACHE.get(dashboard_id)
+    if (
+        updated_at is not None
+        and cached is not None
+        and now - cached[0] < DASHBOARD_CACHE_TTL
+        and cached[1] == updated_at
+    ):
+        return cached[2]
+    
+    tab_index = _build_tab_index(data, has_tabs)
+    if updated_at is not None:
+        # Drop expired entries so the cache only holds recently used dashboards
+        for expired_id in [
+            key for key, (built_at, _, _) in _TAB_INDEX_CACHE.items()
+            if now - built_at >= DASHBOARD_CACHE_TTL
+        ]:
+            del _TAB_INDEX_CACHE[expired_id]
+        
+        _TAB_INDEX_CACHE[dashboard_id] = (now, updated_at, tab_index)
+    return tab_index
+
+
+async def _get_dashboard_cached(client, dashboard_id: int) -> Dict[str, Any]:
+    """
+    Fetch a dashboard, reusing a recent fetch of the same dashboard if available.
+    
+    Metabase has no way to request a dashboard without its dashcards, so
+    get_dashboard and get_dashboard_tab share one full fetch instead of
+    each downloading the dashboard separately. Concurrent calls for the
+    same dashboard are coalesced into a single request.
+    
+    Args:
+        client: Metabase client
+        dashboard_id: Dashboard ID
+        
+    Returns:
+        Full dashboard data
+    """
+    now = time.monotonic()
+    cached = _DASHBOARD_CACHE.get(dashboard_id)
+    if cached is not None and now - cached[0] < DASHBOARD_CACHE_TTL:
+        return cached[1]
+    
+    fetch = _INFLIGHT_DASHBOARD_FETCHES.get(dashboard_id)
+    if fetch is not None:
+        # Another caller is already fetching this dashboard; wait for its result
+        return await asyncio.shield(fetch)
+    
+    fetch = asyncio.ensure_future(client.get_resource("dashboard", dashboard_id))
+    _INFLIGHT_DASHBOARD_FETCHES[dashboard_id] = fetch
+    try:
+        data = await asyncio.shield(fetch)
+    finally:
+        # Invalidation removes the entry, so a fetch that is no longer
+        # registered may predate an update and must not be cached
+        is_current = _INFLIGHT_DASHBOARD_FETCHES.get(dashboard_id) is fetch
+        if is_current:
+            del _INFLIGHT_DASHBOARD_FETCHES[dashboard_id]
+    
+    if not is_current:
+        return data
+    
+    # Drop expired entries so the cache only holds recently used dashboards
+    for expired_id in [
+        key for key, (fetched_at, _) in _DASHBOARD_CACHE.items()
+        if now - fetched_at >= DASHBOARD_CACHE_TTL
+    ]:
+        del _DASHBOARD_CACHE[expired_id]
+    
+    _DASHBOARD_CACHE[dashboard_id] = (time.monotonic(), data)
+    return data
+
+
+def _cached_tab_card_count(dashboard_id: int, tab_id: Optional[int]) -> Optional[int]:
+    """
+    Get the number of cards in a dashboard tab from the caches, without fetching.
+    
+    Args:
+        dashboard_id: Dashboard ID
+        tab_id: Tab ID (None for single-tab dashboards)
+        
+    Returns:
+        Card count if a fresh cached dashboard and matching tab index exist
+        and tab_id is valid for it, otherwise None
+    """
+    now = time.monotonic()
+    cached = _DASHBOARD_CACHE.get(dashboard_id)
+    if cached is None or now - cached[0] >= DASHBOARD_CACHE_TTL:
+        return None
+    data = cached[1]
+    
+    indexed = _TAB_INDEX_CACHE.get(dashboard_id)
+    if (
+        indexed is None
+        or now - indexed[0] >= DASHBOARD_CACHE_TTL
+        or indexed[1] != data.get("updated_at")
+    ):
+        return None
+    
+    # Leave tab validation errors to the full request path
+    has_tabs = bool(data.get("tabs"))
+    if has_tabs != (tab_id is not None):
+        return None
+    
+    tab_dashcards = indexed[2].get(tab_id)
+    return len(tab_dashcards) if tab_dashcards is not None else None
+
+
+def _invalidate_dashboard_cache(dashboard_id: int) -> None:
+    """Forget any cached or in-flight copy of a dashboard after it has been modified."""
+    _DASHBOARD_CACHE.pop(dashboard_id, None)
+    _INFLIGHT_DASHBOARD_FETCHES.pop(dashboard_id, None)
+    _TAB_INDEX_CACHE.pop(dashboard_id, None)
+
+
 # Register tools with the server
 mcp = get_server_instance()
 logger.info("Registering dashboard tools with the server...")
@@ -45,7 +293,7 @@ async def get_dashboard(id: int, ctx: Context) -> str:
     client = get_metabase_client(ctx)
     
     try:
-        data = await client.get_resource("dashboard", id)
+        data = await _get_dashboard_cached(client, id)
         
         # Create a simplified dashboard object without cards
         simplified_data = {
@@ -53,25 +301,27 @@ async def get_dashboard(id: int, ctx: Context) -> str:
             if key != "dashcards"
         }
         
+        tabs = data.get("tabs") or []
+        dashcards = data.get("dashcards") or []
+        
         # If there are tabs, keep tab information
-        if "tabs" in data and isinstance(data["tabs"], list) and data["tabs"]:
-            logger.info(f"Dashboard has {len(data['tabs'])} tabs")
-            simplified_data["tabs"] = data["tabs"]
+        if tabs:
+            logger.info(f"Dashboard has {len(tabs)} tabs")
+            simplified_data["tabs"] = tabs
         else:
             # For non-tabbed dashboards, create an implicit default tab
             logger.info("Dashboard has no explicit tabs (single-tab dashboard)")
             simplified_data["is_single_tab"] = True
         
         # Return card count information rather than the cards themselves
-        if "dashcards" in data and isinstance(data["dashcards"], list):
-            simplified_data["dashcard_count"] = len(data["dashcards"])
-            logger.info(f"Dashboard has {len(data['dashcards'])} cards")
+        simplified_data["dashcard_count"] = len(dashcards)
+        if dashcards:
+            logger.info(f"Dashboard has {len(dashcards)} cards")
         else:
-            simplified_data["dashcard_count"] = 0
             logger.info("Dashboard has no cards")
             
         # Convert data to JSON string
-        response = json.dumps(simplified_data, indent=2)
+        response = json_dumps(simplified_data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -122,7 +372,7 @@ async def create_dashboard(
     try:
         data = await client.create_resource("dashboard", dashboard_data)
         # Convert data to JSON string
-        response = json.dumps(data, indent=2)
+        response = json_dumps(data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -236,52 +486,52 @@ async def update_dashboard(
     if dashcards is not None:
         validation_result = validate_dashcards_helper(dashcards)
         if not validation_result["valid"]:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Invalid dashcards format",
                 "validation_errors": validation_result["errors"],
                 "help": "Call GET_DASHCARDS_SCHEMA to understand the correct format."
-            }, indent=2)
+            })
     
     # Validate tabs if provided
     if tabs is not None:
         tabs_validation_result = validate_tabs_helper(tabs)
         if not tabs_validation_result["valid"]:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Invalid tabs format",
                 "validation_errors": tabs_validation_result["errors"],
                 "help": "Tabs must have 'name' field (string) and optional 'id' field (integer). Use negative IDs for new tabs."
-            }, indent=2)
+            })
     
     # Validate dashboard parameters if provided
     if parameters is not None:
         parameters_validation_result = validate_dashboard_parameters_helper(parameters)
         if not parameters_validation_result["valid"]:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Invalid dashboard parameters format",
                 "validation_errors": parameters_validation_result["errors"],
                 "help": "Call GET_DASHBOARD_PARAMETERS_DOCUMENTATION to understand the correct format. Required fields: name, type."
-            }, indent=2)
+            })
         
         # Process parameters with full validation
         try:
             processed_parameters, processing_errors = await process_dashboard_parameters(client, parameters)
             if processing_errors:
-                return json.dumps({
+                return json_dumps({
                     "success": False,
                     "error": "Dashboard parameters processing failed",
                     "validation_errors": processing_errors,
                     "help": "Check parameter configuration and ensure referenced cards are accessible."
-                }, indent=2)
+                })
             parameters = processed_parameters
         except Exception as e:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "Dashboard parameters processing error",
                 "message": str(e)
-            }, indent=2)
+            })
     
     # Process parameter mappings if both dashcards and parameters are provided
     if dashcards is not None and parameters is not None:
@@ -299,12 +549,12 @@ async def update_dashboard(
                 )
                 
                 if mapping_errors:
-                    return json.dumps({
+                    return json_dumps({
                         "success": False,
                         "error": "Parameter mapping validation failed",
                         "validation_errors": mapping_errors,
                         "help": "Check that dashboard parameter names and card parameter names match exactly."
-                    }, indent=2)
+                    })
                 
                 # Process parameter mappings to convert from name-based to ID-based
                 processed_dashcards, processing_errors = await process_parameter_mappings(
@@ -312,22 +562,22 @@ async def update_dashboard(
                 )
                 
                 if processing_errors:
-                    return json.dumps({
+                    return json_dumps({
                         "success": False,
                         "error": "Parameter mapping processing failed",
                         "validation_errors": processing_errors,
                         "help": "Check that parameter names match between dashboard and card configurations."
-                    }, indent=2)
+                    })
                 
                 # Replace original dashcards with processed ones
                 dashcards = processed_dashcards
                 
             except Exception as e:
-                return json.dumps({
+                return json_dumps({
                     "success": False,
                     "error": "Parameter mapping processing error",
                     "message": str(e)
-                }, indent=2)
+                })
     
     try:
         # Prepare update payload with only the fields to be updated
@@ -351,15 +601,16 @@ async def update_dashboard(
         
         # If no fields were provided to update, return early
         if not update_data:
-            return json.dumps({
+            return json_dumps({
                 "success": False,
                 "error": "No fields provided for update"
-            }, indent=2)
+            })
         
         # Perform the update
         data, status, error = await client.auth.make_request(
             "PUT", f"dashboard/{id}", json=update_data
         )
+        _invalidate_dashboard_cache(id)
         
         if error:
             return format_error_response(
@@ -373,14 +624,14 @@ async def update_dashboard(
             )
         
         # Return a concise success response with essential info
-        return json.dumps({
+        return json_dumps({
             "success": True,
             "dashboard_id": data.get("id"),
             "name": data.get("name"),
             "dashcard_count": len(data.get("dashcards", [])) if "dashcards" in data else None,
             "tab_count": len(data.get("tabs", [])) if "tabs" in data else None,
             "parameter_count": len(data.get("parameters", [])) if "parameters" in data else None
-        }, indent=2)
+        })
         
     except Exception as e:
         logger.error(f"Error updating dashboard {id}: {e}")
@@ -435,12 +686,26 @@ async def get_dashboard_tab(
             request_info={"dashboard_id": dashboard_id, "tab_id": tab_id, "page_size": page_size}
         )
     
+    # Reject pages past the end from cached metadata before doing any other work
+    cached_total_cards = _cached_tab_card_count(dashboard_id, tab_id)
+    if cached_total_cards:
+        total_pages = (cached_total_cards + page_size - 1) // page_size
+        if page > total_pages:
+            return format_error_response(
+                status_code=400,
+                error_type="page_out_of_range",
+                message=f"Page {page} exceeds the total number of pages ({total_pages})",
+                request_info={"dashboard_id": dashboard_id, "tab_id": tab_id, "page": page, "total_pages": total_pages}
+            )
+    
     try:
         # Get the full dashboard first
-        data = await client.get_resource("dashboard", dashboard_id)
+        data = await _get_dashboard_cached(client, dashboard_id)
         
         # Check if the dashboard has tabs
-        has_tabs = "tabs" in data and isinstance(data["tabs"], list) and data["tabs"]
+        tabs = data.get("tabs") or []
+        has_tabs = bool(tabs)
+        tabs_by_id = {tab["id"]: tab for tab in tabs}
         
         # If tab_id is provided, validate it
         if tab_id is not None:
@@ -454,8 +719,7 @@ async def get_dashboard_tab(
                 )
             
             # Check if the tab_id exists
-            tab_exists = any(tab["id"] == tab_id for tab in data["tabs"])
-            if not tab_exists:
+            if tab_id not in tabs_by_id:
                 return format_error_response(
                     status_code=404,
                     error_type="tab_not_found",
@@ -468,55 +732,12 @@ async def get_dashboard_tab(
                 status_code=400,
                 error_type="missing_tab_id",
                 message=f"Dashboard {dashboard_id} has multiple tabs, but no tab_id was provided",
-                request_info={"dashboard_id": dashboard_id, "available_tabs": data["tabs"]}
+                request_info={"dashboard_id": dashboard_id, "available_tabs": tabs}
             )
         
-        # Filter dashcards by tab_id if tabs exist, otherwise return all cards
-        filtered_dashcards = []
-        
-        if "dashcards" in data and isinstance(data["dashcards"], list):
-            for dashcard in data["dashcards"]:
-                # For single-tab dashboards or cards with matching tab_id
-                if (not has_tabs) or ("dashboard_tab_id" in dashcard and dashcard["dashboard_tab_id"] == tab_id):
-                    # Process card data to make it more manageable
-                    processed_dashcard = dashcard.copy()
-                    
-                    # Process regular card
-                    if "card" in processed_dashcard and processed_dashcard["card"] is not None:
-                        card = processed_dashcard["card"]
-                        processed_dashcard["card_summary"] = {
-                            "id": card.get("id"),
-                            "name": card.get("name"),
-                            "description": card.get("description"),
-                            "display": card.get("display"),
-                            "collection_id": card.get("collection_id"),
-                            "database_id": card.get("database_id"),
-                            "table_id": card.get("table_id"),
-                            "query_type": card.get("query_type"),
-                        }
-                        # Remove the full card object but keep visualization settings
-                        if "visualization_settings" in card:
-                            processed_dashcard["card_visualization_settings"] = card["visualization_settings"]
-                        processed_dashcard["card"] = None
-                    
-                    # Process series cards if present
-                    if "series" in processed_dashcard and isinstance(processed_dashcard["series"], list):
-                        series_summaries = []
-                        for series_card in processed_dashcard["series"]:
-                            if series_card is not None:
-                                series_summaries.append({
-                                    "id": series_card.get("id"),
-                                    "name": series_card.get("name"),
-                                    "description": series_card.get("description")
-                                })
-                        processed_dashcard["series_summary"] = series_summaries
-                        processed_dashcard["series"] = []
-                    
-                    filtered_dashcards.append(processed_dashcard)
-            
-        # Sort dashcards by position (top to bottom, left to right)
-        # This means sorting primarily by row and secondarily by col
-        filtered_dashcards.sort(key=lambda card: (card.get("row", 0), card.get("col", 0)))
+        # Look up the sorted cards for this tab from the per-dashboard index
+        tab_index = _get_tab_index(dashboard_id, data, has_tabs)
+        filtered_dashcards = tab_index.get(tab_id if has_tabs else None, [])
         
         # Apply pagination
         total_cards = len(filtered_dashcards)
@@ -555,7 +776,7 @@ async def get_dashboard_tab(
         
         # Add tab information if it exists
         if has_tabs and tab_id is not None:
-            tab_info = next((tab for tab in data["tabs"] if tab["id"] == tab_id), None)
+            tab_info = tabs_by_id.get(tab_id)
             if tab_info:
                 tab_data["tab"] = tab_info
         else:
@@ -571,7 +792,7 @@ async def get_dashboard_tab(
                   (f", tab {tab_id}" if tab_id is not None else ""))
         
         # Convert data to JSON string
-        response = json.dumps(tab_data, indent=2)
+        response = json_dumps(tab_data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -670,6 +891,9 @@ async def execute_card_query(
                 }
             )
         
+        metabase_ctx = ctx.request_context.lifespan_context
+        config = metabase_ctx.auth.config
+        
         # Add metadata about the execution context
         if "data" in data:
             metadata = {
@@ -685,21 +909,28 @@ async def execute_card_query(
             if dashcard_id:
                 metadata["execution_context"]["dashcard_id"] = dashcard_id
             
-            # Add row count if available
+            # Add row count if available, truncating rows that would not fit in a response
             if "rows" in data["data"]:
-                row_count = len(data["data"]["rows"])
+                rows = data["data"]["rows"]
+                row_count = len(rows)
                 metadata["row_count"] = row_count
-                logger.info(f"Query returned {row_count} rows")
+                
+                row_preview_limit = config.row_preview_limit
+                if row_count > row_preview_limit:
+                    data["data"]["rows"] = rows[:row_preview_limit]
+                    metadata["row_count_truncated"] = True
+                    metadata["returned_row_count"] = row_preview_limit
+                    logger.info(f"Query returned {row_count} rows, truncated to {row_preview_limit}")
+                else:
+                    logger.info(f"Query returned {row_count} rows")
             
             # Add metadata to the response
             data["metadata"] = metadata
         
         # Convert to JSON string
-        response = json.dumps(data, indent=2)
+        response = json_dumps(data)
         
         # Check response size before returning
-        metabase_ctx = ctx.request_context.lifespan_context
-        config = metabase_ctx.auth.config
         return check_response_size(response, config)
         
     except Exception as e:
@@ -10,67 +10,87 @@ This module provides comprehensive dashboard parameter support including:
 - Comprehensive validation
 """
 
-import json
+import asyncio
+import functools
+import itertools
 import logging
 import random
+import re
 import string
-from typing import Dict, List, Tuple, Any, Optional, Union
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Tuple, Any, Optional, Union
 
+import fastjsonschema
 import jsonschema
 from mcp.server.fastmcp import Context
 
 from ..server import get_server_instance
-from ..resources import load_json_resource, load_text_resource
-from .common import format_error_response, get_metabase_client, check_response_size
+from ..resources import cached_resource, load_dashboard_parameters_schema
+from .common import (
+    format_error_response, get_metabase_client, check_response_size, compile_schema_validator, json_dumps
+)
 
 logger = logging.getLogger(__name__)
 
 # Register tools with the server
 mcp = get_server_instance()
 
+# Characters used in generated parameter IDs
+_PARAMETER_ID_ALPHABET = string.ascii_letters + string.digits
+
+# Parameter names reserved by Metabase dashboards
+_RESERVED_PARAMETER_NAMES = frozenset({"tab"})
+
+# Accepted Python types for numeric and ID parameter default values
+_NUMBER_TYPES = (int, float)
+_ID_VALUE_TYPES = (str, int, float)
+
+# Runs of characters replaced by a single underscore in parameter slugs
+_SLUG_SEPARATOR_RE = re.compile(r'[^a-zA-Z0-9]+')
+
 # Dashboard parameter type categories
-TEXT_PARAMETER_TYPES = {
+TEXT_PARAMETER_TYPES = frozenset({
     "string/=", "string/!=", "string/contains", "string/does-not-contain",
     "string/starts-with", "string/ends-with"
-}
+})
 
-LOCATION_PARAMETER_TYPES = {
+LOCATION_PARAMETER_TYPES = frozenset({
     "location/=", "location/!=", "location/contains", "location/does-not-contain",
     "location/starts-with", "location/ends-with"
-}
+})
 
-NUMBER_PARAMETER_TYPES = {
+NUMBER_PARAMETER_TYPES = frozenset({
     "number/=", "number/!=", "number/between", "number/>=", "number/<="
-}
+})
 
-DATE_PARAMETER_TYPES = {
+DATE_PARAMETER_TYPES = frozenset({
     "date/single", "date/range", "date/month-year", "date/quarter-year", 
     "date/relative", "date/all-options"
-}
+})
+
+# Number parameter types that accept several values
+_MULTI_VALUE_NUMBER_TYPES = frozenset({"number/=", "number/!="})
 
 # Parameter types that support multi-select
-MULTI_SELECT_SUPPORTED = {
-    "string/=", "string/!=", "string/contains", "string/does-not-contain",
-    "string/starts-with", "string/ends-with", "number/=", "number/!=", "id",
-    "location/=", "location/!=", "location/contains", "location/does-not-contain",
-    "location/starts-with", "location/ends-with"
-}
+MULTI_SELECT_SUPPORTED = TEXT_PARAMETER_TYPES | LOCATION_PARAMETER_TYPES | _MULTI_VALUE_NUMBER_TYPES | {"id"}
 
 # Parameter types that do NOT support multi-select
-MULTI_SELECT_FORBIDDEN = {
-    "date/single", "date/range", "date/month-year", "date/quarter-year", 
-    "date/relative", "date/all-options", "temporal-unit", "number/between", "number/>=", "number/<="
-}
+MULTI_SELECT_FORBIDDEN = (
+    DATE_PARAMETER_TYPES | (NUMBER_PARAMETER_TYPES - _MULTI_VALUE_NUMBER_TYPES) | {"temporal-unit"}
+)
 
 # Valid temporal units for temporal-unit parameters
-VALID_TEMPORAL_UNITS = {
+VALID_TEMPORAL_UNITS = frozenset({
     "minute", "hour", "day", "week", "month", "quarter", "year",
     "minute-of-hour", "hour-of-day", "day-of-week", "day-of-month",
     "day-of-year", "week-of-year", "month-of-year", "quarter-of-year"
-}
+})
+
+# Sorted list of valid temporal units as rendered in error messages
+_VALID_TEMPORAL_UNITS_TEXT = str(sorted(VALID_TEMPORAL_UNITS))
 
 # Section ID mappings based on parameter type
-SECTION_ID_MAPPINGS = {
+SECTION_ID_MAPPINGS = MappingProxyType({
     # String parameters
     "string/=": "string",
     "string/!=": "string", 
@@ -105,154 +125,221 @@ SECTION_ID_MAPPINGS = {
     # Special parameters
     "temporal-unit": "temporal-unit",
     "id": "id"
-}
+})
 
 # Location parameter to string parameter mapping
-LOCATION_TO_STRING_MAPPING = {
+LOCATION_TO_STRING_MAPPING = MappingProxyType({
     "location/=": "string/=",
     "location/!=": "string/!=",
     "location/contains": "string/contains",
     "location/does-not-contain": "string/does-not-contain",
     "location/starts-with": "string/starts-with",
     "location/ends-with": "string/ends-with"
-}
+})
 
 
-def load_dashboard_parameters_schema() -> Optional[Dict[str, Any]]:
-    """Load the dashboard parameters JSON schema."""
-    return load_json_resource("schemas/dashboard_parameters.json")
+@cached_resource(maxsize=1)
+def _get_validator() -> Optional[Any]:
+    """Build the jsonschema validator for the dashboard parameters schema once it loads and reuse it."""
+    schema = load_dashboard_parameters_schema()
+    if schema is None:
+        return None
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
 
 
-def generate_parameter_id() -> str:
-    """
-    Generate a unique 8-character alphanumeric parameter ID for dashboard parameters.
-    
-    Returns:
-        8-character alphanumeric string
-    """
-    # Generate 8-character alphanumeric ID (letters and numbers)
-    return ''.join(random.choices(string.ascii_letters + string.digits, k=8))
+# Maximum number of schema errors reported for one validation, which bounds
+# the work done on large, badly malformed inputs
+MAX_SCHEMA_ERRORS = 20
 
+# Compile the dashboard parameters schema once into a generated validator function;
+# validate_dashboard_parameters falls back to jsonschema if compilation is not possible
+try:
+    _dashboard_parameters_schema = load_dashboard_parameters_schema()
+    _COMPILED_VALIDATOR = (
+        compile_schema_validator(_dashboard_parameters_schema)
+        if _dashboard_parameters_schema is not None else None
+    )
+except Exception as e:
+    logger.error(f"Could not compile dashboard parameters schema: {e}")
+    _COMPILED_VALIDATOR = None
 
-def generate_slug(name: str) -> str:
+
+def _collect_schema_errors(parameters: List[Dict[str, Any]]) -> List[str]:
     """
-    Generate a URL-friendly slug from parameter name.
+    Collect the schema violations in the parameters in a single traversal.
+    
+    Traversal stops once MAX_SCHEMA_ERRORS violations have been found.
     
     Args:
-        name: Parameter name
+        parameters: List of dashboard parameter configurations
         
     Returns:
-        URL-friendly slug
+        List of validation error messages (empty if the parameters are valid)
     """
-    import re
-    # Convert to lowercase, replace non-alphanumeric with underscores
-    slug = re.sub(r'[^a-zA-Z0-9]+', '_', name.lower().strip())
-    # Remove leading/trailing underscores
-    slug = slug.strip('_')
-    # Ensure it's not empty
-    if not slug:
-        slug = "parameter"
-    return slug
+    errors = []
+    for error in itertools.islice(_get_validator().iter_errors(parameters), MAX_SCHEMA_ERRORS):
+        error_path = " -> ".join(map(str, error.absolute_path)) if error.absolute_path else "root"
+        errors.append(f"Validation error at {error_path}: {error.message}")
+    return errors
 
 
-def determine_section_id(param_type: str, param_name: str, values_source: Optional[Dict[str, Any]] = None) -> str:
+def _random_parameter_ids(count: int) -> List[str]:
+    """Draw `count` random 8-character alphanumeric IDs from a single batch of characters."""
+    chars = ''.join(random.choices(_PARAMETER_ID_ALPHABET, k=8 * count))
+    return [chars[i:i + 8] for i in range(0, len(chars), 8)]
+
+
+def generate_parameter_id() -> str:
     """
-    Determine the appropriate sectionId for a parameter type.
+    Generate a unique 8-character alphanumeric parameter ID for dashboard parameters.
     
-    Args:
-        param_type: Parameter type
-        param_name: Parameter name (unused, kept for compatibility)
-        values_source: Optional values source (unused, kept for compatibility)
-        
     Returns:
-        Appropriate sectionId
+        8-character alphanumeric string
     """
-    return SECTION_ID_MAPPINGS.get(param_type, "string")
+    # Generate 8-character alphanumeric ID (letters and numbers)
+    return _random_parameter_ids(1)[0]
 
 
-def validate_multi_select_compatibility(param_type: str, is_multi_select: Optional[bool]) -> List[str]:
+def generate_parameter_ids(count: int, existing_ids: set) -> List[str]:
     """
-    Validate multi-select compatibility with parameter type.
-    Note: isMultiSelect defaults to True for supported parameter types.
+    Generate a batch of unique parameter IDs that do not collide with existing ones.
     
     Args:
-        param_type: Parameter type
-        is_multi_select: Whether multi-select is enabled (None means use default)
+        count: Number of IDs to generate
+        existing_ids: Set of parameter IDs already in use
         
     Returns:
-        List of validation errors
+        List of `count` distinct 8-character alphanumeric IDs
     """
-    errors = []
-    
-    # Determine actual multi-select setting with defaults
-    if param_type in MULTI_SELECT_SUPPORTED:
-        actual_is_multi_select = is_multi_select if is_multi_select is not None else True
-    else:
-        actual_is_multi_select = is_multi_select if is_multi_select is not None else False
-    
-    # Only validate if multi-select is explicitly enabled for forbidden types
-    if actual_is_multi_select and param_type in MULTI_SELECT_FORBIDDEN:
-        errors.append(f"Multi-select not supported for parameter type '{param_type}'")
-    
-    return errors
+    new_ids = set()
+    while len(new_ids) < count:
+        new_ids.update(_random_parameter_ids(count - len(new_ids)))
+        new_ids -= existing_ids
+    return list(new_ids)
 
 
-def validate_temporal_units(temporal_units: List[str]) -> List[str]:
+def generate_slug(name: str) -> str:
     """
-    Validate temporal units for temporal-unit parameters.
+    Generate a URL-friendly slug from parameter name.
     
     Args:
-        temporal_units: List of temporal units
+        name: Parameter name
         
     Returns:
-        List of validation errors
+        URL-friendly slug
     """
-    errors = []
-    
-    for unit in temporal_units:
-        if unit not in VALID_TEMPORAL_UNITS:
-            errors.append(f"Invalid temporal unit '{unit}'. Valid units: {sorted(VALID_TEMPORAL_UNITS)}")
-    
-    return errors
+    # Convert to lowercase, replace non-alphanumeric with underscores and
+    # remove leading/trailing underscores
+    slug = _SLUG_SEPARATOR_RE.sub('_', name.lower().strip()).strip('_')
+    # Ensure it's not empty
+    return slug or "parameter"
 
 
-def validate_values_source_config(param_config: Dict[str, Any]) -> List[str]:
+def _all_instances(values: List[Any], types: Union[type, Tuple[type, ...]]) -> bool:
+    """Check that every value is an instance of the given type(s), stopping at the first mismatch."""
+    for value in values:
+        if not isinstance(value, types):
+            return False
+    return True
+
+
+def determine_section_id(param_type: str, param_name: str, values_source: Optional[Dict[str, Any]] = None) -> str:
     """
-    Validate values source configuration.
+    Determine the appropriate sectionId for a parameter type.
     
     Args:
-        param_config: Parameter configuration
+        param_type: Parameter type
+        param_name: Parameter name (unused, kept for compatibility)
+        values_source: Optional values source (unused, kept for compatibility)
         
     Returns:
-        List of validation errors
+        Appropriate sectionId
     """
-    errors = []
-    
-    values_source = param_config.get("values_source")
-    if not values_source:
-        return errors
-    
-    source_type = values_source.get("type")
-    
-    if source_type == "static":
-        if "values" not in values_source or not values_source["values"]:
-            errors.append("Static values source requires non-empty 'values' array")
-    elif source_type == "card":
-        if "card_id" not in values_source:
-            errors.append("Card values source requires 'card_id'")
-        if "value_field" not in values_source:
-            errors.append("Card values source requires 'value_field'")
-    
-    return errors
+    return SECTION_ID_MAPPINGS.get(param_type, "string")
 
 
-def validate_default_value_format(param_config: Dict[str, Any]) -> List[str]:
+def _effective_multi_select(param_type: str, is_multi_select: Optional[bool]) -> bool:
+    """Resolve isMultiSelect, which defaults to True only for types that support multi-select."""
+    return is_multi_select if is_multi_select is not None else param_type in MULTI_SELECT_SUPPORTED
+
+
+def _check_number_default(param_type: str, default_value: Any, is_multi_select: bool) -> List[str]:
+    """Check the default value of a number parameter."""
+    if is_multi_select:
+        if not isinstance(default_value, list) or not _all_instances(default_value, _NUMBER_TYPES):
+            return ["Number parameter with multi-select requires array of numbers as default"]
+    elif param_type == "number/between":
+        if not isinstance(default_value, list) or len(default_value) != 2:
+            return ["number/between parameter requires array of two numbers as default"]
+    elif not isinstance(default_value, _NUMBER_TYPES):
+        return ["Number parameter requires numeric default value"]
+    return []
+
+
+def _check_date_default(param_type: str, default_value: Any, is_multi_select: bool) -> List[str]:
+    """Check the default value of a date parameter."""
+    # Date parameters never support multi-select, so default should be string
+    if not isinstance(default_value, str):
+        return ["Date parameter requires string default value"]
+    return []
+
+
+def _check_text_default(param_type: str, default_value: Any, is_multi_select: bool) -> List[str]:
+    """Check the default value of a text or location parameter."""
+    if is_multi_select:
+        if not isinstance(default_value, list):
+            return ["Multi-select parameter default value must be an array"]
+        # For text parameters, require strings
+        if not _all_instances(default_value, str):
+            return ["Text parameter with multi-select requires array of strings as default"]
+    elif not isinstance(default_value, str):
+        # Text parameters require strings
+        return ["Text parameter requires string default value"]
+    return []
+
+
+def _check_id_default(param_type: str, default_value: Any, is_multi_select: bool) -> List[str]:
+    """Check the default value of an ID parameter."""
+    if is_multi_select:
+        if not isinstance(default_value, list):
+            return ["Multi-select parameter default value must be an array"]
+        # For ID parameters, allow mixed string/number arrays
+        if not _all_instances(default_value, _ID_VALUE_TYPES):
+            return ["ID parameter with multi-select requires array of strings or numbers as default"]
+    elif not isinstance(default_value, _ID_VALUE_TYPES):
+        # For single values, ID parameters can be string or number
+        return ["ID parameter requires string or number default value"]
+    return []
+
+
+def _check_temporal_unit_default(param_type: str, default_value: Any, is_multi_select: bool) -> List[str]:
+    """Check the default value of a temporal-unit parameter."""
+    if not isinstance(default_value, str) or default_value not in VALID_TEMPORAL_UNITS:
+        return [f"temporal-unit parameter requires valid temporal unit as default. Valid units: {_VALID_TEMPORAL_UNITS_TEXT}"]
+    return []
+
+
+# Default value check for each parameter type
+_DEFAULT_VALUE_CHECKS = MappingProxyType({
+    **{param_type: _check_number_default for param_type in NUMBER_PARAMETER_TYPES},
+    **{param_type: _check_date_default for param_type in DATE_PARAMETER_TYPES},
+    **{param_type: _check_text_default for param_type in TEXT_PARAMETER_TYPES | LOCATION_PARAMETER_TYPES},
+    "id": _check_id_default,
+    "temporal-unit": _check_temporal_unit_default,
+})
+
+
+def validate_default_value_format(param_config: Dict[str, Any], is_multi_select: Optional[bool] = None) -> List[str]:
     """
     Validate default value format matches parameter type and multi-select setting.
     Note: isMultiSelect defaults to True for supported parameter types.
     
     Args:
         param_config: Parameter configuration
+        is_multi_select: Effective multi-select setting if already resolved by
+            the caller (resolved from param_config when None)
         
     Returns:
         List of validation errors
@@ -267,57 +354,17 @@ def validate_default_value_format(param_config: Dict[str, Any]) -> List[str]:
     
     # Determine if multi-select is enabled
     # For supported types, isMultiSelect defaults to True unless explicitly set to False
-    if param_type in MULTI_SELECT_SUPPORTED:
-        is_multi_select = param_config.get("isMultiSelect", True)  # Default to True
-    else:
-        is_multi_select = param_config.get("isMultiSelect", False)  # Default to False for unsupported types
+    if is_multi_select is None:
+        is_multi_select = _effective_multi_select(param_type, param_config.get("isMultiSelect"))
     
     # For multi-select parameters, default should be an array
     if is_multi_select and not isinstance(default_value, list):
         errors.append(f"Multi-select parameter default value must be an array, got {type(default_value).__name__}")
     
     # Type-specific validation
-    if param_type in NUMBER_PARAMETER_TYPES:
-        if is_multi_select:
-            if not isinstance(default_value, list) or not all(isinstance(v, (int, float)) for v in default_value):
-                errors.append("Number parameter with multi-select requires array of numbers as default")
-        elif param_type == "number/between":
-            if not isinstance(default_value, list) or len(default_value) != 2:
-                errors.append("number/between parameter requires array of two numbers as default")
-        elif not isinstance(default_value, (int, float)):
-            errors.append("Number parameter requires numeric default value")
-    
-    elif param_type in DATE_PARAMETER_TYPES:
-        # Date parameters never support multi-select, so default should be string
-        if not isinstance(default_value, str):
-            errors.append("Date parameter requires string default value")
-    
-    elif param_type in TEXT_PARAMETER_TYPES or param_type in LOCATION_PARAMETER_TYPES or param_type == "id":
-        if is_multi_select:
-            if not isinstance(default_value, list):
-                errors.append("Multi-select parameter default value must be an array")
-            else:
-                # For ID parameters, allow mixed string/number arrays
-                if param_type == "id":
-                    if not all(isinstance(v, (str, int, float)) for v in default_value):
-                        errors.append("ID parameter with multi-select requires array of strings or numbers as default")
-                else:
-                    # For text parameters, require strings
-                    if not all(isinstance(v, str) for v in default_value):
-                        errors.append("Text parameter with multi-select requires array of strings as default")
-        else:
-            # For single values, ID parameters can be string or number
-            if param_type == "id":
-                if not isinstance(default_value, (str, int, float)):
-                    errors.append("ID parameter requires string or number default value")
-            else:
-                # Text parameters require strings
-                if not isinstance(default_value, str):
-                    errors.append("Text parameter requires string default value")
-    
-    elif param_type == "temporal-unit":
-        if not isinstance(default_value, str) or default_value not in VALID_TEMPORAL_UNITS:
-            errors.append(f"temporal-unit parameter requires valid temporal unit as default. Valid units: {sorted(VALID_TEMPORAL_UNITS)}")
+    check_default = _DEFAULT_VALUE_CHECKS.get(param_type)
+    if check_default is not None:
+        errors.extend(check_default(param_type, default_value, is_multi_select))
     
     return errors
 
@@ -328,22 +375,13 @@ def process_static_values(values: List[Any], param_type: str) -> List[List[str]]
     
     Args:
         values: Raw values list
-        param_type: Parameter type
+        param_type: Parameter type (unused, kept for compatibility)
         
     Returns:
         Formatted values as array of arrays
     """
-    formatted_values = []
-    
-    for value in values:
-        if isinstance(value, (int, float)):
-            # Convert numbers to strings for Metabase format
-            formatted_values.append([str(value)])
-        else:
-            # Keep as string
-            formatted_values.append([str(value)])
-    
-    return formatted_values
+    # Metabase expects every value (numbers included) as a single-item string array
+    return [[str(value)] for value in values]
 
 
 def build_values_source_config(param_config: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
@@ -404,13 +442,19 @@ def determine_values_query_type(param_config: Dict[str, Any]) -> str:
     return "none"
 
 
-def process_single_dashboard_parameter(param_config: Dict[str, Any], existing_ids: set) -> Dict[str, Any]:
+def process_single_dashboard_parameter(
+    param_config: Dict[str, Any],
+    existing_ids: set,
+    id_pool: Optional[Iterator[str]] = None
+) -> Dict[str, Any]:
     """
     Process a single dashboard parameter configuration into Metabase API format.
     
     Args:
         param_config: Dashboard parameter configuration
         existing_ids: Set of existing parameter IDs to avoid collisions
+        id_pool: Optional iterator of pre-generated unique IDs to use for
+            parameters without an ID
         
     Returns:
         Processed parameter in Metabase API format
@@ -421,10 +465,13 @@ def process_single_dashboard_parameter(param_config: Dict[str, Any], existing_id
     # Generate ID if not provided
     param_id = param_config.get("id")
     if not param_id:
-        param_id = generate_parameter_id()
-        # Ensure uniqueness
-        while param_id in existing_ids:
+        if id_pool is not None:
+            param_id = next(id_pool)
+        else:
             param_id = generate_parameter_id()
+            # Ensure uniqueness
+            while param_id in existing_ids:
+                param_id = generate_parameter_id()
     
     existing_ids.add(param_id)
     
@@ -438,39 +485,34 @@ def process_single_dashboard_parameter(param_config: Dict[str, Any], existing_id
         actual_param_type = param_type
         section_id = determine_section_id(param_type, param_name, param_config.get("values_source"))
     
-    # Build the processed parameter
-    processed_param = {
-        "id": param_id,
-        "name": param_name,
-        "slug": generate_slug(param_name),
-        "type": actual_param_type,
-        "sectionId": section_id
-    }
-    
-    # Add optional fields
-    if "required" in param_config:
-        processed_param["required"] = param_config["required"]
-    
-    if "default" in param_config and param_config["default"] is not None:
-        processed_param["default"] = param_config["default"]
-    
-    if "isMultiSelect" in param_config:
-        processed_param["isMultiSelect"] = param_config["isMultiSelect"]
-    
-    # Handle temporal units for temporal-unit parameters
-    if param_type == "temporal-unit" and "temporal_units" in param_config:
-        processed_param["temporal_units"] = param_config["temporal_units"]
-    
-    # Handle values source configuration
-    values_query_type = determine_values_query_type(param_config)
-    processed_param["values_query_type"] = values_query_type
-    
-    if values_query_type in ["list", "search"]:
-        values_source_type, values_source_config = build_values_source_config(param_config)
-        if values_source_type is not None:
-            processed_param["values_source_type"] = values_source_type
-        if values_source_config is not None:
-            processed_param["values_source_config"] = values_source_config
+    get = param_config.get
+    
+    # Handle values source configuration (most parameters have none)
+    values_query_type = "none"
+    values_source_type = values_source_config = None
+    if get("values_source"):
+        values_query_type = determine_values_query_type(param_config)
+        if values_query_type in ("list", "search"):
+            values_source_type, values_source_config = build_values_source_config(param_config)
+    
+    # Build the processed parameter in one construction; optional fields
+    # (required, default, isMultiSelect, temporal units for temporal-unit
+    # parameters and the values source) are included only when set
+    fields = (
+        ("id", param_id),
+        ("name", param_name),
+        ("slug", generate_slug(param_name)),
+        ("type", actual_param_type),
+        ("sectionId", section_id),
+        ("required", get("required")),
+        ("default", get("default")),
+        ("isMultiSelect", get("isMultiSelect")),
+        ("temporal_units", get("temporal_units") if param_type == "temporal-unit" else None),
+        ("values_query_type", values_query_type),
+        ("values_source_type", values_source_type),
+        ("values_source_config", values_source_config),
+    )
+    processed_param = {key: value for key, value in fields if value is not None}
     
     return processed_param
 
@@ -485,89 +527,80 @@ def validate_dashboard_parameters(parameters: List[Dict[str, Any]]) -> Tuple[boo
     Returns:
         Tuple of (is_valid, error_messages)
     """
+    # An empty list is always valid; skip the schema and business rules.
+    # Non-list input still goes through schema validation so it is rejected.
+    if isinstance(parameters, list) and not parameters:
+        return True, []
+    
     schema = load_dashboard_parameters_schema()
     if schema is None:
         return False, ["Could not load dashboard parameters schema"]
     
     try:
-        # JSON Schema validation handles most validation automatically
-        jsonschema.validate(parameters, schema)
+        # JSON Schema validation handles most validation automatically; the
+        # compiled validator is the fast path, and every schema violation is
+        # collected only once it rejects the input
+        if _COMPILED_VALIDATOR is not None:
+            _COMPILED_VALIDATOR(parameters)
+        else:
+            schema_errors = _collect_schema_errors(parameters)
+            if schema_errors:
+                return False, schema_errors
         
         # Additional business logic validation
         errors = []
         
-        # Check for duplicate names
+        # Check names and validate each parameter in a single pass
         seen_names = set()
         for i, param in enumerate(parameters):
-            name = param.get("name")
+            get = param.get
+            name = get("name")
+            
+            # Check for duplicate names
             if name and name in seen_names:
                 errors.append(f"Parameter {i}: duplicate name '{name}'")
             elif name:
                 seen_names.add(name)
             
-            # Check for reserved name 'tab'
-            if name == "tab":
-                errors.append(f"Parameter {i}: name 'tab' is reserved and cannot be used")
-        
-        # Validate each parameter individually
-        for i, param in enumerate(parameters):
-            param_name = param.get("name", f"parameter_{i}")
-            param_type = param.get("type")
-            
-            # Multi-select validation
-            is_multi_select = param.get("isMultiSelect")  # Get actual value, could be None
-            multi_select_errors = validate_multi_select_compatibility(param_type, is_multi_select)
-            for error in multi_select_errors:
-                errors.append(f"Parameter {i} ({param_name}): {error}")
+            # Check for reserved names such as 'tab'
+            if name in _RESERVED_PARAMETER_NAMES:
+                errors.append(f"Parameter {i}: name '{name}' is reserved and cannot be used")
             
-            # Temporal units validation
-            if param_type == "temporal-unit":
-                temporal_units = param.get("temporal_units", [])
-                if not temporal_units:
-                    errors.append(f"Parameter {i} ({param_name}): temporal-unit parameter requires non-empty temporal_units array")
-                else:
-                    temporal_errors = validate_temporal_units(temporal_units)
-                    for error in temporal_errors:
-                        errors.append(f"Parameter {i} ({param_name}): {error}")
+            param_name = name if "name" in param else f"parameter_{i}"
+            param_type = get("type")
+            prefix = f"Parameter {i} ({param_name}): "
             
-            # Values source validation
-            values_source_errors = validate_values_source_config(param)
-            for error in values_source_errors:
-                errors.append(f"Parameter {i} ({param_name}): {error}")
+            # Multi-select compatibility, temporal units and values source
+            # requirements are enforced by the schema (see the allOf rules in
+            # dashboard_parameters.json); the rules below depend on the
+            # isMultiSelect default, so they stay in Python
+            effective_multi_select = _effective_multi_select(param_type, get("isMultiSelect"))
             
             # Default value format validation
-            default_errors = validate_default_value_format(param)
-            for error in default_errors:
-                errors.append(f"Parameter {i} ({param_name}): {error}")
+            errors.extend(prefix + error for error in validate_default_value_format(param, effective_multi_select))
             
             # Required parameter validation
-            if param.get("required", False):
-                if "default" not in param or param["default"] is None:
-                    errors.append(f"Parameter {i} ({param_name}): required parameters must have a default value")
+            if get("required", False):
+                default_value = get("default")
+                if default_value is None:
+                    errors.append(prefix + "required parameters must have a default value")
                 else:
                     # Check if default is empty based on multi-select behavior
-                    default_value = param["default"]
-                    
-                    # Determine if this parameter uses multi-select by default
-                    param_is_multi_select = param.get("isMultiSelect")
-                    if param_type in MULTI_SELECT_SUPPORTED:
-                        actual_is_multi_select = param_is_multi_select if param_is_multi_select is not None else True
-                    else:
-                        actual_is_multi_select = param_is_multi_select if param_is_multi_select is not None else False
-                    
-                    if actual_is_multi_select:
+                    if effective_multi_select:
                         if isinstance(default_value, list) and len(default_value) == 0:
-                            errors.append(f"Parameter {i} ({param_name}): required parameters must have a non-empty default value")
+                            errors.append(prefix + "required parameters must have a non-empty default value")
                     else:
                         if isinstance(default_value, str) and default_value == "":
-                            errors.append(f"Parameter {i} ({param_name}): required parameters must have a non-empty default value")
+                            errors.append(prefix + "required parameters must have a non-empty default value")
         
         return len(errors) == 0, errors
         
-    except jsonschema.ValidationError as e:
-        # Provide more helpful error messages
-        error_path = " -> ".join(str(p) for p in e.path) if e.path else "root"
-        return False, [f"Validation error at {error_path}: {e.message}"]
+    except fastjsonschema.JsonSchemaValueException as e:
+        try:
+            schema_errors = _collect_schema_errors(parameters)
+        except Exception:
+            schema_errors = []
+        return False, schema_errors or [f"Validation error: {e.message}"]
     except jsonschema.SchemaError as e:
         return False, [f"Schema error: {e.message}"]
     except Exception as e:
@@ -587,6 +620,8 @@ async def validate_card_references(client, parameters: List[Dict[str, Any]]) ->
     """
     errors = []
     
+    # Collect the parameters that take their values from a card
+    card_params = []
     for i, param in enumerate(parameters):
         values_source = param.get("values_source")
         if not values_source or values_source.get("type") != "card":
@@ -596,14 +631,33 @@ async def validate_card_references(client, parameters: List[Dict[str, Any]]) ->
         if not card_id:
             continue
         
+        card_params.append((i, param, values_source, card_id))
+    
+    # Fetch every distinct referenced card concurrently
+    card_ids = list(dict.fromkeys(card_id for _, _, _, card_id in card_params))
+    results = await asyncio.gather(
+        *(client.auth.make_request("GET", f"card/{card_id}") for card_id in card_ids),
+        return_exceptions=True
+    )
+    card_results = dict(zip(card_ids, results))
+    
+    # Result field names per card (as listed in error messages, and as a set
+    # for lookups), built on first use and shared by every parameter (and
+    # both value and label checks) referencing that card
+    card_field_names: Dict[int, Tuple[List[Optional[str]], frozenset]] = {}
+    
+    for i, param, values_source, card_id in card_params:
         param_name = param.get("name", f"parameter_{i}")
         
+        result = card_results[card_id]
+        if isinstance(result, Exception):
+            errors.append(f"Parameter {i} ({param_name}): Error validating card reference {card_id} - {str(result)}")
+            continue
+        
         try:
-            # Check if the card exists and is accessible
-            data, status, error = await client.auth.make_request(
-                "GET", f"card/{card_id}"
-            )
+            data, status, error = result
             
+            # Check if the card exists and is accessible
             if error:
                 errors.append(f"Parameter {i} ({param_name}): Cannot access card {card_id} for values source - {error}")
                 continue
@@ -613,18 +667,22 @@ async def validate_card_references(client, parameters: List[Dict[str, Any]]) ->
                 errors.append(f"Parameter {i} ({param_name}): Card {card_id} has no result metadata. Run the card first to use it as a values source.")
                 continue
             
+            cached_names = card_field_names.get(card_id)
+            if cached_names is None:
+                field_names = [field.get("name") for field in data["result_metadata"]]
+                cached_names = card_field_names[card_id] = (field_names, frozenset(field_names))
+            field_names, field_name_set = cached_names
+            
             # Check if the specified value_field exists
             value_field = values_source.get("value_field")
             if value_field:
-                field_names = [field.get("name") for field in data.get("result_metadata", [])]
-                if value_field not in field_names:
+                if value_field not in field_name_set:
                     errors.append(f"Parameter {i} ({param_name}): Field '{value_field}' not found in card {card_id}. Available fields: {field_names}")
             
             # Check label_field if specified
             label_field = values_source.get("label_field")
             if label_field:
-                field_names = [field.get("name") for field in data.get("result_metadata", [])]
-                if label_field not in field_names:
+                if label_field not in field_name_set:
                     errors.append(f"Parameter {i} ({param_name}): Label field '{label_field}' not found in card {card_id}. Available fields: {field_names}")
                     
         except Exception as e:
@@ -656,10 +714,14 @@ async def process_dashboard_parameters(client, parameters: List[Dict[str, Any]])
     
     # Process parameters
     processed_parameters = []
-    existing_ids = set()
+    
+    # Reserve the provided IDs first, then generate all missing IDs in one batch
+    existing_ids = {param["id"] for param in parameters if param.get("id")}
+    missing_count = sum(1 for param in parameters if not param.get("id"))
+    id_pool = iter(generate_parameter_ids(missing_count, existing_ids))
     
     for param_config in parameters:
-        processed_param = process_single_dashboard_parameter(param_config, existing_ids)
+        processed_param = process_single_dashboard_parameter(param_config, existing_ids, id_pool)
         processed_parameters.append(processed_param)
     
     return processed_parameters, []
@@ -685,6 +747,19 @@ def validate_dashboard_parameters_helper(parameters: List[Dict[str, Any]]) -> Di
     }
 
 
+@functools.lru_cache(maxsize=1)
+def _build_documentation_response() -> str:
+    """
+    Build the GET_DASHBOARD_PARAMETERS_DOCUMENTATION response JSON once.
+    
+    Only called once the schema is known to load.
+    
+    Returns:
+        Serialized schema
+    """
+    return json_dumps(load_dashboard_parameters_schema(), pretty=True)
+
+
 @mcp.tool(name="GET_DASHBOARD_PARAMETERS_DOCUMENTATION", description="Get complete schema and documentation for dashboard parameters")
 async def get_dashboard_parameters_documentation(ctx: Context) -> str:
     """
@@ -700,9 +775,7 @@ async def get_dashboard_parameters_documentation(ctx: Context) -> str:
     logger.info("Tool called: GET_DASHBOARD_PARAMETERS_DOCUMENTATION()")
     
     try:
-        schema = load_dashboard_parameters_schema()
-        
-        if schema is None:
+        if load_dashboard_parameters_schema() is None:
             return format_error_response(
                 status_code=500,
                 error_type="schema_loading_error",
@@ -710,9 +783,10 @@ async def get_dashboard_parameters_documentation(ctx: Context) -> str:
                 request_info={"schema_file": "dashboard_parameters.json"}
             )
         
-        # Return the schema directly - all documentation is embedded
-        response = json.dumps(schema, indent=2)
+        # The response only depends on the schema, so it is serialized once
+        response = _build_documentation_response()
         
+        # The response is the schema itself - all documentation is embedded
         # Check response size
         metabase_ctx = ctx.request_context.lifespan_context
         config = metabase_ctx.auth.config
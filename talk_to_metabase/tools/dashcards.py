@@ -2,16 +2,20 @@
 Dashboard cards validation tools for Metabase MCP server.
 """
 
-import json
+import asyncio
+import functools
 import logging
+import time
+from datetime import datetime, timezone
 from typing import Dict, List, Tuple, Any, Optional
 
+import fastjsonschema
 import jsonschema
 from mcp.server.fastmcp import Context
 
 from ..server import get_server_instance
-from ..resources import load_dashcards_schema
-from .common import format_error_response, check_response_size
+from ..resources import cached_resource, load_dashcards_schema
+from .common import format_error_response, check_response_size, compile_schema_validator, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,67 @@ mcp = get_server_instance()
 
 # Note: load_dashcards_schema is now imported from resources module
 
+# Keys that may not be set on dashcards (parameter_mappings is allowed but will be processed)
+_FORBIDDEN_KEYS = frozenset({"action_id", "series", "visualization_settings"})
+
+# Fields that must be present on new (negative ID) dashcards
+_REQUIRED_NEW_CARD_FIELDS = frozenset({"card_id", "col", "row", "size_x", "size_y"})
+
+# Fields allowed on dashboard tabs
+_ALLOWED_TAB_FIELDS = frozenset({"id", "name"})
+
+# How long (in seconds) fetched card parameters are reused by
+# get_card_parameters before the card is requested from Metabase again
+CARD_PARAMETERS_CACHE_TTL = 60.0
+
+# Recently fetched card parameters, keyed by card ID and holding the
+# monotonic time at which they were fetched (only successful fetches are kept)
+_CARD_PARAMETERS_CACHE: Dict[int, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Compile the dashcards schema once into a generated validator function;
+# validate_dashcards falls back to jsonschema if compilation is not possible
+try:
+    _dashcards_schema = load_dashcards_schema()
+    _COMPILED_VALIDATOR = (
+        compile_schema_validator(_dashcards_schema) if _dashcards_schema is not None else None
+    )
+except Exception as e:
+    logger.error(f"Could not compile dashcards schema: {e}")
+    _COMPILED_VALIDATOR = None
+
+
+def _validation_timestamp() -> str:
+    """Get the current UTC time as an ISO 8601 string for validation results."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+@cached_resource(maxsize=1)
+def _get_validator() -> Optional[Any]:
+    """Build the jsonschema validator for the dashcards schema once it loads and reuse it."""
+    schema = load_dashcards_schema()
+    if schema is None:
+        return None
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def _collect_schema_errors(dashcards: List[Dict[str, Any]]) -> List[str]:
+    """
+    Collect every schema violation in the dashcards in a single traversal.
+    
+    Args:
+        dashcards: List of dashcard dictionaries
+        
+    Returns:
+        List of validation error messages (empty if the dashcards are valid)
+    """
+    errors = []
+    for error in _get_validator().iter_errors(dashcards):
+        error_path = " -> ".join(map(str, error.absolute_path)) if error.absolute_path else "root"
+        errors.append(f"Validation error at {error_path}: {error.message}")
+    return errors
+
 
 def validate_dashcards(dashcards: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
     """
@@ -32,88 +97,115 @@ def validate_dashcards(dashcards: List[Dict[str, Any]]) -> Tuple[bool, List[str]
     Returns:
         Tuple of (is_valid, error_messages)
     """
+    # An empty list is always valid; skip loading and walking the schema.
+    # Non-list input still goes through schema validation so it is rejected.
+    if isinstance(dashcards, list) and not dashcards:
+        return True, []
+    
     schema = load_dashcards_schema()
     if schema is None:
         return False, ["Could not load dashcards schema"]
     
     try:
-        # First validate against JSON schema
-        jsonschema.validate(dashcards, schema)
+        # First validate against JSON schema; the compiled validator is the
+        # fast path, and all errors are collected only once it rejects the input
+        if _COMPILED_VALIDATOR is not None:
+            _COMPILED_VALIDATOR(dashcards)
+        else:
+            schema_errors = _collect_schema_errors(dashcards)
+            if schema_errors:
+                return False, schema_errors
         
         # Additional validation for business rules
         errors = []
         
-        # Check for forbidden keys (parameter_mappings is now allowed but will be processed)
-        forbidden_keys = {"action_id", "series", "visualization_settings"}
-        
         for i, dashcard in enumerate(dashcards):
+            get = dashcard.get
+            keys = dashcard.keys()
+            
             # Check for forbidden keys
-            for key in forbidden_keys:
-                if key in dashcard:
-                    errors.append(f"Dashcard {i}: forbidden key '{key}' is not allowed")
+            forbidden = _FORBIDDEN_KEYS & keys
+            if forbidden:
+                errors.extend(
+                    f"Dashcard {i}: forbidden key '{key}' is not allowed"
+                    for key in sorted(forbidden)
+                )
             
             # Validate grid boundaries
-            col = dashcard.get("col", 0)
-            size_x = dashcard.get("size_x", 1)
-            if col + size_x > 24:
-                errors.append(f"Dashcard {i}: col ({col}) + size_x ({size_x}) = {col + size_x} exceeds grid width of 24")
+            col = get("col", 0)
+            size_x = get("size_x", 1)
+            right_edge = col + size_x
+            if right_edge > 24:
+                errors.append(f"Dashcard {i}: col ({col}) + size_x ({size_x}) = {right_edge} exceeds grid width of 24")
             
             # Validate negative IDs for new cards
-            card_id = dashcard.get("id")
+            card_id = get("id")
             if card_id is not None and card_id < 0:
                 # This is a new card, make sure all required fields are present
-                required_fields = ["card_id", "col", "row", "size_x", "size_y"]
-                for field in required_fields:
-                    if field not in dashcard:
-                        errors.append(f"Dashcard {i}: missing required field '{field}' for new card")
+                missing = _REQUIRED_NEW_CARD_FIELDS - keys
+                if missing:
+                    errors.extend(
+                        f"Dashcard {i}: missing required field '{field}' for new card"
+                        for field in sorted(missing)
+                    )
         
         if errors:
             return False, errors
             
         return True, []
         
-    except jsonschema.ValidationError as e:
-        return False, [f"Validation error: {e.message}"]
+    except fastjsonschema.JsonSchemaValueException as e:
+        try:
+            schema_errors = _collect_schema_errors(dashcards)
+        except Exception:
+            schema_errors = []
+        return False, schema_errors or [f"Validation error: {e.message}"]
     except jsonschema.SchemaError as e:
         return False, [f"Schema error: {e.message}"]
     except Exception as e:
         return False, [f"Unexpected validation error: {str(e)}"]
 
 
-@mcp.tool(name="GET_DASHCARDS_SCHEMA", description="Get the JSON schema for dashboard cards validation")
-async def get_dashcards_schema(ctx: Context) -> str:
+@functools.lru_cache(maxsize=2)
+def _build_dashcards_schema_response(summary_only: bool) -> str:
     """
-    Get the JSON schema for validating dashboard cards (dashcards) structure.
+    Build the GET_DASHCARDS_SCHEMA response JSON once per variant.
     
-    This tool returns the complete JSON schema used to validate dashcards
-    when updating dashboards with the update_dashboard tool.
+    Only called once the schema is known to load.
     
     Args:
-        ctx: MCP context
+        summary_only: Whether to return only the usage summary without the schema
         
     Returns:
-        JSON schema for dashcards validation
+        Serialized response
     """
-    logger.info("Tool called: GET_DASHCARDS_SCHEMA()")
+    schema = load_dashcards_schema()
     
-    try:
-        schema = load_dashcards_schema()
-        if schema is None:
-            return format_error_response(
-                status_code=500,
-                error_type="schema_loading_error",
-                message="Could not load dashcards JSON schema",
-                request_info={"schema_file": "dashcards.json"}
-            )
-        
+    usage_summary = {
+        "forbidden_keys": sorted(_FORBIDDEN_KEYS),
+        "required_keys": sorted(_REQUIRED_NEW_CARD_FIELDS),
+        "optional_keys": ["id", "dashboard_tab_id", "parameter_mappings"],
+        "grid_constraints": {
+            "col_range": "0-23 (24 columns total)",
+            "size_x_range": "1-24",
+            "col_plus_size_x_max": 24
+        },
+    }
+    
+    if summary_only:
+        response_data = {
+            "success": True,
+            "description": "Summary of the dashboard cards format for the update_dashboard tool",
+            "usage": usage_summary,
+            "note": "Call GET_DASHCARDS_SCHEMA with summary_only=false for the full JSON schema"
+        }
+    else:
         response_data = {
             "success": True,
             "schema": schema,
             "description": "JSON schema for validating dashboard cards in update_dashboard tool",
             "usage": {
-                "forbidden_keys": ["action_id", "series", "visualization_settings"],
-                "required_keys": ["card_id", "col", "row", "size_x", "size_y"],
-                "optional_keys": ["id", "dashboard_tab_id", "parameter_mappings"],
+                **usage_summary,
                 "parameter_mappings": {
                     "description": "Optional array to connect dashboard parameters to card parameters by name",
                     "format": [
@@ -123,17 +215,43 @@ async def get_dashcards_schema(ctx: Context) -> str:
                         }
                     ]
                 },
-                "grid_constraints": {
-                    "col_range": "0-23 (24 columns total)",
-                    "size_x_range": "1-24",
-                    "col_plus_size_x_max": 24
-                },
                 "id_convention": "Use existing ID for updating, negative values (-1, -2, -3) for new cards"
             }
         }
+    
+    return json_dumps(response_data)
+
+
+@mcp.tool(name="GET_DASHCARDS_SCHEMA", description="Get the JSON schema for dashboard cards validation")
+async def get_dashcards_schema(ctx: Context, summary_only: bool = False) -> str:
+    """
+    Get the JSON schema for validating dashboard cards (dashcards) structure.
+    
+    This tool returns the complete JSON schema used to validate dashcards
+    when updating dashboards with the update_dashboard tool. With
+    summary_only, only the required/optional/forbidden keys and grid
+    constraints are returned, which is usually enough to build dashcards.
+    
+    Args:
+        ctx: MCP context
+        summary_only: Return only the usage summary without the full schema (default: False)
         
-        # Convert to JSON string
-        response = json.dumps(response_data, indent=2)
+    Returns:
+        JSON schema for dashcards validation
+    """
+    logger.info(f"Tool called: GET_DASHCARDS_SCHEMA(summary_only={summary_only})")
+    
+    try:
+        if load_dashcards_schema() is None:
+            return format_error_response(
+                status_code=500,
+                error_type="schema_loading_error",
+                message="Could not load dashcards JSON schema",
+                request_info={"schema_file": "dashcards.json"}
+            )
+        
+        # The response only depends on the schema, so it is built once per variant
+        response = _build_dashcards_schema_response(summary_only)
         
         # Check response size
         metabase_ctx = ctx.request_context.lifespan_context
@@ -166,7 +284,7 @@ def validate_dashcards_helper(dashcards: List[Dict[str, Any]]) -> Dict[str, Any]
         "valid": is_valid,
         "errors": errors,
         "dashcards_count": len(dashcards) if dashcards else 0,
-        "validation_timestamp": "2025-06-06T00:00:00Z"  # Current timestamp would be better in real implementation
+        "validation_timestamp": _validation_timestamp()
     }
 
 
@@ -180,6 +298,9 @@ def validate_tabs(tabs: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, error_messages)
     """
+    if not tabs:
+        return True, []
+    
     errors = []
     
     for i, tab in enumerate(tabs):
@@ -197,10 +318,10 @@ def validate_tabs(tabs: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
                 errors.append(f"Tab {i}: 'id' must be an integer")
         
         # Check for unexpected fields
-        allowed_fields = {"id", "name"}
-        for key in tab.keys():
-            if key not in allowed_fields:
-                errors.append(f"Tab {i}: unexpected field '{key}'. Only 'id' and 'name' are allowed")
+        errors.extend(
+            f"Tab {i}: unexpected field '{key}'. Only 'id' and 'name' are allowed"
+            for key in sorted(tab.keys() - _ALLOWED_TAB_FIELDS)
+        )
     
     return len(errors) == 0, errors
 
@@ -221,7 +342,7 @@ def validate_tabs_helper(tabs: List[Dict[str, Any]]) -> Dict[str, Any]:
         "valid": is_valid,
         "errors": errors,
         "tabs_count": len(tabs) if tabs else 0,
-        "validation_timestamp": "2025-06-06T00:00:00Z"
+        "validation_timestamp": _validation_timestamp()
     }
 
 
@@ -249,18 +370,28 @@ async def process_parameter_mappings(
     # Create lookup dictionaries for parameters
     dashboard_param_by_name = {param["name"]: param for param in dashboard_parameters}
     
+    # Build card parameter lookups once per card rather than once per dashcard
+    # (parameters can be referenced by name or by slug)
+    card_param_by_name_by_card = {}
+    card_param_by_slug_by_card = {}
+    for card_id, card_parameters in card_parameters_by_card.items():
+        by_name = card_param_by_name_by_card[card_id] = {}
+        by_slug = card_param_by_slug_by_card[card_id] = {}
+        for param in card_parameters:
+            if "name" in param:
+                by_name[param["name"]] = param
+            if "slug" in param:
+                by_slug[param["slug"]] = param
+    
     for i, dashcard in enumerate(dashcards):
-        processed_dashcard = dashcard.copy()
+        processed_dashcard = dashcard
         card_id = dashcard["card_id"]
         
         # Process parameter mappings if present
         if "parameter_mappings" in dashcard and dashcard["parameter_mappings"]:
-            # Get card parameters for this card
-            card_parameters = card_parameters_by_card.get(card_id, [])
-            card_param_by_name = {param.get("name", ""): param for param in card_parameters if "name" in param}
-            
-            # Also check for slug-based mapping (parameters can be referenced by slug)
-            card_param_by_slug = {param.get("slug", ""): param for param in card_parameters if "slug" in param}
+            # Get card parameter lookups for this card
+            card_param_by_name = card_param_by_name_by_card.get(card_id, {})
+            card_param_by_slug = card_param_by_slug_by_card.get(card_id, {})
             
             metabase_parameter_mappings = []
             
@@ -293,8 +424,8 @@ async def process_parameter_mappings(
                 
                 metabase_parameter_mappings.append(metabase_mapping)
             
-            # Replace name-based mappings with ID-based mappings
-            processed_dashcard["parameter_mappings"] = metabase_parameter_mappings
+            # Replace name-based mappings with ID-based mappings without mutating the input
+            processed_dashcard = {**dashcard, "parameter_mappings": metabase_parameter_mappings}
         
         processed_dashcards.append(processed_dashcard)
     
@@ -303,7 +434,7 @@ async def process_parameter_mappings(
 
 async def get_card_parameters(client, card_id: int) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
-    Get parameters for a specific card.
+    Get parameters for a specific card, reusing a recent fetch if available.
     
     Args:
         client: Metabase client
@@ -312,6 +443,11 @@ async def get_card_parameters(client, card_id: int) -> Tuple[List[Dict[str, Any]
     Returns:
         Tuple of (parameters_list, error_message)
     """
+    now = time.monotonic()
+    cached = _CARD_PARAMETERS_CACHE.get(card_id)
+    if cached is not None and now - cached[0] < CARD_PARAMETERS_CACHE_TTL:
+        return cached[1], None
+    
     try:
         # Get card definition
         data, status, error = await client.auth.make_request(
@@ -323,12 +459,26 @@ async def get_card_parameters(client, card_id: int) -> Tuple[List[Dict[str, Any]
         
         # Extract parameters from card
         parameters = data.get("parameters", [])
+        
+        # Drop expired entries so the cache does not grow without bound
+        for expired_id in [
+            key for key, (fetched_at, _) in _CARD_PARAMETERS_CACHE.items()
+            if now - fetched_at >= CARD_PARAMETERS_CACHE_TTL
+        ]:
+            del _CARD_PARAMETERS_CACHE[expired_id]
+        
+        _CARD_PARAMETERS_CACHE[card_id] = (time.monotonic(), parameters)
         return parameters, None
         
     except Exception as e:
         return [], f"Error getting parameters for card {card_id}: {str(e)}"
 
 
+def invalidate_card_parameters_cache(card_id: int) -> None:
+    """Forget any cached parameters of a card after it has been modified."""
+    _CARD_PARAMETERS_CACHE.pop(card_id, None)
+
+
 async def validate_parameter_mappings(
     client,
     dashcards: List[Dict[str, Any]],
@@ -347,24 +497,38 @@ async def validate_parameter_mappings(
     """
     errors = []
     card_parameters_by_card = {}
+    card_errors = {}
     dashboard_param_names = {param["name"] for param in dashboard_parameters}
     
+    # Fetch parameters for every distinct mapped card concurrently
+    card_ids = list(dict.fromkeys(
+        dashcard["card_id"] for dashcard in dashcards if dashcard.get("parameter_mappings")
+    ))
+    results = await asyncio.gather(*(get_card_parameters(client, card_id) for card_id in card_ids))
+    card_identifiers_by_card = {}
+    for card_id, (card_parameters, error) in zip(card_ids, results):
+        if error:
+            card_errors[card_id] = error
+        else:
+            card_parameters_by_card[card_id] = card_parameters
+            # Card parameters can be referenced by name or by slug
+            identifiers = card_identifiers_by_card[card_id] = set()
+            for param in card_parameters:
+                if "name" in param:
+                    identifiers.add(param["name"])
+                if "slug" in param:
+                    identifiers.add(param["slug"])
+    
     for i, dashcard in enumerate(dashcards):
         card_id = dashcard["card_id"]
         
-        # Get card parameters if this card has parameter mappings
+        # Validate mappings against the fetched card parameters
         if "parameter_mappings" in dashcard and dashcard["parameter_mappings"]:
-            if card_id not in card_parameters_by_card:
-                card_parameters, error = await get_card_parameters(client, card_id)
-                if error:
-                    errors.append(f"Dashcard {i}: {error}")
-                    continue
-                card_parameters_by_card[card_id] = card_parameters
+            if card_id in card_errors:
+                errors.append(f"Dashcard {i}: {card_errors[card_id]}")
+                continue
             
-            card_parameters = card_parameters_by_card[card_id]
-            card_param_names = {param.get("name", "") for param in card_parameters if "name" in param}
-            card_param_slugs = {param.get("slug", "") for param in card_parameters if "slug" in param}
-            card_param_identifiers = card_param_names.union(card_param_slugs)
+            card_param_identifiers = card_identifiers_by_card[card_id]
             
             # Validate each mapping
             for j, mapping in enumerate(dashcard["parameter_mappings"]):
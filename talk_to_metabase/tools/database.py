@@ -2,18 +2,33 @@
 Database & Table operations MCP tools.
 """
 
-import json
 import logging
+from collections import defaultdict
 from typing import Dict, List, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..server import get_server_instance
-from .common import format_error_response, get_metabase_client, check_response_size
+from .common import (
+    format_error_response, get_metabase_client, check_response_size, json_dumps,
+    min_json_object_size, format_size_exceeded_response
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Base types reported in the date_fields summary of get_table_query_metadata
+_DATE_BASE_TYPES = frozenset({"type/Date", "type/DateTime", "type/DateTimeWithLocalTZ", "type/Time"})
+
+# Keys kept for each field in get_table_query_metadata
+_FIELD_INFO_KEYS = (
+    "id", "name", "display_name", "base_type", "effective_type", "semantic_type",
+    "database_type", "active", "visibility_type", "has_field_values", "position"
+)
+
+# Lower bound on the serialized size of one field entry, including the list separator
+_FIELD_INFO_MIN_SIZE = min_json_object_size(_FIELD_INFO_KEYS) + 1
+
 # Register tools with the server
 mcp = get_server_instance()
 logger.info("Registering database tools with the server...")
@@ -61,15 +76,11 @@ async def list_databases(ctx: Context) -> str:
                 request_info={"endpoint": "/api/database", "method": "GET"}
             )
         
-        # Create simplified database entries
-        simplified_databases = []
-        for db in databases:
-            simplified_db = {
-                "id": db.get("id"),
-                "name": db.get("name"),
-                "engine": db.get("engine")
-            }
-            simplified_databases.append(simplified_db)
+        # Create simplified database entries (keys may be missing, so use get)
+        simplified_databases = [
+            {"id": db.get("id"), "name": db.get("name"), "engine": db.get("engine")}
+            for db in databases
+        ]
         
         # Create final response
         response_data = {
@@ -77,7 +88,7 @@ async def list_databases(ctx: Context) -> str:
         }
         
         # Convert to JSON string
-        response = json.dumps(response_data, indent=2)
+        response = json_dumps(response_data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -133,22 +144,14 @@ async def get_database_metadata(id: int, ctx: Context) -> str:
         }
         
         # Extract table information, organized by schema
-        tables_by_schema = {}
+        tables_by_schema = defaultdict(list)
         for table in data.get("tables", []):
-            schema_name = table.get("schema", "")
-            
-            # Create a simplified table entry without redundant schema field
-            table_entry = {
+            # Add a simplified table entry without redundant schema field to its schema group
+            tables_by_schema[table.get("schema", "")].append({
                 "id": table.get("id"),
                 "name": table.get("name"),
                 "entity_type": table.get("entity_type")
-            }
-            
-            # Add to the appropriate schema group
-            if schema_name not in tables_by_schema:
-                tables_by_schema[schema_name] = []
-            
-            tables_by_schema[schema_name].append(table_entry)
+            })
         
         # Create final response structure
         response_data = {
@@ -164,7 +167,7 @@ async def get_database_metadata(id: int, ctx: Context) -> str:
         response_data["schema_count"] = len(tables_by_schema)
         
         # Convert to JSON string
-        response = json.dumps(response_data, indent=2)
+        response = json_dumps(response_data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -246,41 +249,54 @@ async def get_table_query_metadata(
             "timezone": db_data.get("timezone")
         }
         
+        raw_fields = data.get("fields", [])
+        
+        # Reject tables whose field list alone cannot fit before building and serializing it
+        metabase_ctx = ctx.request_context.lifespan_context
+        config = metabase_ctx.auth.config
+        min_size = len(raw_fields) * _FIELD_INFO_MIN_SIZE
+        if min_size > config.response_size_limit:
+            logger.warning(f"Estimated response size ({min_size}) exceeds limit ({config.response_size_limit})")
+            return format_size_exceeded_response(min_size, config.response_size_limit, estimated=True)
+        
         # Process fields with essential information only
         fields = []
         primary_key_fields = []
         date_fields = []
+        add_field = fields.append
+        add_primary_key = primary_key_fields.append
+        add_date_field = date_fields.append
         
-        for field in data.get("fields", []):
-            # Extract ONLY essential field information
-            field_info = {
-                "id": field.get("id"),
-                "name": field.get("name"),
-                "display_name": field.get("display_name"),
-                "base_type": field.get("base_type"),
-                "effective_type": field.get("effective_type"),
-                "semantic_type": field.get("semantic_type"),
-                "database_type": field.get("database_type"),
-                "active": field.get("active"),
-                "visibility_type": field.get("visibility_type"),
-                "has_field_values": field.get("has_field_values"),
-                "position": field.get("position")
-            }
+        # Sort fields by position up front so they are collected in final order
+        sorted_fields = sorted(raw_fields, key=lambda f: f.get("position") or 0)
+        
+        for field in sorted_fields:
+            get = field.get
+            name = get("name")
+            semantic_type = get("semantic_type")
+            base_type = get("base_type")
             
-            fields.append(field_info)
+            # Extract ONLY essential field information
+            add_field({
+                "id": get("id"),
+                "name": name,
+                "display_name": get("display_name"),
+                "base_type": base_type,
+                "effective_type": get("effective_type"),
+                "semantic_type": semantic_type,
+                "database_type": get("database_type"),
+                "active": get("active"),
+                "visibility_type": get("visibility_type"),
+                "has_field_values": get("has_field_values"),
+                "position": get("position")
+            })
             
             # Categorize special field types for summary
-            semantic_type = field.get("semantic_type")
-            base_type = field.get("base_type")
-            
             if semantic_type == "type/PK":
-                primary_key_fields.append(field.get("name"))
+                add_primary_key(name)
             
-            if base_type in ["type/Date", "type/DateTime", "type/DateTimeWithLocalTZ", "type/Time"]:
-                date_fields.append(field.get("name"))
-        
-        # Sort fields by position for consistent ordering
-        fields.sort(key=lambda f: f.get("position", 0))
+            if base_type in _DATE_BASE_TYPES:
+                add_date_field(name)
         
         # Create final response structure
         response_data = {
@@ -293,11 +309,9 @@ async def get_table_query_metadata(
         }
         
         # Convert to JSON string
-        response = json.dumps(response_data, indent=2)
+        response = json_dumps(response_data)
         
         # Check response size before returning
-        metabase_ctx = ctx.request_context.lifespan_context
-        config = metabase_ctx.auth.config
         return check_response_size(response, config)
     except Exception as e:
         logger.error(f"Error getting table query metadata: {e}")
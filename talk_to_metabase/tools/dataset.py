@@ -2,14 +2,13 @@
 Dataset query operations MCP tools.
 """
 
-import json
 import logging
 from typing import Dict, Optional, Any
 
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..server import get_server_instance
-from .common import format_error_response, get_metabase_client, check_response_size
+from .common import format_error_response, get_metabase_client, check_response_size, json_dumps
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -60,7 +59,7 @@ async def run_dataset_query(
             request_info={"database": database, "type": type}
         )
     
-    if type not in ["native", "query"]:
+    if type not in ("native", "query"):
         return format_error_response(
             status_code=400,
             error_type="invalid_parameter",
@@ -127,7 +126,7 @@ async def run_dataset_query(
             logger.error(f"Query failed with error: {data.get('error')}")
         
         # Convert to JSON string
-        response = json.dumps(essential_data, indent=2)
+        response = json_dumps(essential_data)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
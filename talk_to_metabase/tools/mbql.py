@@ -2,30 +2,73 @@
 MBQL (Metabase Query Language) schema and validation tools.
 """
 
-import json
+import functools
+import itertools
 import logging
 from typing import Dict, List, Tuple, Any, Optional
 
+import fastjsonschema
 import jsonschema
 from mcp.server.fastmcp import Context
 
 from ..server import get_server_instance
-from ..resources import load_json_resource
-from .common import format_error_response, check_response_size
+from ..resources import cached_resource, load_json_resource
+from .common import format_error_response, check_response_size, compile_schema_validator, json_dumps
 
 logger = logging.getLogger(__name__)
 
 # Register tools with the server
 mcp = get_server_instance()
 
+@cached_resource(maxsize=1)
 def load_mbql_schema() -> Optional[Dict[str, Any]]:
-    """Load MBQL JSON schema."""
+    """Load MBQL JSON schema (parsed once and cached; do not mutate)."""
     try:
         return load_json_resource("schemas/mbql_schema.json")
     except Exception as e:
         logger.error(f"Error loading MBQL schema: {e}")
         return None
 
+@cached_resource(maxsize=1)
+def _get_validator() -> Optional[Any]:
+    """Build the jsonschema validator for the MBQL schema once it loads and reuse it."""
+    schema = load_mbql_schema()
+    if schema is None:
+        return None
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+# Maximum number of schema violations reported for a single validation call
+MAX_SCHEMA_ERRORS = 20
+
+# Compile the MBQL schema once into a generated validator function;
+# validate_mbql_query falls back to jsonschema if compilation is not possible
+try:
+    _mbql_schema = load_mbql_schema()
+    _COMPILED_VALIDATOR = compile_schema_validator(_mbql_schema) if _mbql_schema is not None else None
+except Exception as e:
+    logger.error(f"Could not compile MBQL schema: {e}")
+    _COMPILED_VALIDATOR = None
+
+def _collect_schema_errors(query: Dict[str, Any]) -> List[str]:
+    """
+    Collect the schema violations in an MBQL query in a single traversal.
+    
+    Traversal stops once MAX_SCHEMA_ERRORS violations have been found.
+    
+    Args:
+        query: MBQL query dictionary
+        
+    Returns:
+        List of validation error messages (empty if the query is valid)
+    """
+    errors = []
+    for error in itertools.islice(_get_validator().iter_errors(query), MAX_SCHEMA_ERRORS):
+        error_path = " -> ".join(map(str, error.absolute_path)) if error.absolute_path else "root"
+        errors.append(f"Validation error at {error_path}: {error.message}")
+    return errors
+
 def validate_mbql_query(query: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate MBQL query against the JSON schema.
@@ -41,11 +84,19 @@ def validate_mbql_query(query: Dict[str, Any]) -> Tuple[bool, List[str]]:
         return False, ["Could not load MBQL schema"]
     
     try:
-        jsonschema.validate(query, schema)
-        return True, []
-    except jsonschema.ValidationError as e:
-        error_path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
-        return False, [f"Validation error at {error_path}: {e.message}"]
+        # The compiled validator is the fast path; every schema violation is
+        # collected only once it rejects the query
+        if _COMPILED_VALIDATOR is not None:
+            _COMPILED_VALIDATOR(query)
+            return True, []
+        schema_errors = _collect_schema_errors(query)
+        return len(schema_errors) == 0, schema_errors
+    except fastjsonschema.JsonSchemaValueException as e:
+        try:
+            schema_errors = _collect_schema_errors(query)
+        except Exception:
+            schema_errors = []
+        return False, schema_errors or [f"Validation error: {e.message}"]
     except jsonschema.SchemaError as e:
         return False, [f"Schema error: {e.message}"]
     except Exception as e:
@@ -70,6 +121,18 @@ def validate_mbql_query_helper(query: Dict[str, Any]) -> Dict[str, Any]:
         "validation_timestamp": "2025-01-03T00:00:00Z"
     }
 
+@functools.lru_cache(maxsize=1)
+def _build_schema_response() -> str:
+    """
+    Build the GET_MBQL_SCHEMA response JSON once.
+    
+    Only called once the schema is known to load.
+    
+    Returns:
+        Serialized schema
+    """
+    return json_dumps(load_mbql_schema(), pretty=True)
+
 @mcp.tool(name="GET_MBQL_SCHEMA", description="IMPORTANT: Get comprehensive MBQL query schema - Call before creating/editing MBQL queries")
 async def get_mbql_schema(ctx: Context) -> str:
     """
@@ -105,8 +168,7 @@ async def get_mbql_schema(ctx: Context) -> str:
     logger.info("Tool called: GET_MBQL_SCHEMA()")
     
     try:
-        schema = load_mbql_schema()
-        if schema is None:
+        if load_mbql_schema() is None:
             return format_error_response(
                 status_code=500,
                 error_type="schema_load_error",
@@ -114,8 +176,8 @@ async def get_mbql_schema(ctx: Context) -> str:
                 request_info={"tool": "GET_MBQL_SCHEMA"}
             )
         
-        # Convert to JSON string
-        response = json.dumps(schema, indent=2)
+        # The schema never changes at runtime, so it is serialized once
+        response = _build_schema_response()
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
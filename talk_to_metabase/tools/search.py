@@ -9,7 +9,7 @@ from typing import Dict, List, Optional, Any
 from mcp.server.fastmcp import Context, FastMCP
 
 from ..server import get_server_instance
-from .common import format_error_response, get_metabase_client, check_response_size
+from .common import format_error_response, get_metabase_client, check_response_size, json_dumps
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -118,7 +118,7 @@ async def search_resources(
         logger.info(f"Total results across all pages: {result['pagination']['total_count']}")
         
         # Convert data to JSON string
-        response = json.dumps(result, indent=2)
+        response = json_dumps(result)
         
         # Check response size before returning
         metabase_ctx = ctx.request_context.lifespan_context
@@ -2,16 +2,18 @@
 Visualization documentation and validation tools for Metabase MCP server.
 """
 
-import json
+import functools
+import itertools
 import logging
 from typing import Dict, List, Tuple, Any, Optional
 
+import fastjsonschema
 import jsonschema
 from mcp.server.fastmcp import Context
 
 from ..server import get_server_instance
-from ..resources import load_visualization_schema, load_visualization_docs
-from .common import format_error_response, check_response_size
+from ..resources import cached_resource, load_visualization_schema, load_visualization_docs
+from .common import format_error_response, check_response_size, compile_schema_validator, json_dumps
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +61,72 @@ def load_documentation(chart_type: str) -> Optional[str]:
         logger.error(f"Error loading documentation for {chart_type}: {e}")
         return None
 
+@cached_resource(maxsize=len(SUPPORTED_CHART_TYPES))
+def _get_validator(api_chart_type: str) -> Optional[Any]:
+    """Build the jsonschema validator for a chart type's schema once it loads and reuse it."""
+    schema = load_schema(api_chart_type)
+    if schema is None:
+        return None
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+class _SchemaUnavailable(Exception):
+    """Raised inside _compile_validator so that failed schema loads are not cached."""
+
+@functools.lru_cache(maxsize=len(SUPPORTED_CHART_TYPES))
+def _compile_validator(api_chart_type: str) -> Optional[Any]:
+    """Compile a chart type's schema, caching the validator or a compilation failure."""
+    schema = load_schema(api_chart_type)
+    if schema is None:
+        raise _SchemaUnavailable(api_chart_type)
+    try:
+        return compile_schema_validator(schema)
+    except Exception as e:
+        logger.error(f"Could not compile visualization schema for {api_chart_type}: {e}")
+        return None
+
+def _get_compiled_validator(api_chart_type: str) -> Optional[Any]:
+    """
+    Compile a chart type's schema into a generated validator function on first use.
+    
+    Schemas are compiled lazily, since compiling every chart type at import
+    would slow down server startup. A schema that fails to load is retried
+    on the next call, while a schema that cannot be compiled is not.
+    
+    Args:
+        api_chart_type: API name of the chart type
+        
+    Returns:
+        Compiled validator, or None if the schema could not be loaded or compiled
+    """
+    try:
+        return _compile_validator(api_chart_type)
+    except _SchemaUnavailable:
+        return None
+
+# Maximum number of schema violations reported for a single validation call
+MAX_SCHEMA_ERRORS = 20
+
+def _collect_schema_errors(validator: Any, settings: Dict[str, Any]) -> List[str]:
+    """
+    Collect the schema violations in visualization settings in a single traversal.
+    
+    Traversal stops once MAX_SCHEMA_ERRORS violations have been found.
+    
+    Args:
+        validator: jsonschema validator for the chart type
+        settings: Visualization settings dictionary
+        
+    Returns:
+        List of validation error messages (empty if the settings are valid)
+    """
+    errors = []
+    for error in itertools.islice(validator.iter_errors(settings), MAX_SCHEMA_ERRORS):
+        error_path = " -> ".join(map(str, error.absolute_path)) if error.absolute_path else "root"
+        errors.append(f"Validation error at {error_path}: {error.message}")
+    return errors
+
 def validate_visualization_settings(chart_type: str, settings: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate visualization settings against the JSON schema.
@@ -77,20 +145,69 @@ def validate_visualization_settings(chart_type: str, settings: Dict[str, Any]) -
         supported_types = SUPPORTED_CHART_TYPES + list(UI_TO_API_MAPPING.keys())
         return False, [f"Unsupported chart type: {chart_type}. Supported types: {', '.join(supported_types)}"]
     
-    schema = load_schema(api_chart_type)
-    if schema is None:
-        return False, [f"Could not load schema for chart type: {chart_type}"]
-    
     try:
-        jsonschema.validate(settings, schema)
-        return True, []
-    except jsonschema.ValidationError as e:
-        return False, [f"Validation error: {e.message}"]
+        # The compiled validator is the fast path; every schema violation is
+        # collected only once it rejects the settings
+        compiled_validator = _get_compiled_validator(api_chart_type)
+        if compiled_validator is not None:
+            try:
+                compiled_validator(settings)
+                return True, []
+            except fastjsonschema.JsonSchemaValueException as e:
+                errors = _collect_schema_errors(_get_validator(api_chart_type), settings)
+                return False, errors or [f"Validation error: {e.message}"]
+        
+        validator = _get_validator(api_chart_type)
+        if validator is None:
+            return False, [f"Could not load schema for chart type: {chart_type}"]
+        
+        errors = _collect_schema_errors(validator, settings)
+        return len(errors) == 0, errors
     except jsonschema.SchemaError as e:
         return False, [f"Schema error: {e.message}"]
     except Exception as e:
         return False, [f"Unexpected validation error: {str(e)}"]
 
+@functools.lru_cache(maxsize=len(SUPPORTED_CHART_TYPES) + len(UI_TO_API_MAPPING))
+def _build_documentation_response(chart_type: str) -> str:
+    """
+    Build the GET_VISUALIZATION_DOCUMENT response JSON once per chart type.
+    
+    Only called for supported chart types whose schema and documentation
+    are known to load.
+    
+    Args:
+        chart_type: Type of chart (UI name or API name)
+        
+    Returns:
+        Serialized documentation response
+    """
+    api_chart_type = UI_TO_API_MAPPING.get(chart_type, chart_type)
+    documentation = load_documentation(chart_type)
+    schema = load_schema(chart_type)
+    
+    # Extract examples from schema
+    examples = schema.get("examples", [])
+    
+    # Create response
+    ui_name = API_TO_UI_MAPPING.get(api_chart_type, api_chart_type)
+    response_data = {
+        "success": True,
+        "chart_type": chart_type,
+        "api_name": api_chart_type,
+        "ui_name": ui_name,
+        "documentation": documentation,
+        "json_schema": schema,
+        "examples": examples,
+        "validation_info": {
+            "use_validate_visualization_settings": "Call validate_visualization_settings() before using settings in create_card or update_card",
+            "supported_properties": list(schema.get("properties", {}).keys()) if "properties" in schema else [],
+            "note": f"This chart type uses API name '{api_chart_type}' and UI name '{ui_name}'"
+        }
+    }
+    
+    return json_dumps(response_data, pretty=True)
+
 @mcp.tool(name="GET_VISUALIZATION_DOCUMENT", description="IMPORTANT: Get visualization settings documentation - Call before creating/editing card visualization settings")
 async def get_visualization_document(chart_type: str, ctx: Context) -> str:
     """
@@ -167,30 +284,10 @@ async def get_visualization_document(chart_type: str, ctx: Context) -> str:
                 request_info={"chart_type": chart_type}
             )
         
-        # Extract examples from schema
-        examples = schema.get("examples", [])
-        
-        # Create response
-        ui_name = API_TO_UI_MAPPING.get(api_chart_type, api_chart_type)
-        response_data = {
-            "success": True,
-            "chart_type": chart_type,
-            "api_name": api_chart_type,
-            "ui_name": ui_name,
-            "documentation": documentation,
-            "json_schema": schema,
-            "examples": examples,
-            "validation_info": {
-                "use_validate_visualization_settings": "Call validate_visualization_settings() before using settings in create_card or update_card",
-                "supported_properties": list(schema.get("properties", {}).keys()) if "properties" in schema else [],
-                "note": f"This chart type uses API name '{api_chart_type}' and UI name '{ui_name}'"
-            }
-        }
-        
         logger.info(f"Documentation provided successfully for chart type: {chart_type}")
         
-        # Convert to JSON string
-        response = json.dumps(response_data, indent=2)
+        # The response only depends on the chart type, so it is built once per chart type
+        response = _build_documentation_response(chart_type)
         
         # Check response size
         metabase_ctx = ctx.request_context.lifespan_context
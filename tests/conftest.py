@@ -15,6 +15,20 @@ from talk_to_metabase.config import MetabaseConfig
 from talk_to_metabase.server import MetabaseContext
 
 
+@pytest.fixture(autouse=True)
+def clear_dashboard_caches():
+    """Clear the dashboard, dashboard tab index, card parameter and table field caches between tests."""
+    from talk_to_metabase.tools.dashboard import _DASHBOARD_CACHE, _TAB_INDEX_CACHE
+    from talk_to_metabase.tools.dashcards import _CARD_PARAMETERS_CACHE
+    from talk_to_metabase.tools.card_parameters.core import _TABLE_FIELDS_CACHE
+    caches = (_DASHBOARD_CACHE, _TAB_INDEX_CACHE, _CARD_PARAMETERS_CACHE, _TABLE_FIELDS_CACHE)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 @pytest.fixture
 def config():
     """Create a test configuration."""
@@ -0,0 +1,367 @@
+"""
+Tests for card parameters validation and processing.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from talk_to_metabase.tools.card_parameters import core as card_parameters_module
+from talk_to_metabase.tools.card_parameters.core import (
+    apply_values_source_config,
+    create_template_tag,
+    extract_sql_parameters,
+    format_default_value,
+    generate_parameter_id,
+    generate_parameter_ids,
+    generate_slug,
+    process_card_parameters,
+    process_single_parameter,
+    validate_card_parameters,
+    validate_field_references,
+    validate_sql_parameter_consistency,
+    widget_compatibility_error,
+)
+
+
+def test_validate_card_parameters_valid():
+    """Test that well-formed parameters pass validation."""
+    parameters = [
+        {"name": "status", "type": "category", "default": "active"},
+        {"name": "created", "type": "date/single"},
+    ]
+    
+    is_valid, errors = validate_card_parameters(parameters)
+    
+    assert is_valid is True
+    assert errors == []
+
+
+def test_validate_card_parameters_uses_compiled_validator():
+    """Test that valid parameters are accepted by the compiled validator alone."""
+    assert card_parameters_module._COMPILED_VALIDATOR is not None
+    
+    with patch.object(card_parameters_module, "_collect_schema_errors") as collect:
+        is_valid, errors = validate_card_parameters([{"name": "status", "type": "category"}])
+    
+    assert is_valid is True
+    assert errors == []
+    collect.assert_not_called()
+
+
+def test_validate_card_parameters_reports_all_schema_errors():
+    """Test that every schema violation is reported with its location."""
+    parameters = [
+        {"name": "status", "type": "unknown"},
+        {"name": "amount", "type": "number/=", "required": "yes"},
+    ]
+    
+    is_valid, errors = validate_card_parameters(parameters)
+    
+    assert is_valid is False
+    assert any(error.startswith("Validation error at 0 -> type:") for error in errors)
+    assert "Validation error at 1 -> required: 'yes' is not of type 'boolean'" in errors
+
+
+def test_validate_card_parameters_caps_schema_errors():
+    """Test that schema errors stop being collected after MAX_SCHEMA_ERRORS."""
+    parameters = [{"name": f"p{i}", "type": "unknown"} for i in range(50)]
+    
+    is_valid, errors = validate_card_parameters(parameters)
+    
+    assert is_valid is False
+    assert len(errors) == card_parameters_module.MAX_SCHEMA_ERRORS
+
+
+def test_validate_card_parameters_business_rules():
+    """Test that duplicate names, widget compatibility and required defaults are checked per parameter."""
+    parameters = [
+        {"name": "status", "type": "category"},
+        {"name": "status", "type": "category", "required": True},
+        {"name": "amount", "type": "number/=", "ui_widget": "search", "required": True, "default": 1,
+         "values_source": {"type": "static", "values": [1, 2]}},
+        {"name": "period", "type": "date/range", "ui_widget": "dropdown",
+         "field": {"database_id": 1, "table_id": 2, "field_id": 3},
+         "values_source": {"type": "connected"}},
+    ]
+    
+    is_valid, errors = validate_card_parameters(parameters)
+    
+    assert is_valid is False
+    assert errors == [
+        "Parameter 1: duplicate name 'status'",
+        "Parameter 1 (status): required parameters must have a default value",
+        "Parameter 2 (amount): Search widget only compatible with category and string field filter types, not 'number/='",
+        "Parameter 3 (period): Dropdown widget not compatible with date field filter type 'date/range'",
+    ]
+
+
+def test_widget_compatibility_error():
+    """Test that search and dropdown widgets are only allowed on compatible types."""
+    assert widget_compatibility_error("category", "search") is None
+    assert widget_compatibility_error("string/does-not-contain", "search") is None
+    assert widget_compatibility_error("date/single", "dropdown") is None
+    assert widget_compatibility_error("number/=", None) is None
+    assert widget_compatibility_error("number/=", "search") == (
+        "Search widget only compatible with category and string field filter types, not 'number/='"
+    )
+    assert widget_compatibility_error("date/range", "dropdown") == (
+        "Dropdown widget not compatible with date field filter type 'date/range'"
+    )
+
+
+def test_generate_parameter_ids():
+    """Test that batch-generated parameter IDs are distinct version 4 UUIDs."""
+    param_ids = generate_parameter_ids(5) + [generate_parameter_id()]
+    
+    assert len(set(param_ids)) == 6
+    for param_id in param_ids:
+        parsed = uuid.UUID(param_id)
+        assert parsed.version == 4
+        assert str(parsed) == param_id
+    assert generate_parameter_ids(0) == []
+
+
+def test_generate_slug():
+    """Test slug generation from parameter names."""
+    assert generate_slug("Order Status") == "order_status"
+    assert generate_slug("  Date -- Range!  ") == "date_range"
+    assert generate_slug("***") == "parameter"
+    assert generate_slug("total__revenue (USD)") == "total_revenue_usd"
+    assert generate_slug("Café Name") == "caf_name"
+
+
+def test_generate_slug_is_memoized():
+    """Test that repeated parameter names are served from the slug cache."""
+    generate_slug.cache_clear()
+    
+    generate_slug("Order Status")
+    generate_slug("Order Status")
+    
+    assert generate_slug.cache_info().hits == 1
+    assert generate_slug.cache_info().misses == 1
+
+
+def test_extract_sql_parameters():
+    """Test that required and optional SQL parameter references are separated."""
+    query = "SELECT * FROM orders WHERE status = {{status}} [[AND created_at > {{since}}]]"
+    
+    result = extract_sql_parameters(query)
+    
+    assert result == {"required": ["status"], "optional": ["since"]}
+
+
+@pytest.mark.asyncio
+async def test_validate_field_references_fetches_each_table_once():
+    """Test that referenced tables are fetched once each and reused across calls."""
+    table_responses = {
+        "table/10/query_metadata": ({"fields": [{"id": 100}, {"id": 101}]}, 200, None),
+        "table/20/query_metadata": (None, 404, "Not found"),
+    }
+    
+    async def make_request(method, path, **kwargs):
+        if path == "table/30/query_metadata":
+            raise RuntimeError("connection reset")
+        return table_responses[path]
+    
+    client = MagicMock()
+    client.auth.make_request = AsyncMock(side_effect=make_request)
+    
+    parameters = [
+        {"name": "customer", "type": "string/=", "field": {"database_id": 1, "table_id": 10, "field_id": 100}},
+        {"name": "product", "type": "string/=", "field": {"database_id": 1, "table_id": 10, "field_id": 999}},
+        {"name": "region", "type": "string/=", "field": {"database_id": 1, "table_id": 20, "field_id": 200}},
+        {"name": "city", "type": "string/=", "field": {"database_id": 1, "table_id": 30, "field_id": 300}},
+        {"name": "status", "type": "category"},
+    ]
+    
+    errors = await validate_field_references(client, parameters)
+    
+    assert client.auth.make_request.call_count == 3
+    assert errors == [
+        "Parameter 1 (product): Field 999 not found in table 10",
+        "Parameter 2 (region): Cannot access table 20 in database 1",
+        "Parameter 3 (city): Error validating field reference - connection reset",
+    ]
+    
+    # Only the successfully fetched table is served from the cache
+    await validate_field_references(client, parameters)
+    
+    assert client.auth.make_request.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_validate_field_references_missing_ids():
+    """Test that incomplete field references are reported instead of raising."""
+    client = MagicMock()
+    client.auth.make_request = AsyncMock(return_value=({"fields": [{"id": 100}]}, 200, None))
+    
+    parameters = [
+        {"name": "customer", "type": "string/=", "field": {"database_id": 1, "field_id": 100}},
+        {"name": "region", "type": "string/=", "field": {"database_id": 1}},
+        {"name": "city", "type": "string/=", "field": {"table_id": 10, "field_id": 100}},
+    ]
+    
+    errors = await validate_field_references(client, parameters)
+    
+    assert errors == [
+        "Parameter 0 (customer): Field reference is missing table_id",
+        "Parameter 1 (region): Field reference is missing table_id, field_id",
+    ]
+    client.auth.make_request.assert_called_once()
+
+
+def test_format_default_value():
+    """Test that only number dropdowns with static values wrap a single default."""
+    dropdown = {"ui_widget": "dropdown", "values_source": {"type": "static", "values": [1, 2]}}
+    
+    assert format_default_value(dropdown, "number/=", 1) == ["1"]
+    assert format_default_value(dropdown, "number/=", ["1"]) == ["1"]
+    assert format_default_value(dropdown, "category", "a") == "a"
+    assert format_default_value({"ui_widget": "dropdown"}, "number/=", 1) == 1
+    assert format_default_value({"ui_widget": "input"}, "number/=", 1) == 1
+
+
+def test_process_single_parameter_number_dropdown_default():
+    """Test that the parameter and its template tag share the formatted default."""
+    param_config = {
+        "name": "quantity",
+        "type": "number/=",
+        "default": 5,
+        "ui_widget": "dropdown",
+        "values_source": {"type": "static", "values": [5, 10]},
+    }
+    
+    processed, template_tag = process_single_parameter(param_config, "param-id")
+    
+    assert processed["target"] == ["variable", ["template-tag", "quantity"]]
+    assert processed["default"] == ["5"]
+    assert template_tag["default"] == ["5"]
+    assert processed["values_source_config"] == {"values": [["5"], ["10"]]}
+
+
+@pytest.mark.asyncio
+async def test_process_card_parameters_skips_field_validation_without_fields():
+    """Test that field references are only validated when a parameter has a field."""
+    parameters = [
+        {"name": "status", "type": "category"},
+        {"name": "amount", "type": "number/="},
+    ]
+    
+    with patch.object(card_parameters_module, "validate_field_references", new_callable=AsyncMock) as validate:
+        processed, template_tags, errors = await process_card_parameters(MagicMock(), parameters)
+    
+    validate.assert_not_called()
+    assert errors == []
+    assert [param["slug"] for param in processed] == ["status", "amount"]
+    assert set(template_tags) == {"status", "amount"}
+    assert [template_tags[param["slug"]]["id"] for param in processed] == [param["id"] for param in processed]
+
+
+def test_create_template_tag():
+    """Test template tags for simple filters and field filters."""
+    simple = create_template_tag("amount", "number/=", {"name": "amount", "display_name": "Amount"}, "id-1")
+    
+    assert simple == {"type": "number", "name": "amount", "id": "id-1", "display-name": "Amount"}
+    
+    field_filter = create_template_tag(
+        "customer",
+        "string/contains",
+        {"name": "customer", "field": {"database_id": 1, "table_id": 2, "field_id": 3}, "required": False},
+        "id-2"
+    )
+    
+    assert field_filter == {
+        "type": "dimension",
+        "name": "customer",
+        "id": "id-2",
+        "display-name": "customer",
+        "dimension": ["field", 3, None],
+        "widget-type": "string/contains",
+        "required": False,
+    }
+
+
+def test_apply_values_source_config():
+    """Test that values source keys are set in place only when configured."""
+    processed = {}
+    apply_values_source_config(processed, {"type": "card", "card_id": 7, "value_field": "name", "label_field": "label"})
+    
+    assert processed == {
+        "values_source_type": "card",
+        "values_source_config": {
+            "card_id": 7,
+            "value_field": ["field", "name", {"base-type": "type/Text"}],
+            "label_field": ["field", "label", {"base-type": "type/Text"}],
+        },
+    }
+    
+    processed = {"id": "param-id"}
+    result = apply_values_source_config(processed, {"type": "static", "values": ["a", "b"]})
+    
+    assert result is None
+    assert processed == {
+        "id": "param-id",
+        "values_source_type": "static-list",
+        "values_source_config": {"values": ["a", "b"]},
+    }
+    
+    processed = {}
+    apply_values_source_config(processed, {"type": "static", "values": [1, 2.5]})
+    
+    assert processed == {"values_source_type": "static-list", "values_source_config": {"values": [["1"], ["2.5"]]}}
+    
+    processed = {}
+    apply_values_source_config(processed, {"type": "connected"}, {"database_id": 1, "table_id": 2, "field_id": 3})
+    
+    assert processed == {"values_source_config": {}}
+    
+    processed = {}
+    apply_values_source_config(processed, {"type": "connected"})
+    apply_values_source_config(processed, None)
+    
+    assert processed == {}
+
+
+def test_process_single_parameter_field_filter_target():
+    """Test that field filters target a template tag dimension bound to the field."""
+    param_config = {
+        "name": "customer",
+        "type": "string/=",
+        "field": {"database_id": 1, "table_id": 2, "field_id": 3},
+    }
+    
+    processed, template_tag = process_single_parameter(param_config, "param-id")
+    
+    assert processed["target"] == ["dimension", ["template-tag", "customer"]]
+    assert template_tag["dimension"] == ["field", 3, None]
+
+
+@pytest.mark.asyncio
+async def test_process_card_parameters_empty_skips_validation():
+    """Test that an empty parameters list is processed without any validation."""
+    with patch.object(card_parameters_module, "validate_card_parameters") as validate:
+        result = await process_card_parameters(MagicMock(), [])
+    
+    assert result == ([], {}, [])
+    validate.assert_not_called()
+
+
+def test_validate_sql_parameter_consistency():
+    """Test that SQL references are matched against parameter names and slugs."""
+    query = "SELECT * FROM orders WHERE status = {{status}} AND region = {{region}} [[AND total > {{min_total}}]]"
+    parameters = [
+        {"name": "status", "slug": "status", "required": True, "default": "open"},
+        {"name": "Minimum Total", "slug": "min_total"},
+        {"name": "region", "slug": "region"},
+        {"name": "unused", "slug": "unused", "default": "x"},
+    ]
+    
+    issues = validate_sql_parameter_consistency(query, parameters)
+    
+    assert sorted(issues) == sorted([
+        "Parameter 'Minimum Total' is configured but not used in SQL query",
+        "Parameter 'unused' is configured but not used in SQL query",
+        "Parameter 'region' is used as required in SQL but has no default value and is not marked as required",
+    ])
@@ -44,3 +44,29 @@ def test_from_env():
         assert config.username == "env-user@example.com"
         assert config.password == "env-password"
         assert config.session_token is None
+
+
+def test_row_preview_limit_from_env():
+    """Test reading the row preview limit from the environment."""
+    env_vars = {
+        "METABASE_URL": "https://env-metabase.example.com",
+        "ROW_PREVIEW_LIMIT": "50"
+    }
+    
+    with patch.dict(os.environ, env_vars):
+        config = MetabaseConfig.from_env()
+        
+        assert config.row_preview_limit == 50
+
+
+@pytest.mark.parametrize("limit", ["0", "-5"])
+def test_row_preview_limit_must_be_positive(limit):
+    """Test that a row preview limit below 1 is rejected at load time."""
+    env_vars = {
+        "METABASE_URL": "https://env-metabase.example.com",
+        "ROW_PREVIEW_LIMIT": limit
+    }
+    
+    with patch.dict(os.environ, env_vars):
+        with pytest.raises(ValueError, match="row_preview_limit"):
+            MetabaseConfig.from_env()
@@ -0,0 +1,257 @@
+"""
+Tests for dashboard parameters validation and processing.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from talk_to_metabase.tools import dashboard_parameters as dashboard_parameters_module
+from talk_to_metabase.tools.dashboard_parameters import (
+    generate_parameter_id,
+    generate_parameter_ids,
+    generate_slug,
+    process_dashboard_parameters,
+    process_single_dashboard_parameter,
+    validate_card_references,
+    validate_dashboard_parameters,
+)
+
+
+def test_validate_dashboard_parameters_valid():
+    """Test that well-formed parameters pass validation."""
+    parameters = [
+        {"name": "Status", "type": "string/=", "default": ["active"]},
+        {"name": "Date Range", "type": "date/range"},
+    ]
+    
+    is_valid, errors = validate_dashboard_parameters(parameters)
+    
+    assert is_valid is True
+    assert errors == []
+
+
+def test_validate_dashboard_parameters_empty_skips_schema():
+    """Test that an empty parameters list is accepted without loading the schema."""
+    with patch.object(dashboard_parameters_module, "load_dashboard_parameters_schema") as mock_load:
+        is_valid, errors = validate_dashboard_parameters([])
+    
+    assert is_valid is True
+    assert errors == []
+    mock_load.assert_not_called()
+
+
+def test_validate_dashboard_parameters_uses_compiled_validator():
+    """Test that valid parameters are accepted by the compiled validator alone."""
+    assert dashboard_parameters_module._COMPILED_VALIDATOR is not None
+    
+    with patch.object(dashboard_parameters_module, "_collect_schema_errors") as collect:
+        is_valid, errors = validate_dashboard_parameters([{"name": "Status", "type": "string/="}])
+    
+    assert is_valid is True
+    assert errors == []
+    collect.assert_not_called()
+
+
+def test_validate_dashboard_parameters_reports_all_schema_errors():
+    """Test that every schema violation is reported with its location."""
+    parameters = [
+        {"name": "Status", "type": "string/unknown"},
+        {"name": "Amount", "type": "number/between", "required": "yes"},
+    ]
+    
+    is_valid, errors = validate_dashboard_parameters(parameters)
+    
+    assert is_valid is False
+    assert any(error.startswith("Validation error at 0 -> type:") for error in errors)
+    assert any(error.startswith("Validation error at 1 -> required:") for error in errors)
+
+
+def test_validate_dashboard_parameters_caps_schema_errors():
+    """Test that schema errors stop being collected after MAX_SCHEMA_ERRORS."""
+    parameters = [{"name": f"P{i}", "type": "string/unknown"} for i in range(50)]
+    
+    is_valid, errors = validate_dashboard_parameters(parameters)
+    
+    assert is_valid is False
+    assert len(errors) == dashboard_parameters_module.MAX_SCHEMA_ERRORS
+
+
+def test_validate_dashboard_parameters_business_rules():
+    """Test duplicate and reserved names are rejected after schema validation."""
+    parameters = [
+        {"name": "Status", "type": "string/="},
+        {"name": "Status", "type": "string/="},
+        {"name": "tab", "type": "string/="},
+    ]
+    
+    is_valid, errors = validate_dashboard_parameters(parameters)
+    
+    assert is_valid is False
+    assert "Parameter 1: duplicate name 'Status'" in errors
+    assert "Parameter 2: name 'tab' is reserved and cannot be used" in errors
+
+
+def test_validate_dashboard_parameters_schema_business_rules():
+    """Test that multi-select, temporal unit and values source rules are enforced by the schema."""
+    is_valid, errors = validate_dashboard_parameters([
+        {"name": "Amount", "type": "number/between", "isMultiSelect": True},
+        {"name": "Unit", "type": "temporal-unit"},
+        {"name": "Status", "type": "string/=", "values_source": {"type": "card", "card_id": 1}},
+    ])
+    
+    assert is_valid is False
+    assert "Validation error at 0 -> isMultiSelect: False was expected" in errors
+    assert "Validation error at 1: 'temporal_units' is a required property" in errors
+    assert "Validation error at 2 -> values_source: 'value_field' is a required property" in errors
+
+
+def test_validate_dashboard_parameters_required_defaults():
+    """Test that required parameters need a non-empty default for their multi-select mode."""
+    parameters = [
+        {"name": "Status", "type": "string/=", "required": True, "default": []},
+        {"name": "Day", "type": "date/single", "required": True, "default": ""},
+        {"name": "Amount", "type": "number/=", "required": True},
+        {"name": "Name", "type": "string/=", "isMultiSelect": False, "required": True, "default": "x"},
+    ]
+    
+    is_valid, errors = validate_dashboard_parameters(parameters)
+    
+    assert is_valid is False
+    assert errors == [
+        "Parameter 0 (Status): required parameters must have a non-empty default value",
+        "Parameter 1 (Day): required parameters must have a non-empty default value",
+        "Parameter 2 (Amount): required parameters must have a default value",
+    ]
+
+
+def test_validate_dashboard_parameters_default_types():
+    """Test that multi-select defaults are checked element by element."""
+    parameters = [
+        {"name": "Amounts", "type": "number/=", "default": [1, 2.5, "3"]},
+        {"name": "Ids", "type": "id", "default": ["a", 1, 2.0]},
+        {"name": "Names", "type": "string/=", "default": ["a", 1]},
+    ]
+    
+    is_valid, errors = validate_dashboard_parameters(parameters)
+    
+    assert is_valid is False
+    assert errors == [
+        "Parameter 0 (Amounts): Number parameter with multi-select requires array of numbers as default",
+        "Parameter 2 (Names): Text parameter with multi-select requires array of strings as default",
+    ]
+
+
+def test_generate_parameter_id():
+    """Test that parameter IDs are 8-character alphanumeric strings."""
+    param_id = generate_parameter_id()
+    
+    assert len(param_id) == 8
+    assert param_id.isascii() and param_id.isalnum()
+
+
+def test_generate_parameter_ids_avoids_existing():
+    """Test that batch-generated IDs are distinct and skip IDs already in use."""
+    batches = [["taken001", "newid001"], ["newid001"], ["newid002"]]
+    
+    with patch.object(dashboard_parameters_module, "_random_parameter_ids", side_effect=batches) as draw:
+        new_ids = generate_parameter_ids(2, {"taken001"})
+    
+    assert sorted(new_ids) == ["newid001", "newid002"]
+    assert [call.args[0] for call in draw.call_args_list] == [2, 1, 1]
+
+
+def test_generate_slug():
+    """Test slug generation from parameter names."""
+    assert generate_slug("Status Filter") == "status_filter"
+    assert generate_slug("  Date -- Range!  ") == "date_range"
+    assert generate_slug("***") == "parameter"
+
+
+@pytest.mark.asyncio
+async def test_validate_card_references_fetches_each_card_once():
+    """Test that referenced cards are fetched once each and errors are reported per parameter."""
+    card_responses = {
+        "card/101": ({"result_metadata": [{"name": "status"}, {"name": "label"}]}, 200, None),
+        "card/202": (None, 404, "Not found"),
+    }
+    
+    async def make_request(method, path, **kwargs):
+        if path == "card/303":
+            raise RuntimeError("connection reset")
+        return card_responses[path]
+    
+    client = MagicMock()
+    client.auth.make_request = AsyncMock(side_effect=make_request)
+    
+    parameters = [
+        {"name": "Status", "type": "string/=",
+         "values_source": {"type": "card", "card_id": 101, "value_field": "status"}},
+        {"name": "Other", "type": "string/=",
+         "values_source": {"type": "card", "card_id": 101, "value_field": "missing", "label_field": "label"}},
+        {"name": "Region", "type": "string/=",
+         "values_source": {"type": "card", "card_id": 202, "value_field": "region"}},
+        {"name": "City", "type": "string/=",
+         "values_source": {"type": "card", "card_id": 303, "value_field": "city"}},
+        {"name": "Static", "type": "string/=", "values_source": {"type": "static", "values": ["a"]}},
+    ]
+    
+    errors = await validate_card_references(client, parameters)
+    
+    assert client.auth.make_request.call_count == 3
+    assert errors == [
+        "Parameter 1 (Other): Field 'missing' not found in card 101. Available fields: ['status', 'label']",
+        "Parameter 2 (Region): Cannot access card 202 for values source - Not found",
+        "Parameter 3 (City): Error validating card reference 303 - connection reset",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_dashboard_parameters_assigns_ids():
+    """Test that every processed parameter gets a distinct generated ID."""
+    parameters = [
+        {"name": "Status", "type": "string/="},
+        {"name": "Region", "type": "location/="},
+        {"name": "Amount", "type": "number/between"},
+    ]
+    
+    processed, errors = await process_dashboard_parameters(MagicMock(), parameters)
+    
+    assert errors == []
+    ids = [param["id"] for param in processed]
+    assert len(set(ids)) == 3
+    assert all(len(param_id) == 8 for param_id in ids)
+    assert processed[1]["type"] == "string/="
+    assert processed[1]["sectionId"] == "location"
+
+
+def test_process_single_dashboard_parameter_fields():
+    """Test that optional fields are carried over only when set, in a stable order."""
+    processed = process_single_dashboard_parameter(
+        {
+            "name": "Status Filter",
+            "type": "string/=",
+            "required": True,
+            "default": ["active"],
+            "values_source": {"type": "static", "values": ["active", 2]},
+        },
+        set()
+    )
+    
+    assert list(processed) == [
+        "id", "name", "slug", "type", "sectionId", "required", "default",
+        "values_query_type", "values_source_type", "values_source_config",
+    ]
+    assert processed["slug"] == "status_filter"
+    assert processed["values_query_type"] == "list"
+    assert processed["values_source_type"] == "static-list"
+    assert processed["values_source_config"] == {"values": [["active"], ["2"]]}
+    
+    processed = process_single_dashboard_parameter(
+        {"name": "Unit", "type": "temporal-unit", "temporal_units": ["day", "week"], "default": None},
+        set()
+    )
+    
+    assert processed["temporal_units"] == ["day", "week"]
+    assert "default" not in processed
+    assert processed["values_query_type"] == "none"
@@ -2,12 +2,21 @@
 Additional tests for the paginated get_dashboard_tab functionality.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from talk_to_metabase.tools.dashboard import get_dashboard_tab
+from talk_to_metabase.tools.dashboard import (
+    _DASHBOARD_CACHE,
+    _INFLIGHT_DASHBOARD_FETCHES,
+    _TAB_INDEX_CACHE,
+    _get_tab_index,
+    _invalidate_dashboard_cache,
+    get_dashboard,
+    get_dashboard_tab,
+)
 
 
 @pytest.mark.asyncio
@@ -258,3 +267,156 @@ async def test_get_dashboard_tab_invalid_page_size(mock_context, sample_dashboar
         assert result_data["success"] is False
         assert "error" in result_data
         assert result_data["error"]["error_type"] == "invalid_pagination"
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_tab_index_invalidated_on_update(mock_context, sample_dashboard, sample_card):
+    """Test that the cached tab index is rebuilt when the dashboard changes."""
+    dashboard = sample_dashboard.copy()
+    dashboard["dashcards"] = [
+        {"id": 1, "card_id": 1, "size_x": 4, "size_y": 2, "row": 0, "col": 0, "card": sample_card}
+    ]
+    updated_dashboard = dashboard.copy()
+    updated_dashboard["updated_at"] = "2023-01-03T00:00:00Z"
+    updated_dashboard["dashcards"] = dashboard["dashcards"] + [
+        {"id": 2, "card_id": 2, "size_x": 4, "size_y": 2, "row": 1, "col": 0, "card": sample_card}
+    ]
+    
+    client_mock = MagicMock()
+    client_mock.get_resource = AsyncMock(side_effect=[dashboard, dashboard, updated_dashboard])
+    
+    # Drop the cached dashboard between calls so only the tab index cache is exercised
+    with patch("talk_to_metabase.tools.dashboard.get_metabase_client", return_value=client_mock):
+        first = json.loads(await get_dashboard_tab(dashboard_id=1, ctx=mock_context))
+        _DASHBOARD_CACHE.clear()
+        second = json.loads(await get_dashboard_tab(dashboard_id=1, ctx=mock_context))
+        _DASHBOARD_CACHE.clear()
+        third = json.loads(await get_dashboard_tab(dashboard_id=1, ctx=mock_context))
+    
+    assert first["pagination"]["total_cards"] == 1
+    assert second["dashcards"] == first["dashcards"]
+    assert third["pagination"]["total_cards"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_tab_reuses_recent_fetch(mock_context, sample_dashboard, sample_card):
+    """Test that paging through a dashboard fetches it from Metabase only once."""
+    dashboard = sample_dashboard.copy()
+    dashboard["dashcards"] = [
+        {"id": i + 1, "card_id": i + 1, "size_x": 4, "size_y": 2, "row": i, "col": 0, "card": sample_card}
+        for i in range(4)
+    ]
+    
+    client_mock = MagicMock()
+    client_mock.get_resource = AsyncMock(return_value=dashboard)
+    
+    with patch("talk_to_metabase.tools.dashboard.get_metabase_client", return_value=client_mock):
+        first = json.loads(await get_dashboard_tab(dashboard_id=1, ctx=mock_context, page_size=2))
+        second = json.loads(await get_dashboard_tab(dashboard_id=1, ctx=mock_context, page=2, page_size=2))
+    
+    assert first["pagination"]["has_more"] is True
+    assert second["pagination"]["has_more"] is False
+    client_mock.get_resource.assert_called_once_with("dashboard", 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_dashboard_fetches_are_coalesced(mock_context, sample_dashboard):
+    """Test that concurrent dashboard tools share a single upstream fetch."""
+    release = asyncio.Event()
+    
+    async def slow_get_resource(resource_type, resource_id):
+        await release.wait()
+        return sample_dashboard
+    
+    client_mock = MagicMock()
+    client_mock.get_resource = AsyncMock(side_effect=slow_get_resource)
+    
+    with patch("talk_to_metabase.tools.dashboard.get_metabase_client", return_value=client_mock):
+        pending = asyncio.gather(
+            get_dashboard(id=1, ctx=mock_context),
+            get_dashboard_tab(dashboard_id=1, ctx=mock_context),
+        )
+        await asyncio.sleep(0)
+        release.set()
+        dashboard_result, tab_result = await pending
+    
+    assert json.loads(dashboard_result)["name"] == sample_dashboard["name"]
+    assert json.loads(tab_result)["dashboard_id"] == 1
+    client_mock.get_resource.assert_called_once_with("dashboard", 1)
+
+
+@pytest.mark.asyncio
+async def test_fetch_started_before_update_is_not_cached(mock_context, sample_dashboard):
+    """Test that a fetch overlapping a dashboard update does not repopulate the cache."""
+    release = asyncio.Event()
+    updated_dashboard = sample_dashboard.copy()
+    updated_dashboard["name"] = "Updated Dashboard"
+    
+    responses = [sample_dashboard, updated_dashboard]
+    
+    async def get_resource(resource_type, resource_id):
+        data = responses.pop(0)
+        if data is sample_dashboard:
+            await release.wait()
+        return data
+    
+    client_mock = MagicMock()
+    client_mock.get_resource = AsyncMock(side_effect=get_resource)
+    
+    with patch("talk_to_metabase.tools.dashboard.get_metabase_client", return_value=client_mock):
+        pending = asyncio.ensure_future(get_dashboard(id=1, ctx=mock_context))
+        await asyncio.sleep(0)
+        assert 1 in _INFLIGHT_DASHBOARD_FETCHES
+        
+        _invalidate_dashboard_cache(1)
+        release.set()
+        stale_result = json.loads(await pending)
+        
+        assert 1 not in _DASHBOARD_CACHE
+        fresh_result = json.loads(await get_dashboard(id=1, ctx=mock_context))
+    
+    assert stale_result["name"] == sample_dashboard["name"]
+    assert fresh_result["name"] == "Updated Dashboard"
+    assert client_mock.get_resource.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_tab_page_out_of_range_from_cache(mock_context, sample_dashboard, sample_card):
+    """Test that out-of-range pages are rejected from cached metadata."""
+    dashboard = sample_dashboard.copy()
+    dashboard["dashcards"] = [
+        {"id": i + 1, "card_id": i + 1, "size_x": 4, "size_y": 2, "row": i, "col": 0, "card": sample_card}
+        for i in range(3)
+    ]
+    
+    client_mock = MagicMock()
+    client_mock.get_resource = AsyncMock(return_value=dashboard)
+    
+    with patch("talk_to_metabase.tools.dashboard.get_metabase_client", return_value=client_mock), \
+         patch("talk_to_metabase.tools.dashboard._get_tab_index", wraps=_get_tab_index) as index_mock:
+        await get_dashboard_tab(dashboard_id=1, ctx=mock_context, page_size=2)
+        result = json.loads(await get_dashboard_tab(dashboard_id=1, ctx=mock_context, page=5, page_size=2))
+    
+    assert result["error"]["error_type"] == "page_out_of_range"
+    assert result["error"]["request_info"]["total_pages"] == 2
+    assert index_mock.call_count == 1
+
+
+def test_tab_index_cache_prunes_expired_entries(sample_dashboard):
+    """Test that tab indexes for dashboards not used recently are evicted."""
+    with patch("talk_to_metabase.tools.dashboard.time.monotonic", return_value=100.0):
+        _get_tab_index(1, sample_dashboard, False)
+    with patch("talk_to_metabase.tools.dashboard.time.monotonic", return_value=1000.0):
+        _get_tab_index(2, sample_dashboard, False)
+    
+    assert list(_TAB_INDEX_CACHE) == [2]
+
+
+def test_invalidate_dashboard_cache_drops_tab_index(sample_dashboard):
+    """Test that modifying a dashboard also forgets its tab index."""
+    _get_tab_index(1, sample_dashboard, False)
+    assert 1 in _TAB_INDEX_CACHE
+    
+    _invalidate_dashboard_cache(1)
+    
+    assert 1 not in _TAB_INDEX_CACHE
@@ -0,0 +1,171 @@
+"""
+Tests for dashboard cards validation.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from talk_to_metabase.tools.dashcards import (
+    get_card_parameters,
+    get_dashcards_schema,
+    invalidate_card_parameters_cache,
+    validate_dashcards,
+    validate_parameter_mappings,
+    validate_tabs,
+)
+
+
+def test_validate_dashcards_valid():
+    """Test that well-formed dashcards pass validation."""
+    dashcards = [
+        {"id": -1, "card_id": 12345, "col": 0, "row": 0, "size_x": 12, "size_y": 6},
+        {"id": 7, "card_id": 23456, "col": 12, "row": 0, "size_x": 12, "size_y": 6,
+         "dashboard_tab_id": None},
+    ]
+    
+    is_valid, errors = validate_dashcards(dashcards)
+    
+    assert is_valid is True
+    assert errors == []
+
+
+def test_validate_dashcards_schema_error():
+    """Test that schema violations are reported as validation errors."""
+    dashcards = [{"card_id": 12345, "col": 0, "row": 0, "size_x": 12}]
+    
+    is_valid, errors = validate_dashcards(dashcards)
+    
+    assert is_valid is False
+    assert len(errors) == 1
+    assert errors[0].startswith("Validation error at")
+
+
+def test_validate_dashcards_grid_overflow():
+    """Test that cards exceeding the grid width are rejected."""
+    dashcards = [{"card_id": 12345, "col": 20, "row": 0, "size_x": 6, "size_y": 4}]
+    
+    is_valid, errors = validate_dashcards(dashcards)
+    
+    assert is_valid is False
+    assert any("exceeds grid width" in error or "Validation error" in error for error in errors)
+
+
+def test_validate_dashcards_reports_all_schema_errors():
+    """Test that every schema violation is reported, not just the first."""
+    dashcards = [
+        {"card_id": 12345, "col": 0, "row": 0, "size_x": 12},
+        {"card_id": 23456, "col": 0, "row": 1, "size_x": 12, "size_y": "tall"},
+    ]
+    
+    is_valid, errors = validate_dashcards(dashcards)
+    
+    assert is_valid is False
+    assert len(errors) >= 2
+    assert all(error.startswith("Validation error at") for error in errors)
+    assert any(error.startswith("Validation error at 1 -> size_y:") for error in errors)
+
+
+def test_validate_dashcards_empty_skips_schema():
+    """Test that an empty dashcards list is accepted without loading the schema."""
+    with patch("talk_to_metabase.tools.dashcards.load_dashcards_schema") as mock_load:
+        is_valid, errors = validate_dashcards([])
+    
+    assert is_valid is True
+    assert errors == []
+    mock_load.assert_not_called()
+    
+    # Non-list input is still rejected by the schema
+    is_valid, errors = validate_dashcards({})
+    assert is_valid is False
+
+
+def test_validate_tabs_unexpected_fields():
+    """Test that unexpected tab fields are reported."""
+    is_valid, errors = validate_tabs([{"id": -1, "name": "Overview", "position": 0, "color": "red"}])
+    
+    assert is_valid is False
+    assert errors == [
+        "Tab 0: unexpected field 'color'. Only 'id' and 'name' are allowed",
+        "Tab 0: unexpected field 'position'. Only 'id' and 'name' are allowed",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_dashcards_schema(mock_context):
+    """Test that the full schema and the summary variant are returned."""
+    full = json.loads(await get_dashcards_schema(mock_context))
+    summary = json.loads(await get_dashcards_schema(mock_context, summary_only=True))
+    
+    assert full["success"] is True
+    assert full["schema"]["type"] == "array"
+    assert "parameter_mappings" in full["usage"]
+    
+    assert summary["success"] is True
+    assert "schema" not in summary
+    assert summary["usage"]["required_keys"] == ["card_id", "col", "row", "size_x", "size_y"]
+    assert summary["usage"]["forbidden_keys"] == ["action_id", "series", "visualization_settings"]
+
+
+@pytest.mark.asyncio
+async def test_validate_parameter_mappings_fetches_each_card_once():
+    """Test that mapped cards are fetched once each and errors are reported per dashcard."""
+    card_responses = {
+        "card/101": ({"parameters": [{"id": "p1", "name": "status", "slug": "status"}]}, 200, None),
+        "card/202": (None, 404, "Not found"),
+    }
+    
+    async def make_request(method, path, **kwargs):
+        return card_responses[path]
+    
+    client = MagicMock()
+    client.auth.make_request = AsyncMock(side_effect=make_request)
+    
+    dashcards = [
+        {"card_id": 101, "parameter_mappings": [
+            {"dashboard_parameter_name": "Status", "card_parameter_name": "status"}
+        ]},
+        {"card_id": 101, "parameter_mappings": [
+            {"dashboard_parameter_name": "Status", "card_parameter_name": "missing"}
+        ]},
+        {"card_id": 202, "parameter_mappings": [
+            {"dashboard_parameter_name": "Status", "card_parameter_name": "status"}
+        ]},
+        {"card_id": 303},
+    ]
+    
+    card_parameters_by_card, errors = await validate_parameter_mappings(
+        client, dashcards, [{"name": "Status"}]
+    )
+    
+    assert client.auth.make_request.call_count == 2
+    assert list(card_parameters_by_card) == [101]
+    assert len(errors) == 2
+    assert errors[0].startswith("Dashcard 1 mapping 0: Card parameter 'missing'")
+    assert errors[1] == "Dashcard 2: Cannot access card 202: Not found"
+
+
+@pytest.mark.asyncio
+async def test_get_card_parameters_reuses_recent_fetch():
+    """Test that card parameters are cached until the card is invalidated and errors are not cached."""
+    client = MagicMock()
+    client.auth.make_request = AsyncMock(side_effect=[
+        (None, 500, "Server error"),
+        ({"parameters": [{"id": "p1", "name": "status"}]}, 200, None),
+        ({"parameters": []}, 200, None),
+    ])
+    
+    parameters, error = await get_card_parameters(client, 101)
+    assert parameters == [] and error == "Cannot access card 101: Server error"
+    
+    first, _ = await get_card_parameters(client, 101)
+    second, _ = await get_card_parameters(client, 101)
+    assert first == [{"id": "p1", "name": "status"}]
+    assert second is first
+    assert client.auth.make_request.call_count == 2
+    
+    invalidate_card_parameters_cache(101)
+    parameters, error = await get_card_parameters(client, 101)
+    assert parameters == [] and error is None
+    assert client.auth.make_request.call_count == 3
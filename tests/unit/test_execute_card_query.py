@@ -204,3 +204,30 @@ async def test_execute_card_query_api_error(mock_context):
         
         # Verify the mock was called correctly
         auth_mock.make_request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_card_query_truncates_rows(mock_context):
+    """Test that rows beyond the configured preview limit are truncated."""
+    mock_context.request_context.lifespan_context.auth.config.row_preview_limit = 5
+    query_result = {
+        "data": {
+            "rows": [[i] for i in range(12)],
+            "cols": [{"name": "id", "display_name": "ID", "base_type": "type/Integer"}]
+        },
+        "status": "completed"
+    }
+    
+    auth_mock = MagicMock()
+    auth_mock.make_request = AsyncMock(return_value=(query_result, 200, None))
+    client_mock = MagicMock()
+    client_mock.auth = auth_mock
+    
+    with patch("talk_to_metabase.tools.dashboard.get_metabase_client", return_value=client_mock):
+        result = await execute_card_query(card_id=123, ctx=mock_context)
+    
+    result_data = json.loads(result)
+    assert len(result_data["data"]["rows"]) == 5
+    assert result_data["metadata"]["row_count"] == 12
+    assert result_data["metadata"]["row_count_truncated"] is True
+    assert result_data["metadata"]["returned_row_count"] == 5
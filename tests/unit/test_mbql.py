@@ -0,0 +1,52 @@
+"""
+Tests for MBQL query validation.
+"""
+
+from unittest.mock import patch
+
+from talk_to_metabase.tools import mbql as mbql_module
+from talk_to_metabase.tools.mbql import validate_mbql_query
+
+
+def test_validate_mbql_query_valid():
+    """Test that a well-formed MBQL query passes validation."""
+    is_valid, errors = validate_mbql_query({"source-table": 1, "limit": 10})
+    
+    assert is_valid is True
+    assert errors == []
+
+
+def test_validate_mbql_query_uses_compiled_validator():
+    """Test that valid queries are accepted by the compiled validator alone."""
+    assert mbql_module._COMPILED_VALIDATOR is not None
+    
+    with patch.object(mbql_module, "_collect_schema_errors") as collect:
+        is_valid, errors = validate_mbql_query({"source-table": 1})
+    
+    assert is_valid is True
+    assert errors == []
+    collect.assert_not_called()
+
+
+def test_validate_mbql_query_reports_all_schema_errors():
+    """Test that every schema violation is reported with its location."""
+    is_valid, errors = validate_mbql_query({"source-table": 1, "limit": "ten", "fields": "all"})
+    
+    assert is_valid is False
+    assert "Validation error at limit: 'ten' is not of type 'integer'" in errors
+    assert any(error.startswith("Validation error at fields:") for error in errors)
+
+
+def test_load_mbql_schema_is_cached():
+    """Test that the MBQL schema is read from disk only once."""
+    mbql_module.load_mbql_schema.cache_clear()
+    try:
+        with patch.object(mbql_module, "load_json_resource", wraps=mbql_module.load_json_resource) as loader:
+            first = mbql_module.load_mbql_schema()
+            second = mbql_module.load_mbql_schema()
+        
+        assert first is not None
+        assert first is second
+        loader.assert_called_once_with("schemas/mbql_schema.json")
+    finally:
+        mbql_module.load_mbql_schema.cache_clear()
@@ -0,0 +1,185 @@
+"""
+Tests for resource loading.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from talk_to_metabase import resources
+from talk_to_metabase.tools import dashboard_parameters, dashcards, mbql, visualization
+from talk_to_metabase.tools.card_parameters import core as card_parameters
+from talk_to_metabase.resources import (
+    load_card_parameters_docs,
+    load_card_parameters_schema,
+    load_dashboard_parameters_schema,
+    load_dashcards_schema,
+    load_visualization_docs,
+    load_visualization_schema,
+)
+
+
+def test_load_dashcards_schema_is_cached():
+    """Test that the dashcards schema is read from disk only once."""
+    load_dashcards_schema.cache_clear()
+    try:
+        with patch.object(resources, "load_json_resource", wraps=resources.load_json_resource) as loader:
+            first = load_dashcards_schema()
+            second = load_dashcards_schema()
+        
+        assert first is not None
+        assert first is second
+        loader.assert_called_once_with("schemas/dashcards.json")
+    finally:
+        load_dashcards_schema.cache_clear()
+
+
+def test_load_dashboard_parameters_schema_is_cached():
+    """Test that the dashboard parameters schema is read from disk only once."""
+    load_dashboard_parameters_schema.cache_clear()
+    try:
+        with patch.object(resources, "load_json_resource", wraps=resources.load_json_resource) as loader:
+            first = load_dashboard_parameters_schema()
+            second = load_dashboard_parameters_schema()
+        
+        assert first is not None
+        assert first is second
+        loader.assert_called_once_with("schemas/dashboard_parameters.json")
+    finally:
+        load_dashboard_parameters_schema.cache_clear()
+
+
+def test_load_card_parameters_resources_are_cached():
+    """Test that the card parameters schema and docs are read from disk only once."""
+    load_card_parameters_schema.cache_clear()
+    load_card_parameters_docs.cache_clear()
+    try:
+        with patch.object(resources, "load_json_resource", wraps=resources.load_json_resource) as json_loader, \
+                patch.object(resources, "load_text_resource", wraps=resources.load_text_resource) as text_loader:
+            schema = load_card_parameters_schema()
+            docs = load_card_parameters_docs()
+            
+            assert load_card_parameters_schema() is schema
+            assert load_card_parameters_docs() is docs
+        
+        assert schema is not None
+        assert docs is not None
+        json_loader.assert_called_once_with("schemas/card_parameters.json")
+        text_loader.assert_called_once_with("schemas/card_parameters_docs.md")
+    finally:
+        load_card_parameters_schema.cache_clear()
+        load_card_parameters_docs.cache_clear()
+
+
+def test_load_visualization_resources_are_cached_per_chart_type():
+    """Test that each chart type's schema and docs are read from disk only once."""
+    load_visualization_schema.cache_clear()
+    load_visualization_docs.cache_clear()
+    try:
+        with patch.object(resources, "load_json_resource", wraps=resources.load_json_resource) as json_loader, \
+                patch.object(resources, "load_text_resource", wraps=resources.load_text_resource) as text_loader:
+            for _ in range(2):
+                load_visualization_schema("bar")
+                load_visualization_schema("line")
+                load_visualization_docs("bar")
+        
+        assert load_visualization_schema("bar") is not load_visualization_schema("line")
+        assert [call.args for call in json_loader.call_args_list] == [
+            ("schemas/bar_visualization.json",),
+            ("schemas/line_visualization.json",),
+        ]
+        text_loader.assert_called_once_with("schemas/bar_visualization_docs.md")
+    finally:
+        load_visualization_schema.cache_clear()
+        load_visualization_docs.cache_clear()
+
+
+def test_failed_schema_load_is_not_cached():
+    """Test that a failed load is retried instead of returning a cached None."""
+    load_dashcards_schema.cache_clear()
+    try:
+        with patch.object(resources, "load_json_resource", side_effect=[None, {"type": "array"}]) as loader:
+            assert load_dashcards_schema() is None
+            assert load_dashcards_schema() == {"type": "array"}
+            assert load_dashcards_schema() == {"type": "array"}
+        
+        assert loader.call_count == 2
+    finally:
+        load_dashcards_schema.cache_clear()
+
+
+def test_failed_visualization_docs_load_is_not_cached():
+    """Test that per-chart-type loaders only cache successful loads."""
+    load_visualization_docs.cache_clear()
+    try:
+        with patch.object(resources, "load_text_resource", side_effect=[None, "# Bar"]) as loader:
+            assert load_visualization_docs("bar") is None
+            assert load_visualization_docs("bar") == "# Bar"
+            assert load_visualization_docs("bar") == "# Bar"
+        
+        assert loader.call_count == 2
+    finally:
+        load_visualization_docs.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "module, loader_name, args",
+    [
+        (dashcards, "load_dashcards_schema", ()),
+        (dashboard_parameters, "load_dashboard_parameters_schema", ()),
+        (card_parameters, "load_card_parameters_schema", ()),
+        (mbql, "load_mbql_schema", ()),
+        (visualization, "load_schema", ("line",)),
+    ],
+)
+def test_validator_recovers_after_failed_schema_load(module, loader_name, args):
+    """Test that a validator built from a failed schema load is retried, not cached."""
+    module._get_validator.cache_clear()
+    try:
+        with patch.object(module, loader_name, return_value=None):
+            assert module._get_validator(*args) is None
+        
+        assert module._get_validator(*args) is not None
+    finally:
+        module._get_validator.cache_clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "module, tool_name, tool_kwargs, builder_name, loader_name, expected",
+    [
+        (dashcards, "get_dashcards_schema", {}, "_build_dashcards_schema_response",
+         "load_dashcards_schema", ("success", True)),
+        (dashboard_parameters, "get_dashboard_parameters_documentation", {}, "_build_documentation_response",
+         "load_dashboard_parameters_schema", ("title", "Metabase Dashboard Parameters")),
+        (card_parameters, "get_card_parameters_documentation", {}, "_build_documentation_response",
+         "load_card_parameters_schema", ("success", True)),
+        (mbql, "get_mbql_schema", {}, "_build_schema_response",
+         "load_mbql_schema", ("$schema", "http://json-schema.org/draft-07/schema#")),
+        (visualization, "get_visualization_document", {"chart_type": "number"}, "_build_documentation_response",
+         "load_schema", ("api_name", "scalar")),
+    ],
+)
+async def test_schema_response_serialized_once_after_failed_load(
+    mock_context, module, tool_name, tool_kwargs, builder_name, loader_name, expected
+):
+    """Test that schema tool responses recover from a failed load and are then serialized once."""
+    tool = getattr(module, tool_name)
+    builder = getattr(module, builder_name)
+    builder.cache_clear()
+    try:
+        with patch.object(module, loader_name, return_value=None):
+            failed = json.loads(await tool(ctx=mock_context, **tool_kwargs))
+        
+        with patch.object(module, "json_dumps", wraps=module.json_dumps) as dumps:
+            first = await tool(ctx=mock_context, **tool_kwargs)
+            second = await tool(ctx=mock_context, **tool_kwargs)
+        
+        assert "error" in failed
+        assert first is second
+        dumps.assert_called_once()
+        key, value = expected
+        assert json.loads(first)[key] == value
+    finally:
+        builder.cache_clear()
@@ -78,6 +78,22 @@ async def test_search_resources_basic_success(mock_context, sample_search_result
         assert client_mock.search.call_args[1]["query"] == "test"
 
 
+@pytest.mark.asyncio
+async def test_search_resources_size_check_measures_compact_json(mock_context, sample_search_results):
+    """Test that the response size check runs on the compact JSON that is returned."""
+    client_mock = MagicMock()
+    client_mock.search = AsyncMock(return_value={"results": sample_search_results, "pagination": {"page": 1, "page_size": 20, "total_count": 2, "total_pages": 1, "has_more": False}})
+    
+    with patch("talk_to_metabase.tools.search.get_metabase_client", return_value=client_mock), \
+            patch("talk_to_metabase.tools.search.check_response_size", side_effect=lambda response, config: response) as size_check:
+        result = await search_resources(ctx=mock_context, q="test")
+    
+    checked = size_check.call_args.args[0]
+    assert checked == result
+    assert "\n" not in checked
+    assert checked == json.dumps(json.loads(result), separators=(",", ":"), ensure_ascii=False)
+
+
 @pytest.mark.asyncio
 async def test_search_resources_advanced_filters(mock_context, sample_search_results):
     """Test search with advanced filters."""
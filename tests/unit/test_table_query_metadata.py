@@ -639,3 +639,30 @@ async def test_get_table_query_metadata_empty_fields(mock_context):
         
         # Check that we got the expected output for empty fields
         assert result_data == expected_output
+
+
+@pytest.mark.asyncio
+async def test_get_table_query_metadata_rejects_oversized_field_list(mock_context):
+    """Test that a field list too large for the size limit is rejected without serializing it."""
+    mock_context.request_context.lifespan_context.auth.config.response_size_limit = 1000
+    table_data = {
+        "id": 1,
+        "name": "wide_table",
+        "db": {"id": 195},
+        "fields": [{"id": i, "name": f"field_{i}", "position": i} for i in range(50)]
+    }
+    
+    client_mock = MagicMock()
+    client_mock.auth.make_request = AsyncMock(return_value=(table_data, 200, None))
+    
+    with patch("talk_to_metabase.tools.database.get_metabase_client", return_value=client_mock), \
+         patch("talk_to_metabase.tools.database.json_dumps") as mock_json_dumps:
+        result = await get_table_query_metadata(id=1, ctx=mock_context)
+    
+    mock_json_dumps.assert_not_called()
+    result_data = json.loads(result)
+    assert result_data["success"] is False
+    assert result_data["error"]["error_type"] == "response_size_exceeded"
+    assert "at least" in result_data["error"]["message"]
+    assert result_data["error"]["size_info"]["estimated"] is True
+    assert result_data["error"]["size_info"]["size_limit"] == 1000
@@ -0,0 +1,81 @@
+"""
+Tests for visualization settings validation and documentation.
+"""
+
+from unittest.mock import patch
+
+from talk_to_metabase.tools import visualization as visualization_module
+from talk_to_metabase.tools.visualization import validate_visualization_settings
+
+
+def test_validate_visualization_settings_valid():
+    """Test that well-formed settings pass validation."""
+    is_valid, errors = validate_visualization_settings("table", {})
+    
+    assert is_valid is True
+    assert errors == []
+
+
+def test_validate_visualization_settings_uses_compiled_validator():
+    """Test that valid settings are accepted by the compiled validator alone."""
+    with patch.object(visualization_module, "_collect_schema_errors") as collect:
+        is_valid, errors = validate_visualization_settings(
+            "line", {"graph.dimensions": ["month"], "graph.metrics": ["count"]}
+        )
+    
+    assert is_valid is True
+    assert errors == []
+    assert visualization_module._get_compiled_validator("line") is not None
+    collect.assert_not_called()
+
+
+def test_validate_visualization_settings_reports_all_schema_errors():
+    """Test that every schema violation is reported with its location."""
+    is_valid, errors = validate_visualization_settings(
+        "bar", {"graph.dimensions": 5, "graph.metrics": ["count"], "stackable.stack_type": "sideways"}
+    )
+    
+    assert is_valid is False
+    assert "Validation error at graph.dimensions: 5 is not of type 'array'" in errors
+    assert any(error.startswith("Validation error at stackable.stack_type:") for error in errors)
+
+
+def test_validate_visualization_settings_unsupported_chart_type():
+    """Test that unsupported chart types are rejected before any schema is loaded."""
+    with patch.object(visualization_module, "load_schema") as load:
+        is_valid, errors = validate_visualization_settings("hologram", {})
+    
+    assert is_valid is False
+    assert errors[0].startswith("Unsupported chart type: hologram.")
+    load.assert_not_called()
+
+
+def test_validate_visualization_settings_reuses_validator():
+    """Test that UI and API names share validators, each built from a single schema load."""
+    visualization_module._get_validator.cache_clear()
+    visualization_module._compile_validator.cache_clear()
+    try:
+        with patch.object(visualization_module, "load_schema", wraps=visualization_module.load_schema) as load:
+            validate_visualization_settings("number", {"scalar.field": "total"})
+            validate_visualization_settings("scalar", {"scalar.field": "total"})
+            validate_visualization_settings("number", {})
+            validate_visualization_settings("scalar", {})
+        
+        # Once for the compiled validator and, after the first rejection,
+        # once for the jsonschema validator that reports the errors
+        assert [call.args for call in load.call_args_list] == [("scalar",), ("scalar",)]
+    finally:
+        visualization_module._get_validator.cache_clear()
+        visualization_module._compile_validator.cache_clear()
+
+
+def test_compiled_validator_retries_failed_schema_load():
+    """Test that a failed schema load does not disable the compiled validator."""
+    visualization_module._compile_validator.cache_clear()
+    try:
+        with patch.object(visualization_module, "load_schema", return_value=None):
+            assert visualization_module._get_compiled_validator("line") is None
+        
+        assert visualization_module._get_compiled_validator("line") is not None
+    finally:
+        visualization_module._compile_validator.cache_clear()